@@ -1,6 +1,14 @@
 """Exposes all the inner constants for a folder level import."""
 
+from .extraction_config import (
+    FBREF_MATCH_COLUMNS,
+    FBREF_MATCHLOG_COLUMNS,
+    FBREF_STAT_DTYPES,
+)
 from .folder_config import (
+    ANALYTICS_DB_PATH,
+    DATA_FOLDER_ARCHIVE,
+    DATA_FOLDER_CACHE,
     DATA_FOLDER_FBREF,
     DATA_FOLDER_FPL,
     DATA_FOLDER_REF,
@@ -17,6 +25,8 @@ from .image_config import (
     TRANSFER_POINTER_IMAGE_SIZE,
 )
 from .mapping_config import (
+    FBREF_CALENDAR_YEAR_LEAGUES,
+    FBREF_LEAGUE_COMP_DICT,
     FBREF_LEAGUE_OPTA_STRENGTH_DICT,
     FBREF_POSITION_MAPPING,
 )
@@ -28,6 +38,7 @@ from .modeling_config import (
     TASK,
     TIME_TRAINING_PLAYER,
     TIME_TRAINING_TEAM,
+    TRAIN_TEST_BUNDLE_VERSION,
 )
 from .prediction_config import (
     BENCH_WEIGHTS_ARRAY,
@@ -57,31 +68,75 @@ from .prediction_config import (
     WEIGHTS_DECAYS_BASE,
 )
 from .web_config import (
+    ARCHIVE_URL_PATTERN,
+    ASSET_MAX_WORKERS,
+    CACHE_TTL_DEFAULT,
+    CACHE_TTL_RULES,
     FBREF_BASE_URL,
+    FETCH_MAX_ATTEMPTS,
+    FETCH_MAX_CONCURRENCY,
+    FETCH_RETRY_DELAY,
     FPL_BADGES_URL,
     FPL_BOOTSTRAP_URL,
+    FPL_EVENT_URL,
     FPL_FIXTURES_URL,
     FPL_PHOTOS_URL,
+    FPL_RETRY_BACKOFF,
     FPL_SHIRTS_URL,
     FPL_TEAM_URL,
+    FPL_TIMEOUT,
+    HOST_MAX_CONCURRENCY,
+    HOST_RATE_LIMITS,
+    HTML_STREAM_CHUNK_SIZE,
+    HTTP_POOL_SIZE,
+    PARSE_MAX_WORKERS,
+    PIPELINE_QUEUE_SIZE,
+    RATE_BACKOFF_FACTOR,
+    RATE_MAX_INTERVAL,
+    RATE_SPEEDUP_AFTER,
+    RATE_SPEEDUP_STEP,
+    WRITER_BATCH_SIZE,
+    WRITER_QUEUE_SIZE,
 )
 
 
 __all__ = [
+    "ANALYTICS_DB_PATH",
+    "ARCHIVE_URL_PATTERN",
+    "ASSET_MAX_WORKERS",
     "BENCH_WEIGHTS_ARRAY",
+    "CACHE_TTL_DEFAULT",
+    "CACHE_TTL_RULES",
+    "DATA_FOLDER_ARCHIVE",
+    "DATA_FOLDER_CACHE",
     "DATA_FOLDER_FBREF",
     "DATA_FOLDER_FPL",
     "DATA_FOLDER_REF",
     "FBREF_BASE_URL",
+    "FBREF_CALENDAR_YEAR_LEAGUES",
+    "FBREF_LEAGUE_COMP_DICT",
     "FBREF_LEAGUE_OPTA_STRENGTH_DICT",
+    "FBREF_MATCHLOG_COLUMNS",
+    "FBREF_MATCH_COLUMNS",
     "FBREF_POSITION_MAPPING",
+    "FBREF_STAT_DTYPES",
+    "FETCH_MAX_ATTEMPTS",
+    "FETCH_MAX_CONCURRENCY",
+    "FETCH_RETRY_DELAY",
     "FPL_BADGES_URL",
     "FPL_BOOTSTRAP_URL",
+    "FPL_EVENT_URL",
     "FPL_FIXTURES_URL",
     "FPL_PHOTOS_URL",
     "FPL_POSITION_ID_DICT",
+    "FPL_RETRY_BACKOFF",
     "FPL_SHIRTS_URL",
     "FPL_TEAM_URL",
+    "FPL_TIMEOUT",
+    "HOST_MAX_CONCURRENCY",
+    "HOST_RATE_LIMITS",
+    "HTML_STREAM_CHUNK_SIZE",
+    "HTTP_POOL_SIZE",
     "KIT_IMAGE_HEIGHT",
     "KIT_IMAGE_WIDTH",
     "MAX_DEF_COUNT",
@@ -97,12 +152,18 @@ __all__ = [
     "MIN_MID_COUNT",
     "MODELS",
     "MODEL_FOLDER",
+    "PARSE_MAX_WORKERS",
+    "PIPELINE_QUEUE_SIZE",
     "PITCH_IMAGE_HEIGHT",
     "PITCH_IMAGE_WIDTH",
     "POINTS_CS",
     "POINTS_GOALS",
     "POINTS_GOALS_CONCEDED",
     "POINTS_SAVES",
+    "RATE_BACKOFF_FACTOR",
+    "RATE_MAX_INTERVAL",
+    "RATE_SPEEDUP_AFTER",
+    "RATE_SPEEDUP_STEP",
     "RESOURCE_FOLDER",
     "SEED",
     "SPLITS_CV",
@@ -115,10 +176,13 @@ __all__ = [
     "TOTAL_GKP_COUNT",
     "TOTAL_LINEUP_COUNT",
     "TOTAL_MID_COUNT",
+    "TRAIN_TEST_BUNDLE_VERSION",
     "TRANSFER_BOX_HEIGHT",
     "TRANSFER_BOX_WIDTH",
     "TRANSFER_GAIN_MINIMUM",
     "TRANSFER_HIT_PENALTY_PERCENTILE",
     "TRANSFER_POINTER_IMAGE_SIZE",
     "WEIGHTS_DECAYS_BASE",
+    "WRITER_BATCH_SIZE",
+    "WRITER_QUEUE_SIZE",
 ]
@@ -0,0 +1,201 @@
+"""Schemas for typing FBRef table columns at extraction time."""
+
+_INT_STATS: list[str] = [
+    "aerials_lost",
+    "aerials_won",
+    "assisted_shots",
+    "assists",
+    "attendance",
+    "ball_recoveries",
+    "blocked_passes",
+    "blocked_shots",
+    "blocks",
+    "cards_red",
+    "cards_yellow",
+    "cards_yellow_red",
+    "carries",
+    "challenge_tackles",
+    "challenges",
+    "challenges_lost",
+    "clearances",
+    "crosses",
+    "crosses_into_penalty_area",
+    "errors",
+    "fouled",
+    "fouls",
+    "games",
+    "games_complete",
+    "games_starts",
+    "games_subs",
+    "gca",
+    "gk_clean_sheets",
+    "gk_games",
+    "gk_games_starts",
+    "gk_goals_against",
+    "gk_pens_allowed",
+    "gk_pens_att",
+    "gk_pens_missed",
+    "gk_pens_saved",
+    "gk_saves",
+    "gk_shots_on_target_against",
+    "goals",
+    "goals_against",
+    "goals_for",
+    "interceptions",
+    "minutes",
+    "minutes_per_game",
+    "minutes_per_start",
+    "minutes_per_sub",
+    "offsides",
+    "own_goals",
+    "passes",
+    "passes_completed",
+    "passes_completed_long",
+    "passes_completed_medium",
+    "passes_completed_short",
+    "passes_into_final_third",
+    "passes_into_penalty_area",
+    "passes_long",
+    "passes_medium",
+    "passes_progressive_distance",
+    "passes_short",
+    "passes_total_distance",
+    "pens_att",
+    "pens_conceded",
+    "pens_made",
+    "pens_won",
+    "possession",
+    "progressive_carries",
+    "progressive_passes",
+    "progressive_passes_received",
+    "sca",
+    "shirtnumber",
+    "shots",
+    "shots_on_target",
+    "tackles",
+    "tackles_att_3rd",
+    "tackles_def_3rd",
+    "tackles_interceptions",
+    "tackles_mid_3rd",
+    "tackles_won",
+    "take_ons",
+    "take_ons_won",
+    "touches",
+]
+
+_FLOAT_STATS: list[str] = [
+    "aerials_won_pct",
+    "average_shot_distance",
+    "challenge_tackles_pct",
+    "gk_psxg",
+    "gk_psxg_net",
+    "gk_save_pct",
+    "minutes_90s",
+    "npxg",
+    "npxg_per_shot",
+    "pass_xa",
+    "passes_pct",
+    "passes_pct_long",
+    "passes_pct_medium",
+    "passes_pct_short",
+    "xg",
+    "xg_against",
+    "xg_assist",
+    "xg_for",
+]
+
+_CATEGORY_STATS: list[str] = [
+    "comp",
+    "dayofweek",
+    "foot",
+    "nationality",
+    "result",
+    "round",
+    "venue",
+]
+
+FBREF_STAT_DTYPES: dict[str, str] = {
+    **dict.fromkeys(_INT_STATS, "int"),
+    **dict.fromkeys(_FLOAT_STATS, "float"),
+    **dict.fromkeys(_CATEGORY_STATS, "category"),
+    "date": "date",
+}
+"""
+Dictionary containing FBRef `data-stat` to column type mapping.
+Columns not listed here are kept as strings.
+"""
+
+FBREF_MATCH_COLUMNS: list[str] = [
+    "player",
+    "position",
+    "minutes",
+    "header_performance_shots_on_target",
+    "header_performance_cards_yellow",
+    "header_performance_cards_red",
+    "header_performance_pens_att",
+    "header_performance_pens_made",
+    "header_expected_npxg",
+    "header_expected_xg_assist",
+    "header_sca_sca",
+    "header_sca_gca",
+    "header_carries_progressive_carries",
+    "assisted_shots",
+    "pass_xa",
+    "progressive_passes",
+    "header_tackles_tackles_won",
+    "header_blocks_blocks",
+    "interceptions",
+    "clearances",
+    "header_passes_total_passes_completed",
+    "passes_into_final_third",
+    "header_performance_fouls",
+    "header_performance_fouled",
+    "header_performance_pens_conceded",
+    "header_performance_ball_recoveries",
+    "header_aerials_aerials_won",
+    "header_aerials_aerials_lost",
+    "header_gk_shot_stopping_gk_saves",
+    "header_gk_shot_stopping_gk_psxg",
+]
+"""
+List of FBRef match table columns used by the player matchlogs and the
+team matchlogs derived from them.
+"""
+
+FBREF_MATCHLOG_COLUMNS: list[str] = [
+    "date",
+    "opponent",
+    "venue",
+    "result",
+    "possession",
+    "header_for_against_date",
+    "header_standard_shots",
+    "header_standard_shots_on_target",
+    "header_standard_average_shot_distance",
+    "header_standard_pens_att",
+    "header_standard_pens_made",
+    "header_expected_npxg",
+    "header_passes_total_passes_completed",
+    "assisted_shots",
+    "pass_xa",
+    "progressive_passes",
+    "passes_into_final_third",
+    "header_sca_types_sca",
+    "header_gca_types_gca",
+    "header_tackles_tackles_won",
+    "header_blocks_blocks",
+    "interceptions",
+    "clearances",
+    "header_carries_progressive_carries",
+    "header_performance_ball_recoveries",
+    "header_aerials_aerials_won_pct",
+    "header_performance_cards_yellow",
+    "header_performance_cards_red",
+    "header_performance_fouls",
+    "header_performance_fouled",
+    "header_performance_pens_conceded",
+    "header_performance_gk_saves",
+]
+"""
+List of FBRef team matchlog columns used by the team matchlogs.
+"""
@@ -7,5 +7,8 @@ ROOT_FOLDER: Path = Path(__file__).parents[4].absolute()
 DATA_FOLDER_FPL: Path = ROOT_FOLDER / "data" / "fpl"
 DATA_FOLDER_FBREF: Path = ROOT_FOLDER / "data" / "fbref"
 DATA_FOLDER_REF: Path = ROOT_FOLDER / "data" / "references"
+DATA_FOLDER_CACHE: Path = ROOT_FOLDER / "data" / "cache"
+DATA_FOLDER_ARCHIVE: Path = ROOT_FOLDER / "data" / "archive"
 MODEL_FOLDER: Path = ROOT_FOLDER / "models"
 RESOURCE_FOLDER: Path = ROOT_FOLDER / "res"
+ANALYTICS_DB_PATH: Path = ROOT_FOLDER / "data" / "analytics.duckdb"
@@ -58,3 +58,51 @@ FBREF_POSITION_MAPPING: dict[str, str] = {
 """
 Dictionary containing FBRef position to short_position mapping.
 """
+
+FBREF_LEAGUE_COMP_DICT: dict[str, str] = {
+    "eng ENG_1. Premier League": "9",
+    "es ESP_1. La Liga": "12",
+    "ch SUI_1. Super Lg": "57",
+    "it ITA_1. Serie A": "11",
+    "au AUS_1. A-League": "65",
+    "eng ENG_2. Championship": "10",
+    "de GER_1. Bundesliga": "20",
+    "eng ENG_4. League Two": "16",
+    "rs SRB_1. SuperLiga": "54",
+    "eng ENG_3. League One": "15",
+    "fr FRA_1. Ligue 1": "13",
+    "tr TUR_1. Süper Lig": "26",
+    "be BEL_1. Pro League A": "37",
+    "se SWE_1. Allsvenskan": "29",
+    "ar ARG_1. Liga Argentina": "21",
+    "dk DEN_1. Danish Superliga": "50",
+    "nl NED_1. Eredivisie": "23",
+    "ro ROU_1. Liga I": "47",
+    "sct SCO_1. Premiership": "40",
+    "br BRA_1. Série A": "24",
+    "us USA_1. MLS": "22",
+    "pt POR_1. Primeira Liga": "32",
+    "de GER_2. 2. Bundesliga": "33",
+    "gr GRE_1. Super League": "27",
+    "kr KOR_1. K League": "55",
+    "nl NED_2. Eerste Divisie": "51",
+    "at AUT_1. Bundesliga": "56",
+    "py PAR_1. Primera Div": "61",
+    "pl POL_1. Ekstraklasa": "36",
+    "sct SCO_2. Championship": "72",
+}
+"""
+Dictionary containing the FBRef competition ID of each league.
+"""
+
+FBREF_CALENDAR_YEAR_LEAGUES: set[str] = {
+    "se SWE_1. Allsvenskan",
+    "ar ARG_1. Liga Argentina",
+    "br BRA_1. Série A",
+    "us USA_1. MLS",
+    "kr KOR_1. K League",
+    "py PAR_1. Primera Div",
+}
+"""
+Set containing the leagues whose seasons follow the calendar year.
+"""
@@ -7,3 +7,4 @@ SEED: int = 43
 SPLITS_CV: int = 5
 TIME_TRAINING_TEAM: int = 900
 TIME_TRAINING_PLAYER: int = 600
+TRAIN_TEST_BUNDLE_VERSION: int = 1
@@ -14,4 +14,120 @@ FPL_BADGES_URL: str = (
     "https://resources.premierleague.com/premierleague/badges/100"
 )
 FPL_TEAM_URL: str = "https://fantasy.premierleague.com/api/entry"
+FPL_EVENT_URL: str = "https://fantasy.premierleague.com/api/event"
 FBREF_BASE_URL: str = "https://fbref.com/en"
+
+HTTP_POOL_SIZE: int = 16
+"""
+Maximum number of keep-alive connections kept open per host.
+"""
+
+HTML_STREAM_CHUNK_SIZE: int = 65536
+"""
+Number of characters fed at a time to the streaming HTML parser.
+"""
+
+FETCH_MAX_CONCURRENCY: int = 8
+"""
+Maximum number of requests in flight at once across all hosts.
+"""
+
+HOST_MAX_CONCURRENCY: dict[str, int] = {"fbref.com": 1}
+"""
+Maximum number of requests in flight at once to a single host.
+"""
+
+HOST_RATE_LIMITS: dict[str, float] = {"fbref.com": 8.0}
+"""
+Minimum number of seconds between two requests to the same host.
+FBRef blocks clients making more than about 10 requests a minute.
+Hosts not listed here are not throttled. The interval grows when the
+host answers with 429 or 503 and shrinks back after sustained success.
+"""
+
+RATE_BACKOFF_FACTOR: float = 2.0
+"""
+Factor applied to the request interval of a host that throttles us.
+"""
+
+RATE_MAX_INTERVAL: float = 120.0
+"""
+Maximum number of seconds between two requests to the same host.
+"""
+
+RATE_SPEEDUP_AFTER: int = 20
+"""
+Number of successful requests in a row before speeding up again.
+"""
+
+RATE_SPEEDUP_STEP: float = 2.0
+"""
+Seconds taken off the request interval after sustained success.
+"""
+
+PARSE_MAX_WORKERS: int | None = None
+"""
+Number of parser processes of the fetch pipeline, the CPU count if None.
+"""
+
+PIPELINE_QUEUE_SIZE: int = 16
+"""
+Maximum number of pages or parsed results waiting between two stages
+of the fetch pipeline.
+"""
+
+WRITER_QUEUE_SIZE: int = 64
+"""
+Maximum number of files waiting to be written by a background writer.
+"""
+
+WRITER_BATCH_SIZE: int = 32
+"""
+Maximum number of queued files a background writer handles at once.
+"""
+
+FETCH_MAX_ATTEMPTS: int = 4
+"""
+Maximum number of attempts for a URL before giving up on it.
+"""
+
+FETCH_RETRY_DELAY: float = 5.0
+"""
+Seconds to wait before requeueing a failed URL, times the attempt.
+"""
+
+CACHE_TTL_RULES: dict[str, int] = {
+    r"^https://fbref\.com/en/matches/": 7 * 24 * 3600,
+    r"^https://fbref\.com/en/": 24 * 3600,
+    r"^https://fantasy\.premierleague\.com/api/": 3600,
+}
+"""
+Seconds a cached response is served without contacting the server,
+keyed by URL regex. The first matching pattern wins. Stale responses
+are revalidated with ETag/Last-Modified before being downloaded again.
+"""
+
+CACHE_TTL_DEFAULT: int = 0
+"""
+Cache TTL in seconds for URLs not matching any of the cache rules.
+"""
+
+ARCHIVE_URL_PATTERN: str = r"^https://fbref\.com/"
+"""
+URL regex of the fetched pages kept in the compressed page archive.
+"""
+
+ASSET_MAX_WORKERS: int = 16
+"""
+Maximum number of image downloads in flight during an asset sync.
+"""
+
+FPL_TIMEOUT: int = 10
+"""
+Timeout in seconds of the FPL API requests.
+"""
+
+FPL_RETRY_BACKOFF: float = 1.0
+"""
+Backoff factor in seconds between two retries of an FPL API request.
+"""
@@ -1,5 +1,17 @@
 """Exposes all the inner constants for a folder level import."""
 
+from .fpl_api import (
+    FPLBootstrap,
+    FPLElement,
+    FPLEvent,
+    FPLFixture,
+    FPLLive,
+    FPLLiveElement,
+    FPLPick,
+    FPLPicks,
+    FPLTeam,
+    FPLTransfer,
+)
 from .player import Player
 from .player_gameweek import PlayerGameWeek
 from .season import Season, Seasons
@@ -8,6 +20,16 @@ from .team_gameweek import TeamGameweek
 
 
 __all__ = [
+    "FPLBootstrap",
+    "FPLElement",
+    "FPLEvent",
+    "FPLFixture",
+    "FPLLive",
+    "FPLLiveElement",
+    "FPLPick",
+    "FPLPicks",
+    "FPLTeam",
+    "FPLTransfer",
     "Player",
     "PlayerGameWeek",
     "Season",
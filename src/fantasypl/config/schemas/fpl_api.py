@@ -0,0 +1,213 @@
+"""Contains the FPL API response classes."""
+
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict
+
+
+class FPLResponse(BaseModel):
+    """
+    Superclass of the FPL API responses.
+
+    Fields that are not declared are kept as they are, so a response
+    dumps back to the same JSON it was read from.
+
+    """
+
+    model_config = ConfigDict(extra="allow")
+
+
+class FPLEvent(FPLResponse):
+    """
+    The FPLEvent class.
+
+    Attributes
+    ----------
+        id: The gameweek number.
+        deadline_time: The gameweek deadline in ISO format.
+        finished: True if all the gameweek matches are settled.
+        data_checked: True once the gameweek points are final.
+        is_current: True if the gameweek is the current one.
+        is_next: True if the gameweek is the next one.
+
+    """
+
+    id: int
+    deadline_time: str
+    finished: bool
+    data_checked: bool
+    is_current: bool
+    is_next: bool
+
+
+class FPLTeam(FPLResponse):
+    """
+    The FPLTeam class.
+
+    Attributes
+    ----------
+        id: The team ID for the season.
+        code: The team code across seasons.
+        name: The team name.
+        short_name: The team short name.
+
+    """
+
+    id: int
+    code: int
+    name: str
+    short_name: str
+
+
+class FPLElement(FPLResponse):
+    """
+    The FPLElement class.
+
+    Attributes
+    ----------
+        id: The player ID for the season.
+        code: The player code across seasons.
+        first_name: The player first name.
+        second_name: The player second name.
+        web_name: The player display name.
+        team: The team ID for the season.
+        team_code: The team code across seasons.
+        element_type: The position ID.
+        now_cost: The current price in tenths.
+
+    """
+
+    id: int
+    code: int
+    first_name: str
+    second_name: str
+    web_name: str
+    team: int
+    team_code: int
+    element_type: int
+    now_cost: int
+
+
+class FPLBootstrap(FPLResponse):
+    """
+    The FPLBootstrap class.
+
+    Attributes
+    ----------
+        events: The gameweeks of the season.
+        teams: The teams of the season.
+        elements: The players of the season.
+
+    """
+
+    events: list[FPLEvent]
+    teams: list[FPLTeam]
+    elements: list[FPLElement]
+
+
+class FPLFixture(FPLResponse):
+    """
+    The FPLFixture class.
+
+    Attributes
+    ----------
+        id: The fixture ID for the season.
+        code: The fixture code.
+        event: The gameweek number, None if not scheduled yet.
+        team_h: The home team ID.
+        team_a: The away team ID.
+        finished: True if the match is settled.
+
+    """
+
+    id: int
+    code: int
+    event: int | None
+    team_h: int
+    team_a: int
+    finished: bool
+
+
+class FPLPick(FPLResponse):
+    """
+    The FPLPick class.
+
+    Attributes
+    ----------
+        element: The player ID.
+        position: The squad slot, 12 to 15 for the bench.
+        multiplier: The points multiplier.
+        is_captain: True for the captain.
+        is_vice_captain: True for the vice captain.
+
+    """
+
+    element: int
+    position: int
+    multiplier: int
+    is_captain: bool
+    is_vice_captain: bool
+
+
+class FPLPicks(FPLResponse):
+    """
+    The FPLPicks class.
+
+    Attributes
+    ----------
+        picks: The squad picks of the gameweek.
+
+    """
+
+    picks: list[FPLPick]
+
+
+class FPLTransfer(FPLResponse):
+    """
+    The FPLTransfer class.
+
+    Attributes
+    ----------
+        element_in: The ID of the player bought.
+        element_in_cost: The price paid in tenths.
+        element_out: The ID of the player sold.
+        element_out_cost: The price received in tenths.
+        event: The gameweek the transfer applies to.
+        time: The transfer time in ISO format.
+
+    """
+
+    element_in: int
+    element_in_cost: int
+    element_out: int
+    element_out_cost: int
+    event: int
+    time: str
+
+
+class FPLLiveElement(FPLResponse):
+    """
+    The FPLLiveElement class.
+
+    Attributes
+    ----------
+        id: The player ID for the season.
+        stats: The gameweek stats and points of the player.
+
+    """
+
+    id: int
+    stats: dict[str, Any]
+
+
+class FPLLive(FPLResponse):
+    """
+    The FPLLive class.
+
+    Attributes
+    ----------
+        elements: The gameweek stats of every player.
+
+    """
+
+    elements: list[FPLLiveElement]
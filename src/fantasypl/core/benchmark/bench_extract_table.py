@@ -0,0 +1,145 @@
+"""Benchmark the table extractor against the per-cell cssselect one."""
+
+import operator
+import time
+from functools import reduce
+
+import pandas as pd
+from loguru import logger
+from lxml import html
+
+from fantasypl.utils import extract_tables
+from fantasypl.utils.cache_helper import (
+    CachedResponse,
+    iter_cached_responses,
+    read_cached_content,
+)
+
+
+def extract_table_cssselect(
+    tree: html.HtmlElement,
+    table_id: str,
+    *,
+    href: bool = False,
+) -> pd.DataFrame:
+    """
+    Extract the table with the previous per-cell cssselect logic.
+
+    Parameters
+    ----------
+    tree
+        The parsed web page.
+    table_id
+        The table ID to fetch.
+    href
+        Boolean value for whether href links are required.
+
+    Returns
+    -------
+        A pandas dataframe containing the table data.
+
+    """
+    try:
+        table: html.HtmlElement = tree.cssselect(f"table#{table_id}")[0]
+    except IndexError:
+        return pd.DataFrame()
+    headers_multi_index: list[list[str]] = [
+        reduce(
+            operator.add,
+            [
+                [cell.get("data-stat")] * int(cell.get("colspan", 1))
+                for cell in row.cssselect("th")
+            ],
+        )
+        for row in table.cssselect("thead>tr")
+    ]
+    headers: list[str] = [
+        "_".join(filter(None, items))
+        for items in zip(*headers_multi_index, strict=False)
+    ]
+    if href:
+        return pd.DataFrame(
+            [
+                [
+                    (cell.text_content(), cell.cssselect("a")[0].get("href"))
+                    if cell.cssselect("a")
+                    else (cell.text_content(), "")
+                    for cell in row.cssselect("td, th")
+                ]
+                for row in table.cssselect("tbody>tr")
+                if len(row.cssselect("td"))
+            ],
+            columns=headers,
+        )
+    return pd.DataFrame(
+        [
+            [cell.text_content() for cell in row.cssselect("td, th")]
+            for row in table.cssselect("tbody>tr")
+            if len(row.cssselect("td"))
+        ],
+        columns=headers,
+    )
+
+
+def run_benchmark(
+    pattern: str = r"^https://fbref\.com/", repeat: int = 3
+) -> None:
+    """
+    Time both extractors on cached FBRef pages and check they agree.
+
+    Parameters
+    ----------
+    pattern
+        The URL regex of the cached pages to benchmark on.
+    repeat
+        Number of timed runs per page and extractor.
+
+    Raises
+    ------
+    AssertionError
+        If the extractors return different dataframes.
+
+    """
+    time_old: float = 0.0
+    time_new: float = 0.0
+    n_tables: int = 0
+    entry: CachedResponse
+    for entry in iter_cached_responses(pattern):
+        tree: html.HtmlElement = html.fromstring(
+            read_cached_content(entry).decode("utf-8")
+        )
+        table_ids: list[str] = [
+            str(el.get("id")) for el in tree.iter("table") if el.get("id")
+        ]
+        for href in [False, True]:
+            start: float = time.perf_counter()
+            for _ in range(repeat):
+                dfs_old: list[pd.DataFrame] = [
+                    extract_table_cssselect(tree, table_id, href=href)
+                    for table_id in table_ids
+                ]
+            time_old += time.perf_counter() - start
+            start = time.perf_counter()
+            for _ in range(repeat):
+                dfs_new: list[pd.DataFrame] = extract_tables(
+                    tree, table_ids, href=href
+                )
+            time_new += time.perf_counter() - start
+            for table_id, df_old, df_new in zip(
+                table_ids, dfs_old, dfs_new, strict=True
+            ):
+                if not df_old.equals(df_new):
+                    msg: str = f"Mismatch on {entry.url} table {table_id}"
+                    raise AssertionError(msg)
+        n_tables += len(table_ids)
+    logger.info(
+        "Tables: {} | cssselect: {:.3f}s | xpath: {:.3f}s | speedup: {:.1f}x",
+        n_tables,
+        time_old,
+        time_new,
+        time_old / time_new if time_new else float("nan"),
+    )
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,331 @@
+"""Functions for getting FBRef player stats from league-wide tables."""
+
+from functools import partial
+from typing import TYPE_CHECKING
+
+import pandas as pd
+import rich.progress
+from loguru import logger
+
+from fantasypl.config.constants import (
+    DATA_FOLDER_FBREF,
+    FBREF_BASE_URL,
+    FBREF_CALENDAR_YEAR_LEAGUES,
+    FBREF_LEAGUE_COMP_DICT,
+    FBREF_STAT_DTYPES,
+)
+from fantasypl.config.references import FBREF_FPL_PLAYER_REF_DICT
+from fantasypl.config.schemas import Season, Seasons
+from fantasypl.core.fetch.get_fbref_player_last_season import (
+    get_player_season_async,
+)
+from fantasypl.utils import (
+    FetchEngine,
+    extract_table,
+    iter_elements_by_id,
+    run_fetch_jobs,
+    run_pipeline,
+    save_json,
+    save_pandas,
+)
+
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+    from pathlib import Path
+
+    from lxml import html
+
+
+_stat_pages: dict[str, tuple[str, str]] = {
+    "standard": ("stats", "stats_standard"),
+    "playing_time": ("playingtime", "stats_playing_time"),
+    "shooting": ("shooting", "stats_shooting"),
+    "passing": ("passing", "stats_passing"),
+    "defense": ("defense", "stats_defense"),
+    "gca": ("gca", "stats_gca"),
+    "misc": ("misc", "stats_misc"),
+    "keeper": ("keepers", "stats_keeper"),
+    "keeper_adv": ("keepersadv", "stats_keeper_adv"),
+}
+
+
+def get_league_year(season: Season, league: str) -> str:
+    """
+    Get the FBRef season name of a league.
+
+    Parameters
+    ----------
+    season
+        The season under process.
+    league
+        The league key of `FBREF_LEAGUE_COMP_DICT`.
+
+    Returns
+    -------
+        The season name, or its first year for calendar year leagues.
+
+    """
+    if league in FBREF_CALENDAR_YEAR_LEAGUES:
+        return season.fbref_long_name.split("-")[0]
+    return season.fbref_long_name
+
+
+def get_league_stats_url(season: Season, league: str, stat: str) -> str:
+    """
+    Get the URL of a league player stats page.
+
+    Parameters
+    ----------
+    season
+        The season under process.
+    league
+        The league key of `FBREF_LEAGUE_COMP_DICT`.
+    stat
+        The player stat type.
+
+    Returns
+    -------
+        The league player stats page URL.
+
+    """
+    return (
+        f"{FBREF_BASE_URL}/comps/{FBREF_LEAGUE_COMP_DICT[league]}/"
+        f"{get_league_year(season, league)}/{_stat_pages[stat][0]}/"
+    )
+
+
+def parse_league_stats_page(
+    season: Season,
+    league: str,
+    stat: str,
+    content: str,
+) -> pd.DataFrame:
+    """
+    Parse the player stats table from a league player stats page.
+
+    FBRef ships the player table inside an HTML comment, so the comment
+    markers are dropped before streaming the page. The table is read
+    once with the links of its untyped columns, the player FBRef ID is
+    taken from the player link and the other links are dropped. The
+    season, country and league columns of the player pages are added so
+    that the rows can be saved in the same layout.
+
+    Parameters
+    ----------
+    season
+        The season under process.
+    league
+        The league key of `FBREF_LEAGUE_COMP_DICT`.
+    stat
+        The player stat type.
+    content
+        The contents of the league player stats page.
+
+    Returns
+    -------
+        A pandas dataframe with one row per player and team.
+
+    """
+    table_id: str = _stat_pages[stat][1]
+    df: pd.DataFrame = pd.DataFrame()
+    element: html.HtmlElement
+    for element in iter_elements_by_id(
+        content.replace("<!--", "").replace("-->", ""), [table_id]
+    ):
+        df = extract_table(
+            element, table_id, href=True, dtypes=FBREF_STAT_DTYPES
+        )
+    if df.empty:
+        logger.error(
+            "Data fetch error from FBRef: League = {} Season = {} Stat = {}",
+            league,
+            season.fbref_name,
+            stat,
+        )
+        return df
+
+    country: str
+    comp_level: str
+    country, comp_level = league.split("_", 1)
+    df["player_id"] = [
+        str(link).split("/")[3] if link else "" for _, link in df["player"]
+    ]
+    cols_links: list[str] = df.select_dtypes(include="object").columns.tolist()
+    df[cols_links] = df[cols_links].map(
+        lambda value: value[0] if isinstance(value, tuple) else value
+    )
+    return (
+        df
+        .loc[df["player_id"] != ""]
+        .drop(columns=["ranker"], errors="ignore")
+        .assign(
+            year_id=get_league_year(season, league),
+            country=country,
+            comp_level=comp_level,
+        )
+    )
+
+
+def save_league_player_season(
+    season: Season,
+    list_players: list[str],
+    frames: dict[str, list[pd.DataFrame]],
+) -> set[str]:
+    """
+    Split the league player stats into the player season files.
+
+    Parameters
+    ----------
+    season
+        The season under process.
+    list_players
+        The player FBRef IDs to save.
+    frames
+        The parsed league tables keyed by player stat type.
+
+    Returns
+    -------
+        The player FBRef IDs found in the league tables.
+
+    """
+    players: set[str] = set(list_players)
+    covered: set[str] = set()
+    stat: str
+    for stat in _stat_pages:
+        if not frames[stat]:
+            continue
+        df_stat: pd.DataFrame = pd.concat(frames[stat], ignore_index=True)
+        key: Hashable
+        df_player: pd.DataFrame
+        for key, df_player in df_stat.groupby("player_id"):
+            player_id: str = str(key)
+            if player_id not in players:
+                continue
+            fpath: Path = (
+                DATA_FOLDER_FBREF
+                / season.folder
+                / "player_season"
+                / f"{player_id}_{stat}.csv"
+            )
+            save_pandas(df_player.drop(columns=["player_id"]), fpath)
+            if stat != "standard":
+                continue
+            covered.add(player_id)
+            save_json(
+                {
+                    "name": str(df_player["player"].iloc[0]).strip(),
+                    "position": str(df_player["position"].iloc[0]).replace(
+                        ",", "-"
+                    ),
+                },
+                (
+                    DATA_FOLDER_FBREF
+                    / season.folder
+                    / "player_season"
+                    / f"{player_id}.json"
+                ),
+            )
+    return covered
+
+
+async def get_league_player_season_async(
+    season: Season,
+    engine: FetchEngine,
+    progress: rich.progress.Progress,
+    filter_players: list[str] | None = None,
+) -> None:
+    """
+    Get the seasonal FBRef player stats from the league tables.
+
+    One page per stat type and league replaces one page per player, and
+    only the players missing from every league table fall back to their
+    own player page. Player lists shorter than the number of league pages
+    are fetched from the player pages directly.
+
+    Parameters
+    ----------
+    season
+        The season under process.
+    engine
+        The shared fetch engine.
+    progress
+        The shared progress bars.
+    filter_players
+        The optional list of player FBRef IDs.
+
+    """
+    list_players: list[str] = [*FBREF_FPL_PLAYER_REF_DICT]
+    if filter_players is not None:
+        list_players = filter_players.copy()
+    n_pages: int = len(FBREF_LEAGUE_COMP_DICT) * len(_stat_pages)
+    if len(list_players) < n_pages:
+        await get_player_season_async(
+            season, engine, progress, filter_players=list_players
+        )
+        return
+    frames: dict[str, list[pd.DataFrame]] = {stat: [] for stat in _stat_pages}
+    task_id: rich.progress.TaskID = progress.add_task(
+        "[cyan]Getting league player stats from FBRef: ",
+        total=n_pages,
+    )
+
+    def _save(stat: str, df: pd.DataFrame) -> None:
+        if not df.empty:
+            frames[stat].append(df)
+        progress.update(task_id=task_id, advance=1)
+
+    await run_pipeline(
+        engine,
+        [
+            (
+                get_league_stats_url(season, league, stat),
+                partial(parse_league_stats_page, season, league, stat),
+                partial(_save, stat),
+            )
+            for league in FBREF_LEAGUE_COMP_DICT
+            for stat in _stat_pages
+        ],
+    )
+    covered: set[str] = save_league_player_season(season, list_players, frames)
+    missing: list[str] = [
+        player_id for player_id in list_players if player_id not in covered
+    ]
+    logger.info(
+        "League player stats saved for {} players, {} left for Season: {}",
+        len(covered),
+        len(missing),
+        season.fbref_name,
+    )
+    if missing:
+        await get_player_season_async(
+            season, engine, progress, filter_players=missing
+        )
+
+
+def get_league_player_season(
+    season: Season,
+    filter_players: list[str] | None = None,
+) -> None:
+    """
+    Get the seasonal FBRef player stats from the league tables.
+
+    Parameters
+    ----------
+    season
+        The season under process.
+    filter_players
+        The optional list of player FBRef IDs.
+
+    """
+    run_fetch_jobs(
+        partial(
+            get_league_player_season_async,
+            season,
+            filter_players=filter_players,
+        )
+    )
+
+
+if __name__ == "__main__":
+    get_league_player_season(Seasons.SEASON_2324.value)
@@ -26,7 +26,7 @@ def get_match_links(season: Season) -> None:
 
     """
     url: str = f"{FBREF_BASE_URL}/comps/9/{season.fbref_long_name}/schedule/"
-    content: str = get_content(url=url, delay=0)
+    content: str = get_content(url=url)
     table_id: str = f"sched_{season.fbref_long_name}_9_1"
     df_links: pd.DataFrame = extract_table(
         content=content, table_id=table_id, href=True, dropna_cols=["score"]
@@ -1,20 +1,34 @@
 """Functions for getting FBRef match details."""
 
 import asyncio
-from datetime import datetime
+import json
+from datetime import UTC, datetime
+from functools import partial
 from pathlib import Path
+from typing import Any, cast
 
 import pandas as pd
 import rich.progress
 from loguru import logger
 
-from fantasypl.config.constants import DATA_FOLDER_FBREF
+from fantasypl.config.constants import (
+    DATA_FOLDER_FBREF,
+    FBREF_MATCH_COLUMNS,
+    FBREF_STAT_DTYPES,
+)
 from fantasypl.config.schemas import Season, Seasons, Team
 from fantasypl.utils import (
-    get_content,
+    BackgroundWriter,
+    FetchEngine,
+    append_parquet,
+    extract_tables,
     get_list_teams,
-    get_single_table,
-    save_pandas,
+    get_match_table_fpath,
+    invalidate_cached_response,
+    is_offline_mode,
+    load_match_table,
+    run_fetch_jobs,
+    run_pipeline,
 )
 
 
@@ -30,12 +44,11 @@ _tables: list[str] = [
 def get_fpath(
     season: Season,
     team_fbref_id: str,
-    date: str,
     tables: list[str],
     j: int,
 ) -> Path:
     """
-    Get the file save path for a given season and team and date.
+    Get the file save path for a given season and team and table.
 
     Parameters
     ----------
@@ -43,8 +56,6 @@ def get_fpath(
         The season under process.
     team_fbref_id
         FBRef team ID.
-    date
-        The date of the match.
     tables
         The list of tables.
     j
@@ -70,100 +81,352 @@ def get_fpath(
     table_name: str = (
         tables[j].replace(f"stats_{team_fbref_id}", "").strip("_")
     )
-    file_path: Path = (
-        DATA_FOLDER_FBREF
-        / season.folder
-        / "matches"
-        / team.short_name
-        / f"{table_name}_{date}.csv"
+    return get_match_table_fpath(season, team.short_name, table_name)
+
+
+def save_match_tables(results: list[tuple[pd.DataFrame, Path]]) -> None:
+    """
+    Append the tables of a match to the team table files.
+
+    Rows of the same match date already stored are replaced.
+
+    Parameters
+    ----------
+    results
+        The tables of the match with their file save paths.
+
+    """
+    df: pd.DataFrame
+    fpath: Path
+    for df, fpath in results:
+        append_parquet(df, fpath, ["date"])
+
+
+def migrate_match_csvs(season: Season) -> None:
+    """
+    Move the per-match CSVs of a season into the team table files.
+
+    The CSVs are only deleted once the rows of every match date read back
+    from the team table file match their count in the CSVs.
+
+    Parameters
+    ----------
+    season
+        The season under process.
+
+    """
+    folder: Path
+    for folder in sorted(
+        (DATA_FOLDER_FBREF / season.folder / "matches").glob("*/")
+    ):
+        table: str
+        for table in ["summary", "passing", "defense", "misc", "keeper"]:
+            fpaths: list[Path] = sorted(folder.glob(f"{table}_*.csv"))
+            if not fpaths:
+                continue
+            df_csv: pd.DataFrame = pd.concat(
+                [pd.read_csv(fpath) for fpath in fpaths],
+                ignore_index=True,
+            ).astype({"date": str})
+            append_parquet(
+                df_csv,
+                get_match_table_fpath(season, folder.name, table),
+                ["date"],
+            )
+            counts: pd.Series = df_csv["date"].value_counts()
+            if (
+                not load_match_table(season, folder.name, table)["date"]
+                .astype(str)
+                .value_counts()
+                .reindex(counts.index)
+                .equals(counts)
+            ):
+                logger.error(
+                    "{} {} table does not match its CSVs, kept them",
+                    folder.name,
+                    table,
+                )
+                continue
+            fpath: Path
+            for fpath in fpaths:
+                fpath.unlink()
+    logger.info("Match CSVs migrated for season {}", season.fbref_name)
+
+
+def get_match_url(match_link: str) -> str:
+    """
+    Get the URL of a match page.
+
+    Parameters
+    ----------
+    match_link
+        The match link from the season schedule.
+
+    Returns
+    -------
+        The match page URL.
+
+    """
+    return f"https://fbref.com{match_link}"
+
+
+def parse_match_page(
+    season: Season,
+    row: tuple[str, str, str, str],
+    content: str,
+) -> list[tuple[pd.DataFrame, Path]]:
+    """
+    Parse the FBRef stats tables of both teams from a match page.
+
+    Parameters
+    ----------
+    season
+        The season under process.
+    row
+        The home team, away team, date and match link of the match.
+    content
+        The contents of the match page.
+
+    Returns
+    -------
+        The tables of the match with their file save paths.
+
+    """
+    home_team: str
+    away_team: str
+    date: str
+    match_link: str
+    home_team, away_team, date, match_link = row
+    tables_home: list[str] = [
+        table_idx.format(home_team) for table_idx in _tables
+    ]
+    tables_away: list[str] = [
+        table_idx.format(away_team) for table_idx in _tables
+    ]
+    dfs: list[pd.DataFrame] = extract_tables(
+        content,
+        tables_home + tables_away,
+        dtypes=FBREF_STAT_DTYPES,
+        columns=FBREF_MATCH_COLUMNS,
+    )
+    dfs_home: list[pd.DataFrame] = dfs[: len(tables_home)]
+    if any(df.empty for df in dfs_home):
+        logger.error(
+            "Team {} Error on Match: {}",
+            home_team,
+            match_link,
+        )
+    dfs_away: list[pd.DataFrame] = dfs[len(tables_home) :]
+    if any(df.empty for df in dfs_away):
+        logger.error(
+            "Team {} Error on Match: {}",
+            away_team,
+            match_link,
+        )
+    results: list[tuple[pd.DataFrame, Path]] = []
+    df: pd.DataFrame
+    j: int
+    for j, df in enumerate(dfs_home):
+        df["team"] = home_team
+        df["opponent"] = away_team
+        df["date"] = date
+        df["venue"] = "Home"
+        results.append((
+            df,
+            get_fpath(season, home_team, tables_home, j),
+        ))
+    for j, df in enumerate(dfs_away):
+        df["team"] = away_team
+        df["opponent"] = home_team
+        df["date"] = date
+        df["venue"] = "Away"
+        results.append((
+            df,
+            get_fpath(season, away_team, tables_away, j),
+        ))
+    return results
+
+
+def get_manifest_fpath(season: Season) -> Path:
+    """
+    Get the path of the match fetch manifest of a season.
+
+    Parameters
+    ----------
+    season
+        The season under process.
+
+    Returns
+    -------
+        Path of the manifest JSON.
+
+    """
+    return DATA_FOLDER_FBREF / season.folder / "matches_manifest.json"
+
+
+def load_match_manifest(season: Season) -> dict[str, dict[str, Any]]:
+    """
+    Load the match fetch manifest of a season.
+
+    Parameters
+    ----------
+    season
+        The season under process.
+
+    Returns
+    -------
+        The fetch time and the row count of each saved table, keyed by
+        match link.
+
+    """
+    fpath: Path = get_manifest_fpath(season)
+    if not fpath.exists():
+        return {}
+    with Path.open(fpath, encoding="utf-8") as f:
+        return cast("dict[str, dict[str, Any]]", json.load(f)["matches"])
+
+
+def update_match_manifest(
+    manifest: dict[str, dict[str, Any]],
+    match_link: str,
+    results: list[tuple[pd.DataFrame, Path]],
+) -> None:
+    """
+    Record the saved tables of a match in the manifest.
+
+    Parameters
+    ----------
+    manifest
+        The match fetch manifest of the season, updated in place.
+    match_link
+        The match link from the season schedule.
+    results
+        The saved tables of the match with their file paths.
+
+    """
+    manifest[match_link] = {
+        "fetched_at": datetime.now(tz=UTC).isoformat(),
+        "tables": {
+            f"{fpath.parent.name}/{fpath.stem}": df.shape[0]
+            for df, fpath in results
+        },
+    }
+
+
+def is_match_complete(entry: dict[str, Any] | None) -> bool:
+    """
+    Check whether all the tables of a match were fetched with data.
+
+    Parameters
+    ----------
+    entry
+        The manifest entry of the match.
+
+    Returns
+    -------
+        True if both teams have all their tables and none is empty.
+
+    """
+    return (
+        entry is not None
+        and len(entry["tables"]) == 2 * len(_tables)
+        and all(entry["tables"].values())
     )
-    return file_path
 
 
-def get_matches(season: Season, filter_date: str | None = None) -> None:
+async def get_matches_async(
+    season: Season,
+    engine: FetchEngine,
+    progress: rich.progress.Progress,
+) -> None:
     """
-    Get the FBRef match stats.
+    Get the missing or incomplete FBRef match stats on the shared engine.
+
+    Per-match CSVs left from earlier fetches are migrated first. The
+    matches of `match_links.csv` are then checked against the season
+    manifest, which is queued on a background writer as soon as the
+    tables of a match are saved. The cached pages of incomplete matches
+    are dropped first so that they are downloaded again, unless offline.
 
     Parameters
     ----------
     season
         The season under progress.
-    filter_date
-        The date after which matches need to be fetched.
+    engine
+        The shared fetch engine.
+    progress
+        The shared progress bars.
 
     """
-    logger.info("Downloading match data for season {}", season.fbref_name)
+    await asyncio.to_thread(migrate_match_csvs, season)
     df_links: pd.DataFrame = pd.read_csv(
         DATA_FOLDER_FBREF / season.folder / "match_links.csv",
     )
-    if filter_date is not None:
-        df_links["date"] = pd.to_datetime(df_links["date"]).dt.date
-        df_links = df_links[
-            df_links["date"]
-            >= datetime.strptime(filter_date, "%Y-%m-%d").date()  # noqa: DTZ007
-        ]
-        df_links = df_links.reset_index(drop=True)
-        logger.info(
-            "Checking for matches after the date: {}",
-            datetime.strptime(filter_date, "%Y-%m-%d").date(),  # noqa: DTZ007
+    manifest: dict[str, dict[str, Any]] = load_match_manifest(season)
+    df_links = df_links.loc[
+        ~df_links["match_link"].map(
+            lambda link: is_match_complete(manifest.get(link))
         )
-    with rich.progress.Progress() as progress:
-        _task_id: rich.progress.TaskID = progress.add_task(
-            "[cyan]Getting match_stats from FBRef: ",
-            total=df_links.shape[0] * 2 * len(_tables),
+    ]
+    if not is_offline_mode():
+        link: str
+        for link in df_links["match_link"]:
+            if link in manifest:
+                invalidate_cached_response(get_match_url(link))
+    logger.info(
+        "Downloading {} missing or incomplete matches for season {}",
+        df_links.shape[0],
+        season.fbref_name,
+    )
+    task_id: rich.progress.TaskID = progress.add_task(
+        "[cyan]Getting match_stats from FBRef: ",
+        total=df_links.shape[0] * 2 * len(_tables),
+    )
+
+    def _save(
+        match_link: str, results: list[tuple[pd.DataFrame, Path]]
+    ) -> None:
+        save_match_tables(results)
+        progress.update(task_id=task_id, advance=len(results))
+        update_match_manifest(manifest, match_link, results)
+        writer.save_json(
+            {"matches": dict(manifest)}, get_manifest_fpath(season)
         )
-        for i in range(df_links.shape[0]):
-            home_team: str = df_links["home_team"].to_numpy().item(i)
-            away_team: str = df_links["away_team"].to_numpy().item(i)
-            date: str = df_links["date"].to_numpy().item(i)
-            match_link: str = df_links["match_link"].to_numpy().item(i)
-
-            tables_home: list[str] = [
-                table_idx.format(home_team) for table_idx in _tables
-            ]
-            tables_away: list[str] = [
-                table_idx.format(away_team) for table_idx in _tables
-            ]
-            content: str = get_content(url=f"https://fbref.com{match_link}")
-            dfs_home: list[pd.DataFrame] = asyncio.run(
-                get_single_table(content=content, tables=tables_home),
-            )
-            if not dfs_home:
-                logger.error(
-                    "Team {} Error on Match: {}",
-                    home_team,
-                    match_link,
-                )
-            dfs_away: list[pd.DataFrame] = asyncio.run(
-                get_single_table(content=content, tables=tables_away),
-            )
-            if not dfs_away:
-                logger.error(
-                    "Team {} Error on Match: {}",
-                    away_team,
-                    match_link,
+
+    rows: list[tuple[str, str, str, str]] = list(
+        df_links[["home_team", "away_team", "date", "match_link"]]
+        .astype(str)
+        .itertuples(index=False, name=None)
+    )
+    writer: BackgroundWriter
+    with BackgroundWriter() as writer:
+        await run_pipeline(
+            engine,
+            [
+                (
+                    get_match_url(row[3]),
+                    partial(parse_match_page, season, row),
+                    partial(_save, row[3]),
                 )
-            df: pd.DataFrame
-            j: int
-            fpath: Path
-            for j, df in enumerate(dfs_home):
-                df["team"] = home_team
-                df["opponent"] = away_team
-                df["date"] = date
-                df["venue"] = "Home"
-                fpath = get_fpath(season, home_team, date, tables_home, j)
-                save_pandas(df=df, fpath=fpath)
-                progress.update(task_id=_task_id, advance=1)
-            for j, df in enumerate(dfs_away):
-                df["team"] = away_team
-                df["opponent"] = home_team
-                df["date"] = date
-                df["venue"] = "Away"
-                fpath = get_fpath(season, away_team, date, tables_away, j)
-                save_pandas(df=df, fpath=fpath)
-                progress.update(task_id=_task_id, advance=1)
+                for row in rows
+            ],
+        )
+        await asyncio.to_thread(writer.flush)
+
+
+def get_matches(season: Season) -> None:
+    """
+    Get the missing or incomplete FBRef match stats.
+
+    Parameters
+    ----------
+    season
+        The season under progress.
+
+    """
+    run_fetch_jobs(partial(get_matches_async, season))
 
 
 if __name__ == "__main__":
-    get_matches(Seasons.SEASON_2425.value, filter_date="2024-09-02")
+    get_matches(Seasons.SEASON_2425.value)
     # get_matches(Seasons.SEASON_2324.value)
@@ -1,27 +1,33 @@
 """Functions for getting FBRef player stats for complete season."""
 
-import asyncio
+from functools import partial
+from pathlib import Path
 from typing import TYPE_CHECKING
 
+import pandas as pd
 import rich.progress
 from loguru import logger
-from lxml import html
 
-from fantasypl.config.constants import DATA_FOLDER_FBREF, FBREF_BASE_URL
+from fantasypl.config.constants import (
+    DATA_FOLDER_FBREF,
+    FBREF_BASE_URL,
+    FBREF_STAT_DTYPES,
+)
 from fantasypl.config.references import FBREF_FPL_PLAYER_REF_DICT
 from fantasypl.config.schemas import Season, Seasons
 from fantasypl.utils import (
-    get_content,
-    get_single_table,
+    FetchEngine,
+    extract_table,
+    iter_elements_by_id,
+    run_fetch_jobs,
+    run_pipeline,
     save_json,
     save_pandas,
 )
 
 
 if TYPE_CHECKING:
-    from pathlib import Path
-
-    import pandas as pd
+    from lxml import html
 
 
 _tables: list[str] = [
@@ -37,17 +43,169 @@ _tables: list[str] = [
 ]
 
 
-def get_player_season(
+def get_player_url(player_id: str) -> str:
+    """
+    Get the URL of a player page.
+
+    Parameters
+    ----------
+    player_id
+        The player FBRef ID.
+
+    Returns
+    -------
+        The player page URL.
+
+    """
+    return f"{FBREF_BASE_URL}/players/{player_id}/"
+
+
+def parse_player_page(
+    season: Season,
+    player_id: str,
+    content: str,
+) -> tuple[dict[str, str], list[tuple[pd.DataFrame, Path]]]:
+    """
+    Parse the player details and seasonal tables from a player page.
+
+    The page is streamed and parsing stops after the last table. The
+    `meta` element of the player photo is passed over for the infobox.
+
+    Parameters
+    ----------
+    season
+        The season under process.
+    player_id
+        The player FBRef ID.
+    content
+        The contents of the player page.
+
+    Returns
+    -------
+        The player name and position, and the tables with their file
+        save paths. Both are empty if the infobox is missing.
+
+    """
+    details: dict[str, str] = {}
+    dfs: dict[str, pd.DataFrame] = {}
+    element: html.HtmlElement
+    for element in iter_elements_by_id(
+        content, ["meta", *_tables], skip_classes=("media-item",)
+    ):
+        element_id: str = str(element.get("id"))
+        if element_id != "meta":
+            dfs[element_id] = extract_table(
+                element, element_id, dtypes=FBREF_STAT_DTYPES
+            )
+            continue
+        positions: list[str] = [
+            el.text_content()
+            for el in element.cssselect("p")
+            if "Position" in el.text_content()
+        ]
+        if positions:
+            details = {
+                "name": element.cssselect("h1")[0].text_content().strip(),
+                "position": positions[0]
+                .split("▪")[0]
+                .strip()
+                .replace("Position: ", ""),
+            }
+    if not details:
+        logger.error("Fetching page failed for Player ID: {}", player_id)
+        return details, []
+
+    position: str = details["position"]
+    results: list[tuple[pd.DataFrame, Path]] = []
+    table: str
+    for table in _tables:
+        df: pd.DataFrame = dfs.get(table, pd.DataFrame())
+        fpath: Path = (
+            DATA_FOLDER_FBREF
+            / season.folder
+            / "player_season"
+            / f"{player_id}_{
+                table
+                .removeprefix("stats_")
+                .removesuffix("_dom_lg")
+            }.csv"
+        )
+
+        if df.empty and (
+            not (
+                (position == "GK" and "keeper" not in table)
+                or (position != "GK" and "keeper" in table)
+            )
+        ):
+            logger.error(
+                "Data fetch error from FBRef: "
+                "Season = {} Player ID = {} "
+                "Stat = {}",
+                season.fbref_name,
+                player_id,
+                f"{player_id}_{
+                    table
+                    .removeprefix("stats_")
+                    .removesuffix("_dom_lg")
+                }",
+            )
+        results.append((df, fpath))
+    return details, results
+
+
+def save_player_season(
+    season: Season,
+    player_id: str,
+    details: dict[str, str],
+    results: list[tuple[pd.DataFrame, Path]],
+) -> None:
+    """
+    Save the parsed player details and seasonal tables.
+
+    Parameters
+    ----------
+    season
+        The season under process.
+    player_id
+        The player FBRef ID.
+    details
+        The player name and position.
+    results
+        The tables with their file save paths.
+
+    """
+    df: pd.DataFrame
+    fpath: Path
+    for df, fpath in results:
+        save_pandas(df=df, fpath=fpath)
+    save_json(
+        details,
+        (
+            DATA_FOLDER_FBREF
+            / season.folder
+            / "player_season"
+            / f"{player_id}.json"
+        ),
+    )
+
+
+async def get_player_season_async(
     season: Season,
+    engine: FetchEngine,
+    progress: rich.progress.Progress,
     filter_players: list[str] | None = None,
 ) -> None:
     """
-    Get the seasonal FBRef stats for a list of players.
+    Get the seasonal FBRef stats for players on the shared fetch engine.
 
     Parameters
     ----------
     season
         The season under process.
+    engine
+        The shared fetch engine.
+    progress
+        The shared progress bars.
     filter_players
         The optional list of player FBRef IDs.
 
@@ -55,81 +213,50 @@ def get_player_season(
     list_players: list[str] = [*FBREF_FPL_PLAYER_REF_DICT]
     if filter_players is not None:
         list_players = filter_players.copy()
-    for player_id in rich.progress.track(
-        list_players,
-        description="Getting player pages from FBRef: ",
-    ):
-        try:
-            content: str = get_content(
-                f"{FBREF_BASE_URL}/players/{player_id}/",
-            )
-            tree: html.HtmlElement = html.fromstring(content)
-            infobox: html.HtmlElement = next(
-                el
-                for el in tree.cssselect("div#meta")
-                if el.get("class") != "media-item"
-            )
-            fbref_name: str = infobox.cssselect("h1")[0].text_content().strip()
-            position: str = (
-                next(
-                    el
-                    for el in infobox.cssselect("p")
-                    if "Position" in el.text_content()
-                )
-                .text_content()
-                .split("▪")[0]
-                .strip()
-                .replace("Position: ", "")
-            )
-            dfs: list[pd.DataFrame] = asyncio.run(
-                get_single_table(content=content, tables=_tables),
-            )
-            for j, df in enumerate(dfs):
-                fpath: Path = (
-                    DATA_FOLDER_FBREF
-                    / season.folder
-                    / "player_season"
-                    / f"{player_id}_{
-                        _tables[j]
-                        .removeprefix("stats_")
-                        .removesuffix("_dom_lg")
-                    }.csv"
-                )
-
-                if df.empty and (
-                    not (
-                        (position == "GK" and "keeper" not in _tables[j])
-                        or (position != "GK" and "keeper" in _tables[j])
-                    )
-                ):
-                    logger.error(
-                        "Data fetch error from FBRef: "
-                        "Season = {} Player ID = {} "
-                        "Stat = {}",
-                        season.fbref_name,
-                        player_id,
-                        f"{player_id}_{
-                            _tables[j]
-                            .removeprefix("stats_")
-                            .removesuffix("_dom_lg")
-                        }",
-                    )
-                save_pandas(df=df, fpath=fpath)
-            df_details: dict[str, str] = {
-                "name": fbref_name,
-                "position": position,
-            }
-            save_json(
-                df_details,
-                (
-                    DATA_FOLDER_FBREF
-                    / season.folder
-                    / "player_season"
-                    / f"{player_id}.json"
-                ),
+    task_id: rich.progress.TaskID = progress.add_task(
+        "[cyan]Getting player pages from FBRef: ",
+        total=len(list_players),
+    )
+
+    def _save(
+        player_id: str,
+        parsed: tuple[dict[str, str], list[tuple[pd.DataFrame, Path]]],
+    ) -> None:
+        if parsed[0]:
+            save_player_season(season, player_id, *parsed)
+        progress.update(task_id=task_id, advance=1)
+
+    await run_pipeline(
+        engine,
+        [
+            (
+                get_player_url(player_id),
+                partial(parse_player_page, season, player_id),
+                partial(_save, player_id),
             )
-        except StopIteration:  # noqa: PERF203
-            logger.error("Fetching page failed for Player ID: {}", player_id)
+            for player_id in list_players
+        ],
+    )
+
+
+def get_player_season(
+    season: Season,
+    filter_players: list[str] | None = None,
+) -> None:
+    """
+    Get the seasonal FBRef stats for a list of players.
+
+    Parameters
+    ----------
+    season
+        The season under process.
+    filter_players
+        The optional list of player FBRef IDs.
+
+    """
+    run_fetch_jobs(
+        partial(get_player_season_async, season, filter_players=filter_players)
+    )
 
 
 if __name__ == "__main__":
@@ -5,7 +5,11 @@ from typing import TYPE_CHECKING
 
 from loguru import logger
 
-from fantasypl.config.constants import DATA_FOLDER_FBREF, FBREF_BASE_URL
+from fantasypl.config.constants import (
+    DATA_FOLDER_FBREF,
+    FBREF_BASE_URL,
+    FBREF_STAT_DTYPES,
+)
 from fantasypl.config.schemas import Season, Seasons
 from fantasypl.utils import get_content, get_single_table, save_pandas
 
@@ -56,7 +60,9 @@ def get_league_season(season: Season, league_id: int) -> None:
         f"{FBREF_BASE_URL}/comps/{league_id}/{season.fbref_long_name}/",
     )
     dfs: list[pd.DataFrame] = asyncio.run(
-        get_single_table(content=content, tables=_tables),
+        get_single_table(
+            content=content, tables=_tables, dtypes=FBREF_STAT_DTYPES
+        ),
     )
     j: int
     df: pd.DataFrame
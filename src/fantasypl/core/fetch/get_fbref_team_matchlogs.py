@@ -1,30 +1,29 @@
 """Functions for getting FBRef team matchlogs."""
 
 import asyncio
-from typing import TYPE_CHECKING
+from functools import partial
+from pathlib import Path
 
+import pandas as pd
 import rich.progress
 from loguru import logger
 
 from fantasypl.config.constants import (
     DATA_FOLDER_FBREF,
     FBREF_BASE_URL,
+    FBREF_MATCHLOG_COLUMNS,
+    FBREF_STAT_DTYPES,
 )
 from fantasypl.config.schemas import Season, Seasons, Team
 from fantasypl.utils import (
-    get_content,
+    BackgroundWriter,
+    FetchEngine,
+    extract_tables,
     get_list_teams,
-    get_single_table,
-    save_pandas,
+    run_fetch_jobs,
 )
 
 
-if TYPE_CHECKING:
-    from pathlib import Path
-
-    import pandas as pd
-
-
 _table_id_for: str = "matchlogs_for"
 _table_id_against: str = "matchlogs_against"
 _stat_tables: list[str] = [
@@ -38,21 +37,176 @@ _stat_tables: list[str] = [
     "possession",
     "misc",
 ]
+_stat_tables_not_derivable: list[str] = ["schedule", "shooting"]
 
 
-def get_matchlogs(
+def get_stat_tables(*, derived: bool = False) -> list[str]:
+    """
+    Get the team matchlog stats fetched from FBRef.
+
+    Parameters
+    ----------
+    derived
+        Boolean value for whether the stats that can be derived from the
+        match reports are left out.
+
+    Returns
+    -------
+        The matchlog stat names.
+
+    """
+    return _stat_tables_not_derivable if derived else _stat_tables
+
+
+def get_matchlog_url(season: Season, team: Team, stat: str) -> str:
+    """
+    Get the URL of a team matchlog stat page.
+
+    Parameters
+    ----------
+    season
+        The season under process.
+    team
+        The team under process.
+    stat
+        The matchlog stat type.
+
+    Returns
+    -------
+        The matchlog page URL.
+
+    """
+    return (
+        f"{FBREF_BASE_URL}/squads/{team.fbref_id}/{season.fbref_long_name}/"
+        f"matchlogs/c9/{stat}/"
+    )
+
+
+def parse_matchlog_page(
     season: Season,
+    team: Team,
+    stat: str,
+    content: str,
+) -> list[tuple[pd.DataFrame, Path]]:
+    """
+    Parse the for and against tables from a team matchlog stat page.
+
+    Parameters
+    ----------
+    season
+        The season under process.
+    team
+        The team under process.
+    stat
+        The matchlog stat type.
+    content
+        The contents of the matchlog page.
+
+    Returns
+    -------
+        The matchlog tables with their file save paths.
+
+    """
+    tables: list[str]
+    match stat:
+        case "schedule":
+            tables = [_table_id_for]
+        case _:
+            tables = [_table_id_for, _table_id_against]
+    dfs: list[pd.DataFrame] = extract_tables(
+        content,
+        tables,
+        dropna_cols=["match_report"],
+        dtypes=FBREF_STAT_DTYPES,
+        columns=FBREF_MATCHLOG_COLUMNS,
+        stream=True,
+    )
+    results: list[tuple[pd.DataFrame, Path]] = []
+    i: int
+    df: pd.DataFrame
+    for i, df in enumerate(dfs):
+        fpath: Path = (
+            DATA_FOLDER_FBREF
+            / season.folder
+            / "team_matchlogs"
+            / team.short_name
+            / f"{stat}_{tables[i].removeprefix("matchlogs_")}.csv"
+        )
+        if df.empty:
+            logger.error(
+                "Data fetch error from FBRef: "
+                "Season = {} Team = {} "
+                "Stat = {} Table = {}",
+                season.fbref_name,
+                team.short_name,
+                stat,
+                tables[i],
+            )
+        results.append((df, fpath))
+    return results
+
+
+async def get_single_matchlog(
+    season: Season,
+    team: Team,
+    stat: str,
+    engine: FetchEngine,
+    writer: BackgroundWriter,
+) -> None:
+    """
+    Get a single FBRef team matchlog stat page.
+
+    Parameters
+    ----------
+    season
+        The season under process.
+    team
+        The team under process.
+    stat
+        The matchlog stat type.
+    engine
+        The shared fetch engine.
+    writer
+        The background writer of the tables.
+
+    """
+    content: str | None = await engine.fetch(
+        get_matchlog_url(season, team, stat)
+    )
+    if content is None:
+        return
+    df: pd.DataFrame
+    fpath: Path
+    for df, fpath in await asyncio.to_thread(
+        parse_matchlog_page, season, team, stat, content
+    ):
+        await asyncio.to_thread(writer.save_pandas, df, fpath)
+
+
+async def get_matchlogs_async(
+    season: Season,
+    engine: FetchEngine,
+    progress: rich.progress.Progress,
     filter_teams: list[str] | None = None,
+    *,
+    derived: bool = False,
 ) -> None:
     """
-    Get FBRef team matchlogs for a season.
+    Get FBRef team matchlogs for a season on the shared fetch engine.
 
     Parameters
     ----------
     season
         The season under process.
+    engine
+        The shared fetch engine.
+    progress
+        The shared progress bars.
     filter_teams
          The optional list of team short names.
+    derived
+        Boolean value for whether only the stats that cannot be derived
+        from the match reports are fetched.
 
     """
     list_teams: list[Team] = get_list_teams()
@@ -60,60 +214,58 @@ def get_matchlogs(
         list_teams = [
             team for team in list_teams if team.short_name in filter_teams
         ]
-    with rich.progress.Progress() as progress:
-        _task_id: rich.progress.TaskID = progress.add_task(
-            "[cyan]Getting team matchlogs from FBRef: ",
-            total=len(list_teams) * len(_stat_tables),
+    stat_tables: list[str] = get_stat_tables(derived=derived)
+    task_id: rich.progress.TaskID = progress.add_task(
+        "[cyan]Getting team matchlogs from FBRef: ",
+        total=len(list_teams) * len(stat_tables),
+    )
+
+    async def _get(team: Team, stat: str) -> None:
+        await get_single_matchlog(season, team, stat, engine, writer)
+        progress.update(task_id=task_id, advance=1)
+
+    writer: BackgroundWriter
+    with BackgroundWriter() as writer:
+        await asyncio.gather(
+            *(_get(team, stat) for team in list_teams for stat in stat_tables)
         )
-        for team in list_teams:
-            base_url: str = (
-                f"{FBREF_BASE_URL}/squads/{team.fbref_id}/{season.fbref_long_name}/"
-                f"matchlogs/c9/{{stat}}/"
-            )
-            for stat in _stat_tables:
-                url: str = base_url.format(stat=stat)
-                content: str = get_content(url)
-                tables: list[str]
-                match stat:
-                    case "schedule":
-                        tables = [_table_id_for]
-                    case _:
-                        tables = [_table_id_for, _table_id_against]
-                dfs: list[pd.DataFrame] = asyncio.run(
-                    get_single_table(
-                        content=content,
-                        tables=tables,
-                        dropna_cols=["match_report"],
-                    ),
-                )
-                i: int
-                df: pd.DataFrame
-                for i, df in enumerate(dfs):
-                    fpath: Path = (
-                        DATA_FOLDER_FBREF
-                        / season.folder
-                        / "team_matchlogs"
-                        / team.short_name
-                        / f"{stat}_{tables[i].removeprefix("matchlogs_")}.csv"
-                    )
-                    if df.empty:
-                        logger.error(
-                            "Data fetch error from FBRef: "
-                            "Season = {} Team = {} "
-                            "Stat = {} Table = {}",
-                            season.fbref_name,
-                            team.short_name,
-                            stat,
-                            tables[i],
-                        )
-                    save_pandas(df, fpath)
-                progress.update(task_id=_task_id, advance=1)
+        await asyncio.to_thread(writer.flush)
     logger.info(
         "Team matchlogs fetch completed for Season: {}",
         season.fbref_name,
     )
 
 
+def get_matchlogs(
+    season: Season,
+    filter_teams: list[str] | None = None,
+    *,
+    derived: bool = False,
+) -> None:
+    """
+    Get FBRef team matchlogs for a season.
+
+    Parameters
+    ----------
+    season
+        The season under process.
+    filter_teams
+         The optional list of team short names.
+    derived
+        Boolean value for whether only the stats that cannot be derived
+        from the match reports are fetched.
+
+    """
+    run_fetch_jobs(
+        partial(
+            get_matchlogs_async,
+            season,
+            filter_teams=filter_teams,
+            derived=derived,
+        )
+    )
+
+
 if __name__ == "__main__":
     # get_matchlogs(Seasons.SEASON_2324.value)
     get_matchlogs(Seasons.SEASON_2425.value)
@@ -26,7 +26,7 @@ def get_teams(season: Season) -> None:
 
     """
     url: str = f"{FBREF_BASE_URL}/comps/9/{season.fbref_long_name}/"
-    content: str = get_content(url=url, delay=0)
+    content: str = get_content(url=url)
     table_id: str = f"results{season.fbref_long_name}91_overall"
     df_teams: pd.DataFrame = extract_table(
         content=content,
@@ -1,55 +1,120 @@
 """Functions for getting FPL API bootstrap and fixtures data."""
 
+import asyncio
+from functools import partial
 from typing import TYPE_CHECKING
 
 import requests
+import rich.progress
 from loguru import logger
 
-from fantasypl.config.constants import (
-    DATA_FOLDER_FPL,
-    FPL_BOOTSTRAP_URL,
-    FPL_FIXTURES_URL,
-)
-from fantasypl.config.schemas import Season, Seasons
-from fantasypl.utils import save_json
+from fantasypl.config.constants import DATA_FOLDER_FPL
+from fantasypl.config.schemas import FPLBootstrap, FPLFixture, Season, Seasons
+from fantasypl.utils import FetchEngine, FPLClient, run_fetch_jobs, save_json
 
 
 if TYPE_CHECKING:
     from pathlib import Path
 
 
-def get_bootstrap(season: Season) -> None:
+async def get_bootstrap_async(
+    season: Season,
+    engine: FetchEngine,  # noqa: ARG001
+    progress: rich.progress.Progress,
+) -> None:
     """
-    Get FPL API bootstrap data.
+    Get FPL API bootstrap data alongside the other fetch jobs.
 
     Parameters
     ----------
     season
         The season under process.
+    engine
+        The shared fetch engine, unused since the FPL client keeps its
+        own connection pool.
+    progress
+        The shared progress bars.
 
     """
-    response: requests.Response = requests.get(FPL_BOOTSTRAP_URL, timeout=5)
+    task_id: rich.progress.TaskID = progress.add_task(
+        "[cyan]Getting bootstrap from FPL: ",
+        total=1,
+    )
+    try:
+        bootstrap: FPLBootstrap = await asyncio.to_thread(
+            FPLClient(season).get_bootstrap
+        )
+    except (requests.RequestException, FileNotFoundError) as err:
+        logger.error("FPL Bootstrap download failed: {}", err)
+        return
     fpath: Path = DATA_FOLDER_FPL / season.folder / "bootstrap.json"
-    save_json(response.json(), fpath)
+    save_json(bootstrap.model_dump(), fpath)
+    progress.update(task_id=task_id, advance=1)
     logger.info("FPL Bootstrap downloaded for season {}", season.fbref_name)
 
 
-def get_fixtures(season: Season) -> None:
+async def get_fixtures_async(
+    season: Season,
+    engine: FetchEngine,  # noqa: ARG001
+    progress: rich.progress.Progress,
+) -> None:
     """
-    Get FPL API fixtures data.
+    Get FPL API fixtures data alongside the other fetch jobs.
 
     Parameters
     ----------
     season
         The season under process.
+    engine
+        The shared fetch engine, unused since the FPL client keeps its
+        own connection pool.
+    progress
+        The shared progress bars.
 
     """
-    response: requests.Response = requests.get(FPL_FIXTURES_URL, timeout=5)
+    task_id: rich.progress.TaskID = progress.add_task(
+        "[cyan]Getting fixtures from FPL: ",
+        total=1,
+    )
+    try:
+        fixtures: list[FPLFixture] = await asyncio.to_thread(
+            FPLClient(season).get_fixtures
+        )
+    except (requests.RequestException, FileNotFoundError) as err:
+        logger.error("FPL Fixtures download failed: {}", err)
+        return
     fpath: Path = DATA_FOLDER_FPL / season.folder / "fixtures.json"
-    save_json(response.json(), fpath)
+    save_json([fixture.model_dump() for fixture in fixtures], fpath)
+    progress.update(task_id=task_id, advance=1)
     logger.info("FPL Fixtures downloaded for season {}", season.fbref_name)
 
 
+def get_bootstrap(season: Season) -> None:
+    """
+    Get FPL API bootstrap data.
+
+    Parameters
+    ----------
+    season
+        The season under process.
+
+    """
+    run_fetch_jobs(partial(get_bootstrap_async, season))
+
+
+def get_fixtures(season: Season) -> None:
+    """
+    Get FPL API fixtures data.
+
+    Parameters
+    ----------
+    season
+        The season under process.
+
+    """
+    run_fetch_jobs(partial(get_fixtures_async, season))
+
+
 if __name__ == "__main__":
     get_bootstrap(Seasons.SEASON_2425.value)
     get_fixtures(Seasons.SEASON_2425.value)
@@ -0,0 +1,122 @@
+"""Functions for getting the realised FPL points of finished gameweeks."""
+
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+import pandas as pd
+import rich.progress
+from loguru import logger
+
+from fantasypl.config.constants import DATA_FOLDER_FPL, FETCH_MAX_CONCURRENCY
+from fantasypl.config.schemas import FPLBootstrap, FPLLive, Season, Seasons
+from fantasypl.utils import FPLClient, save_parquet
+
+
+def get_live_points_fpath(season: Season) -> Path:
+    """
+    Get the path of the live points table of a season.
+
+    Parameters
+    ----------
+    season
+        The season under process.
+
+    Returns
+    -------
+        The Parquet file path.
+
+    """
+    return DATA_FOLDER_FPL / season.folder / "live_points.parquet"
+
+
+def parse_live(live: FPLLive, gameweek: int) -> pd.DataFrame:
+    """
+    Flatten the live stats of a gameweek into one row per player.
+
+    Parameters
+    ----------
+    live
+        The live stats of the gameweek.
+    gameweek
+        The gameweek of the stats.
+
+    Returns
+    -------
+        A pandas dataframe keyed by element and gameweek.
+
+    """
+    df_live: pd.DataFrame = pd.DataFrame([
+        {"element": el.id, "gameweek": gameweek, **el.stats}
+        for el in live.elements
+    ])
+    col: str
+    for col in df_live.select_dtypes(include=["object", "string"]).columns:
+        df_live[col] = pd.to_numeric(df_live[col], errors="coerce")
+    return df_live
+
+
+def get_live_points(season: Season) -> None:
+    """
+    Get the live stats and points of every checked finished gameweek.
+
+    Gameweeks already in the table are not fetched again, since their
+    points are final once the FPL data of the gameweek is checked. The
+    missing ones are fetched concurrently and the table is saved as
+    Parquet, keyed by element and gameweek.
+
+    Parameters
+    ----------
+    season
+        The season under process.
+
+    """
+    client: FPLClient = FPLClient(season)
+    bootstrap: FPLBootstrap = client.get_bootstrap()
+    fpath: Path = get_live_points_fpath(season)
+    df_stored: pd.DataFrame = (
+        pd.read_parquet(fpath) if fpath.exists() else pd.DataFrame()
+    )
+    stored: set[int] = (
+        set(df_stored["gameweek"].unique()) if not df_stored.empty else set()
+    )
+    gameweeks: list[int] = [
+        event.id
+        for event in bootstrap.events
+        if event.finished and event.data_checked and event.id not in stored
+    ]
+    if not gameweeks:
+        logger.info(
+            "FPL live points up to date for season {}", season.fbref_name
+        )
+        return
+
+    dfs: list[pd.DataFrame] = [df_stored]
+    with ThreadPoolExecutor(max_workers=FETCH_MAX_CONCURRENCY) as executor:
+        futures: dict[Future[FPLLive], int] = {
+            executor.submit(client.get_live, gameweek): gameweek
+            for gameweek in gameweeks
+        }
+        dfs.extend(
+            parse_live(future.result(), futures[future])
+            for future in rich.progress.track(
+                as_completed(futures),
+                total=len(futures),
+                description="[cyan]Getting live points from FPL: ",
+            )
+        )
+    df_points: pd.DataFrame = (
+        pd
+        .concat([df for df in dfs if not df.empty], ignore_index=True)
+        .sort_values(["gameweek", "element"])
+        .reset_index(drop=True)
+    )
+    save_parquet(df_points, fpath)
+    logger.info(
+        "FPL live points saved for {} new gameweeks of season {}",
+        len(gameweeks),
+        season.fbref_name,
+    )
+
+
+if __name__ == "__main__":
+    get_live_points(Seasons.SEASON_2425.value)
@@ -1,9 +1,6 @@
 """Functions for getting player photos from FPL."""
 
 import pandas as pd
-import requests
-import rich.progress
-from loguru import logger
 
 from fantasypl.config.constants import (
     DATA_FOLDER_FPL,
@@ -11,13 +8,16 @@ from fantasypl.config.constants import (
     RESOURCE_FOLDER,
 )
 from fantasypl.config.schemas import Season, Seasons
-from fantasypl.utils import save_requests_response
+from fantasypl.utils import FPLClient, sync_assets
 
 
 def get_player_photos(season: Season) -> None:
     """
     Get FPL player photos.
 
+    Only the photos that are new or changed on the server are
+    downloaded.
+
     Parameters
     ----------
     season
@@ -29,17 +29,21 @@ def get_player_photos(season: Season) -> None:
     )
     player_codes: list[str] = df_fpl_players["code"].to_list()
 
-    for code in rich.progress.track(
-        player_codes,
+    sync_assets(
+        FPLClient(season),
+        [
+            (
+                f"{FPL_PHOTOS_URL}/p{code}.png",
+                RESOURCE_FOLDER
+                / season.folder
+                / "photos"
+                / f"photo_{code}.png",
+            )
+            for code in player_codes
+        ],
+        RESOURCE_FOLDER / season.folder / "assets_manifest.json",
         "Downloading player photos: ",
-    ):
-        url: str = f"{FPL_PHOTOS_URL}/p{code}.png"
-        response: requests.Response = requests.get(url, timeout=2)
-        save_requests_response(
-            response,
-            RESOURCE_FOLDER / season.folder / "photos" / f"photo_{code}.png",
-        )
-    logger.info("All player photos downloaded.")
+    )
 
 
 if __name__ == "__main__":
@@ -1,9 +1,8 @@
 """Functions for getting shirt graphics from FPL."""
 
+from typing import TYPE_CHECKING
+
 import pandas as pd
-import requests
-import rich.progress
-from loguru import logger
 
 from fantasypl.config.constants import (
     DATA_FOLDER_FPL,
@@ -12,13 +11,20 @@ from fantasypl.config.constants import (
     RESOURCE_FOLDER,
 )
 from fantasypl.config.schemas import Season, Seasons
-from fantasypl.utils import save_requests_response
+from fantasypl.utils import FPLClient, sync_assets
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
 
 
 def get_kits_and_badges(season: Season) -> None:
     """
     Get FPL kits and team badges.
 
+    Only the graphics that are new or changed on the server are
+    downloaded.
+
     Parameters
     ----------
     season
@@ -30,32 +36,37 @@ def get_kits_and_badges(season: Season) -> None:
     )
     team_codes: list[int] = df_fpl_teams["code"].to_list()
 
-    for code in rich.progress.track(
-        team_codes,
+    assets: list[tuple[str, Path]] = []
+    for code in team_codes:
+        assets += [
+            (
+                f"{FPL_SHIRTS_URL}/shirt_{code}-220.png",
+                RESOURCE_FOLDER
+                / season.folder
+                / "shirts"
+                / f"shirt_{code}.png",
+            ),
+            (
+                f"{FPL_SHIRTS_URL}/shirt_{code}_1-220.png",
+                RESOURCE_FOLDER
+                / season.folder
+                / "shirts"
+                / f"shirt_{code}_gk.png",
+            ),
+            (
+                f"{FPL_BADGES_URL}/t{code}@x2.png",
+                RESOURCE_FOLDER
+                / season.folder
+                / "badges"
+                / f"badge_{code}.png",
+            ),
+        ]
+    sync_assets(
+        FPLClient(season),
+        assets,
+        RESOURCE_FOLDER / season.folder / "assets_manifest.json",
         "Downloading shirt graphics: ",
-    ):
-        url: str = f"{FPL_SHIRTS_URL}/shirt_{code}-220.png"
-        response: requests.Response = requests.get(url, timeout=5)
-        save_requests_response(
-            response,
-            RESOURCE_FOLDER / season.folder / "shirts" / f"shirt_{code}.png",
-        )
-        url = f"{FPL_SHIRTS_URL}/shirt_{code}_1-220.png"
-        response = requests.get(url, timeout=5)
-        save_requests_response(
-            response,
-            RESOURCE_FOLDER
-            / season.folder
-            / "shirts"
-            / f"shirt_{code}_gk.png",
-        )
-        url = f"{FPL_BADGES_URL}/t{code}@x2.png"
-        response = requests.get(url, timeout=5)
-        save_requests_response(
-            response,
-            RESOURCE_FOLDER / season.folder / "badges" / f"badge_{code}.png",
-        )
-    logger.info("All shirt and badge graphics downloaded.")
+    )
 
 
 if __name__ == "__main__":
@@ -1,28 +1,31 @@
 """Functions for getting latest gameweek team and transfers data."""
 
-import requests
 from loguru import logger
 
-from fantasypl.config.constants import FPL_TEAM_URL, MODEL_FOLDER
-from fantasypl.utils import save_json
+from fantasypl.config.constants import MODEL_FOLDER
+from fantasypl.config.schemas import FPLPicks, FPLTransfer, Season, Seasons
+from fantasypl.utils import FPLClient, save_json
 
 
-def get_all_transfers(team_id: int, gameweek: int) -> None:
+def get_all_transfers(season: Season, team_id: int, gameweek: int) -> None:
     """
     Get FPL squad transfers data.
 
     Parameters
     ----------
+    season
+        The season under process.
     team_id
         FPL team ID.
     gameweek
         The gameweek under process.
 
     """
-    url: str = f"{FPL_TEAM_URL}/{team_id}/transfers/"
-    response: requests.Response = requests.get(url, timeout=5)
+    transfers: list[FPLTransfer] = FPLClient(season).get_transfers(
+        team_id, gameweek
+    )
     save_json(
-        response.json(),
+        [transfer.model_dump() for transfer in transfers],
         MODEL_FOLDER
         / "predictions/player"
         / f"gameweek_{gameweek}"
@@ -31,22 +34,23 @@ def get_all_transfers(team_id: int, gameweek: int) -> None:
     logger.info("All transfers downloaded.")
 
 
-def get_current_team(team_id: int, gameweek: int) -> None:
+def get_current_team(season: Season, team_id: int, gameweek: int) -> None:
     """
     Get FPL current squad data.
 
     Parameters
     ----------
+    season
+        The season under process.
     team_id
         FPL team ID.
     gameweek
         The gameweek under process.
 
     """
-    url: str = f"{FPL_TEAM_URL}/{team_id}/event/{gameweek}/picks/"
-    response: requests.Response = requests.get(url, timeout=5)
+    picks: FPLPicks = FPLClient(season).get_picks(team_id, gameweek)
     save_json(
-        response.json(),
+        picks.model_dump(),
         MODEL_FOLDER
         / "predictions/player"
         / f"gameweek_{gameweek}"
@@ -56,5 +60,5 @@ def get_current_team(team_id: int, gameweek: int) -> None:
 
 
 if __name__ == "__main__":
-    get_all_transfers(85599, 6)
-    get_current_team(85599, 5)
+    get_all_transfers(Seasons.SEASON_2425.value, 85599, 6)
+    get_current_team(Seasons.SEASON_2425.value, 85599, 5)
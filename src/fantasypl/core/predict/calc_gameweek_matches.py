@@ -1,8 +1,6 @@
 """Functions to get the matches in the next gameweek(s) to predict for."""
 
-import json
-from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING
 
 import pandas as pd
 from loguru import logger
@@ -12,7 +10,11 @@ from fantasypl.config.constants import (
     MODEL_FOLDER,
 )
 from fantasypl.config.schemas import Season, Seasons
-from fantasypl.utils import get_list_teams, save_pandas
+from fantasypl.utils import get_fpl_table, get_list_teams, save_pandas
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
 
 
 def get_gw_matches(season: Season, gameweek: int) -> None:
@@ -27,12 +29,7 @@ def get_gw_matches(season: Season, gameweek: int) -> None:
         The gameweek under process.
 
     """
-    with Path.open(
-        DATA_FOLDER_FPL / season.folder / "fixtures.json",
-        "r",
-    ) as fl:
-        list_fixtures: list[dict[str, Any]] = json.load(fl)
-    df_fixtures: pd.DataFrame = pd.DataFrame(list_fixtures)[
+    df_fixtures: pd.DataFrame = get_fpl_table(season, "fixtures")[
         ["code", "event", "team_h", "team_a"]
     ]
     df_teams: pd.DataFrame = pd.read_csv(
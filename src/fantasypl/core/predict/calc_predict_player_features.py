@@ -13,7 +13,7 @@ from fantasypl.config.constants import (
     DATA_FOLDER_FPL,
     MODEL_FOLDER,
 )
-from fantasypl.config.schemas import Player, Season, Seasons
+from fantasypl.config.schemas import Season, Seasons
 from fantasypl.core.train.build_features_player import (
     cols_form_for_xassists,
     cols_form_for_xgoals,
@@ -25,7 +25,7 @@ from fantasypl.core.train.build_features_player import (
 from fantasypl.utils import (
     get_list_players,
     get_list_teams,
-    get_player_gameweek_json_to_df,
+    get_player_gameweek_df,
     pad_lists,
     save_pandas,
 )
@@ -143,11 +143,7 @@ def build_predict_features_player(
         validate="m:m",
     )
 
-    df_season: pd.DataFrame = get_player_gameweek_json_to_df(season)
-    df_season["player"] = [
-        Player.model_validate(player).fbref_id
-        for player in df_season["player"]
-    ]
+    df_season: pd.DataFrame = get_player_gameweek_df(season)
 
     unavailable_players: list[str] = list(
         set(df_gameweek["player"]) - set(df_season["player"]),
@@ -14,7 +14,7 @@ from fantasypl.config.constants import (
     MODEL_FOLDER,
     TEAM_PREDICTION_SCALING_FACTORS,
 )
-from fantasypl.config.schemas import Season, Seasons, Team
+from fantasypl.config.schemas import Season, Seasons
 from fantasypl.core.train.build_features_team import (
     cols_form_for_xgoals,
     cols_form_for_xpens,
@@ -25,7 +25,7 @@ from fantasypl.core.train.build_features_team import (
 )
 from fantasypl.utils import (
     get_list_teams,
-    get_team_gameweek_json_to_df,
+    get_team_gameweek_df,
     pad_lists,
     save_pandas,
 )
@@ -62,14 +62,7 @@ def build_predict_features_team(season: Season, gameweek: int) -> pd.DataFrame:
         / f"gameweek_{gameweek}/fixtures.csv",
     )
 
-    df_season: pd.DataFrame = get_team_gameweek_json_to_df(season)
-    df_season["team"] = [
-        Team.model_validate(team).fbref_id for team in df_season["team"]
-    ]
-    df_season["opponent"] = [
-        Team.model_validate(opponent).fbref_id
-        for opponent in df_season["opponent"]
-    ]
+    df_season: pd.DataFrame = get_team_gameweek_df(season)
     df_season = df_season.sort_values(by=["date"], ascending=True)
     df_season = df_season[
         list(
@@ -1,16 +1,22 @@
 """Run all the functions from a single place."""
 
-import json
+from functools import partial
 
 import pandas as pd
 from loguru import logger
 
 from fantasypl.config.schemas import Seasons
+from fantasypl.core.fetch.get_fbref_league_player_season import (
+    get_league_player_season_async,
+)
 from fantasypl.core.fetch.get_fbref_match_links import get_match_links
-from fantasypl.core.fetch.get_fbref_matches import get_matches
-from fantasypl.core.fetch.get_fbref_player_last_season import get_player_season
-from fantasypl.core.fetch.get_fbref_team_matchlogs import get_matchlogs
-from fantasypl.core.fetch.get_fpl_bootstrap import get_bootstrap, get_fixtures
+from fantasypl.core.fetch.get_fbref_matches import get_matches_async
+from fantasypl.core.fetch.get_fbref_team_matchlogs import get_matchlogs_async
+from fantasypl.core.fetch.get_fpl_bootstrap import (
+    get_bootstrap_async,
+    get_fixtures_async,
+)
+from fantasypl.core.fetch.get_fpl_live_points import get_live_points
 from fantasypl.core.fetch.get_fpl_team_data import (
     get_all_transfers,
     get_current_team,
@@ -35,6 +41,16 @@ from fantasypl.core.predict.find_optimal_transfers import (
 from fantasypl.core.predict.process_last_season_player_averages import (
     build_players_features_prediction,
 )
+from fantasypl.core.process.derive_fbref_team_matchlogs import (
+    derive_team_matchlogs,
+)
+from fantasypl.core.process.diff_fpl_bootstrap import (
+    BootstrapDiff,
+    get_bootstrap_diff,
+    get_pending_codes,
+    get_players_to_fetch,
+    save_bootstrap_snapshot,
+)
 from fantasypl.core.process.process_refs_player import get_player_references
 from fantasypl.core.process.save_fbref_agg_player_matchlogs import (
     save_aggregate_player_matchlogs,
@@ -47,6 +63,7 @@ from fantasypl.utils import (
     build_fpl_lineup,
     prepare_pitch,
     prepare_transfers,
+    run_fetch_jobs,
     send_discord_message,
 )
 
@@ -55,29 +72,34 @@ if __name__ == "__main__":
     gameweek: int = int(input("Enter gameweek: "))
     team_id: int = 85599
 
-    get_bootstrap(Seasons.SEASON_2425.value)
-    get_fixtures(Seasons.SEASON_2425.value)
+    run_fetch_jobs(
+        partial(get_bootstrap_async, Seasons.SEASON_2425.value),
+        partial(get_fixtures_async, Seasons.SEASON_2425.value),
+        partial(get_matchlogs_async, Seasons.SEASON_2425.value, derived=True),
+    )
 
+    get_live_points(Seasons.SEASON_2425.value)
     save_players(Seasons.SEASON_2425.value)
-    filter_players: list[str] = json.loads(
-        input("Enter a list of strings of FBRef player IDs to add: ")
-    )
-    get_player_season(
-        Seasons.SEASON_2324.value,
-        filter_players=filter_players,
+    diff: BootstrapDiff = get_bootstrap_diff(Seasons.SEASON_2425.value)
+    filter_players: list[str] = get_players_to_fetch(diff)
+    get_match_links(Seasons.SEASON_2425.value)
+    failed: list[str] = run_fetch_jobs(
+        partial(
+            get_league_player_season_async,
+            Seasons.SEASON_2324.value,
+            filter_players=filter_players,
+        ),
+        partial(get_matches_async, Seasons.SEASON_2425.value),
     )
     get_player_references(Seasons.SEASON_2324.value)
     build_players_features_prediction(
         Seasons.SEASON_2324.value, Seasons.SEASON_2425.value
     )
-
-    get_match_links(Seasons.SEASON_2425.value)
-    last_deadline_date: str = input(
-        "Enter the FPL deadline date for last gameweek: "
+    save_bootstrap_snapshot(
+        Seasons.SEASON_2425.value, get_pending_codes(diff, failed)
     )
-    get_matches(Seasons.SEASON_2425.value, last_deadline_date)
-    get_matchlogs(Seasons.SEASON_2425.value)
 
+    derive_team_matchlogs(Seasons.SEASON_2425.value)
     save_aggregate_team_matchlogs(Seasons.SEASON_2425)
     save_aggregate_player_matchlogs(Seasons.SEASON_2425)
 
@@ -157,8 +179,8 @@ if __name__ == "__main__":
     message: str = "**Optimal Squad**"
     send_discord_message(message, [pitch])
 
-    get_all_transfers(team_id, gameweek)
-    get_current_team(team_id, gameweek - 1)
+    get_all_transfers(Seasons.SEASON_2425.value, team_id, gameweek)
+    get_current_team(Seasons.SEASON_2425.value, team_id, gameweek - 1)
 
     eleven, subs, cap, out, ft, hit = find_optimal_transfers(
         gameweek, Seasons.SEASON_2425.value
@@ -0,0 +1,261 @@
+"""Functions for deriving team matchlogs from the match reports."""
+
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import pandas as pd
+import rich.progress
+from loguru import logger
+
+from fantasypl.config.constants import DATA_FOLDER_FBREF
+from fantasypl.config.schemas import Season, Seasons, Team
+from fantasypl.core.fetch.get_fbref_matches import (
+    get_manifest_fpath,
+    load_match_manifest,
+)
+from fantasypl.utils import get_list_teams, save_json, save_pandas
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+_derived_stats: dict[str, tuple[str, dict[str, str]]] = {
+    "passing": (
+        "passing",
+        {
+            "header_passes_total_passes_completed": (
+                "header_passes_total_passes_completed"
+            ),
+            "progressive_passes": "progressive_passes",
+            "assisted_shots": "assisted_shots",
+            "pass_xa": "pass_xa",
+            "passes_into_final_third": "passes_into_final_third",
+        },
+    ),
+    "gca": (
+        "summary",
+        {
+            "header_sca_sca": "header_sca_types_sca",
+            "header_sca_gca": "header_gca_types_gca",
+        },
+    ),
+    "defense": (
+        "defense",
+        {
+            "header_tackles_tackles_won": "header_tackles_tackles_won",
+            "header_blocks_blocks": "header_blocks_blocks",
+            "interceptions": "interceptions",
+            "clearances": "clearances",
+        },
+    ),
+    "possession": (
+        "summary",
+        {
+            "header_carries_progressive_carries": (
+                "header_carries_progressive_carries"
+            ),
+        },
+    ),
+    "misc": (
+        "misc",
+        {
+            "header_performance_ball_recoveries": (
+                "header_performance_ball_recoveries"
+            ),
+            "header_aerials_aerials_won": "header_aerials_aerials_won",
+            "header_aerials_aerials_lost": "header_aerials_aerials_lost",
+            "header_performance_cards_yellow": (
+                "header_performance_cards_yellow"
+            ),
+            "header_performance_cards_red": "header_performance_cards_red",
+            "header_performance_fouls": "header_performance_fouls",
+            "header_performance_fouled": "header_performance_fouled",
+            "header_performance_pens_conceded": (
+                "header_performance_pens_conceded"
+            ),
+        },
+    ),
+    "keeper": (
+        "keeper",
+        {"header_gk_shot_stopping_gk_saves": "header_performance_gk_saves"},
+    ),
+}
+
+
+def mark_matches_incomplete(
+    season: Season,
+    table: str,
+    df_incomplete: pd.DataFrame,
+) -> None:
+    """
+    Mark the match report tables without the summed columns as empty.
+
+    The matches are then fetched again by the match details fetcher.
+
+    Parameters
+    ----------
+    season
+        The season under process.
+    table
+        The match report table name.
+    df_incomplete
+        The teams, opponents and dates of the incomplete matches.
+
+    """
+    short_names: dict[str, str] = {
+        team.fbref_id: team.short_name for team in get_list_teams()
+    }
+    df_links: pd.DataFrame = pd.read_csv(
+        DATA_FOLDER_FBREF / season.folder / "match_links.csv",
+        dtype=str,
+    )
+    links: dict[tuple[str, str, str], str] = {}
+    home_team: str
+    away_team: str
+    date: str
+    match_link: str
+    for home_team, away_team, date, match_link in df_links[
+        ["home_team", "away_team", "date", "match_link"]
+    ].itertuples(index=False, name=None):
+        links[home_team, away_team, date] = match_link
+        links[away_team, home_team, date] = match_link
+    manifest: dict[str, dict[str, Any]] = load_match_manifest(season)
+    team: str
+    opponent: str
+    for team, opponent, date in (
+        df_incomplete[["team", "opponent", "date"]]
+        .astype(str)
+        .itertuples(index=False, name=None)
+    ):
+        match_link = links.get((team, opponent, date), "")
+        if match_link not in manifest or team not in short_names:
+            continue
+        manifest[match_link]["tables"][f"{short_names[team]}/{table}"] = 0
+    save_json({"matches": manifest}, get_manifest_fpath(season))
+
+
+def get_match_totals(
+    season: Season,
+    table: str,
+    columns: dict[str, str],
+) -> pd.DataFrame:
+    """
+    Sum a match report table over the players of each team and match.
+
+    Match tables saved before a column was available leave it missing
+    instead of zero, and their matches are marked as incomplete in the
+    season manifest.
+
+    Parameters
+    ----------
+    season
+        The season under process.
+    table
+        The match report table name.
+    columns
+        The match report columns to sum and their matchlog names.
+
+    Returns
+    -------
+        A pandas dataframe with one row per team and match.
+
+    """
+    fpaths: list[Path] = sorted(
+        (DATA_FOLDER_FBREF / season.folder / "matches").glob(
+            f"*/{table}.parquet"
+        )
+    )
+    if not fpaths:
+        return pd.DataFrame(columns=["team", "opponent", "date", *columns])
+    df_matches: pd.DataFrame = pd.concat(
+        [pd.read_parquet(fpath) for fpath in fpaths], ignore_index=True
+    )
+    col: str
+    for col in columns:
+        if col not in df_matches.columns:
+            df_matches[col] = np.nan
+    df_totals: pd.DataFrame = df_matches.groupby(
+        ["team", "opponent", "date"], as_index=False
+    )[list(columns)].sum(min_count=1)
+    df_incomplete: pd.DataFrame = df_totals.loc[
+        df_totals[list(columns)].isna().any(axis=1)
+    ]
+    if not df_incomplete.empty:
+        logger.warning(
+            "{} {} tables missing columns for season {}",
+            df_incomplete.shape[0],
+            table,
+            season.fbref_name,
+        )
+        mark_matches_incomplete(season, table, df_incomplete)
+    return df_totals.rename(columns=columns)
+
+
+def derive_team_matchlogs(season: Season) -> None:
+    """
+    Derive the team matchlog CSVs from the match report tables.
+
+    Every stat except the schedule and shooting ones is summed over the
+    player tables of `matches/`, for the team and for its opponents, and
+    saved with the column names of the FBRef matchlog pages.
+
+    Parameters
+    ----------
+    season
+        The season under process.
+
+    """
+    teams: dict[str, Team] = {team.fbref_id: team for team in get_list_teams()}
+    stat: str
+    table: str
+    columns: dict[str, str]
+    for stat, (table, columns) in rich.progress.track(
+        _derived_stats.items(),
+        description="[cyan]Deriving team matchlogs: ",
+    ):
+        df_totals: pd.DataFrame = get_match_totals(season, table, columns)
+        if stat == "misc":
+            df_totals["header_aerials_aerials_won_pct"] = (
+                df_totals["header_aerials_aerials_won"]
+                / df_totals[
+                    [
+                        "header_aerials_aerials_won",
+                        "header_aerials_aerials_lost",
+                    ]
+                ]
+                .sum(axis=1)
+                .replace(0, np.nan)
+                * 100
+            ).round(1)
+        team_id: str
+        for team_id in df_totals["team"].unique():
+            if team_id not in teams:
+                logger.error("{} NOT FOUND!!", team_id)
+                continue
+            side: str
+            key: str
+            for side, key in [("for", "team"), ("against", "opponent")]:
+                df: pd.DataFrame = (
+                    df_totals
+                    .loc[df_totals[key] == team_id]
+                    .drop(columns=["team", "opponent"])
+                    .rename(columns={"date": "header_for_against_date"})
+                    .sort_values("header_for_against_date")
+                )
+                fpath: Path = (
+                    DATA_FOLDER_FBREF
+                    / season.folder
+                    / "team_matchlogs"
+                    / teams[team_id].short_name
+                    / f"{stat}_{side}.csv"
+                )
+                save_pandas(df, fpath)
+    logger.info(
+        "Team matchlogs derived from match reports for Season: {}",
+        season.fbref_name,
+    )
+
+
+if __name__ == "__main__":
+    derive_team_matchlogs(Seasons.SEASON_2425.value)
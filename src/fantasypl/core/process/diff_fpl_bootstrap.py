@@ -0,0 +1,248 @@
+"""Functions for diffing the FPL bootstrap against its last snapshot."""
+
+import json
+import re
+import shutil
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from loguru import logger
+from pydantic import BaseModel
+
+from fantasypl.config.constants import DATA_FOLDER_FPL
+from fantasypl.config.references import FBREF_FPL_PLAYER_REF_DICT
+from fantasypl.config.schemas import Season, Seasons
+from fantasypl.utils import decode_fpl_table, save_json
+
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+class BootstrapDiff(BaseModel):
+    """
+    The BootstrapDiff class.
+
+    Attributes
+    ----------
+        new: FPL codes of the elements missing from the snapshot.
+        transferred: FPL codes of the elements that changed team.
+        removed: FPL codes of the elements missing from the bootstrap.
+        pending: FPL codes left unfetched by the previous run.
+
+    """
+
+    new: list[int] = []
+    transferred: list[int] = []
+    removed: list[int] = []
+    pending: list[int] = []
+
+
+def _read_elements(fpath: Path) -> dict[int, int]:
+    """
+    Read the team of each element of a bootstrap file.
+
+    Parameters
+    ----------
+    fpath
+        The bootstrap file path.
+
+    Returns
+    -------
+        The element team codes keyed by element code, empty if the file
+        does not exist.
+
+    """
+    if not fpath.exists():
+        return {}
+    df_elements: pd.DataFrame = decode_fpl_table(fpath, "elements")
+    return dict(
+        zip(
+            df_elements["code"].tolist(),
+            df_elements["team_code"].tolist(),
+            strict=True,
+        )
+    )
+
+
+def _read_pending(fpath: Path) -> list[int]:
+    """
+    Read the element codes left unfetched by the previous run.
+
+    Parameters
+    ----------
+    fpath
+        The pending codes file path.
+
+    Returns
+    -------
+        The element codes, empty if the file does not exist.
+
+    """
+    if not fpath.exists():
+        return []
+    with Path.open(fpath, encoding="utf-8") as f:
+        return [int(code) for code in json.load(f)["pending"]]
+
+
+def get_bootstrap_diff(season: Season) -> BootstrapDiff:
+    """
+    Compare the current FPL bootstrap with the last processed snapshot.
+
+    Parameters
+    ----------
+    season
+        The season under process.
+
+    Returns
+    -------
+        The new, transferred and removed elements, and the pending ones
+        still in the bootstrap.
+
+    """
+    current: dict[int, int] = _read_elements(
+        DATA_FOLDER_FPL / season.folder / "bootstrap.json"
+    )
+    previous: dict[int, int] = _read_elements(
+        DATA_FOLDER_FPL / season.folder / "bootstrap_snapshot.json"
+    )
+    diff: BootstrapDiff = BootstrapDiff(
+        new=sorted(current.keys() - previous.keys()),
+        transferred=sorted(
+            code
+            for code in current.keys() & previous.keys()
+            if current[code] != previous[code]
+        ),
+        removed=sorted(previous.keys() - current.keys()),
+        pending=sorted(
+            set(
+                _read_pending(
+                    DATA_FOLDER_FPL / season.folder / "bootstrap_pending.json"
+                )
+            )
+            & current.keys()
+        ),
+    )
+    logger.info(
+        "FPL bootstrap diff for season {}: {} new, {} transferred, "
+        "{} removed, {} pending",
+        season.fbref_name,
+        len(diff.new),
+        len(diff.transferred),
+        len(diff.removed),
+        len(diff.pending),
+    )
+    return diff
+
+
+def _get_fbref_ids() -> dict[int, str]:
+    """
+    Get the player FBRef IDs keyed by FPL code.
+
+    Returns
+    -------
+        The player FBRef IDs.
+
+    """
+    return {v: k for k, v in FBREF_FPL_PLAYER_REF_DICT.items()}
+
+
+def get_players_to_fetch(diff: BootstrapDiff) -> list[str]:
+    """
+    Get the FBRef IDs of the new, transferred and pending elements.
+
+    Parameters
+    ----------
+    diff
+        The bootstrap diff.
+
+    Returns
+    -------
+        The player FBRef IDs to fetch.
+
+    """
+    fbref_ids: dict[int, str] = _get_fbref_ids()
+    codes: list[int] = sorted({*diff.new, *diff.transferred, *diff.pending})
+    missing: list[int] = [code for code in codes if code not in fbref_ids]
+    if missing:
+        logger.warning("Players missing in refs: {}", missing)
+    return [fbref_ids[code] for code in codes if code in fbref_ids]
+
+
+def get_pending_codes(diff: BootstrapDiff, failed: list[str]) -> list[int]:
+    """
+    Get the elements of the diff whose players were not fetched.
+
+    These are the elements missing in the player references and the ones
+    whose player page failed. A failed league table page leaves every
+    element of the diff pending.
+
+    Parameters
+    ----------
+    diff
+        The bootstrap diff.
+    failed
+        The URLs the fetch engine gave up on.
+
+    Returns
+    -------
+        The FPL codes to fetch again on the next run.
+
+    """
+    fbref_ids: dict[int, str] = _get_fbref_ids()
+    codes: list[int] = sorted({*diff.new, *diff.transferred, *diff.pending})
+    if any("/comps/" in url for url in failed):
+        return codes
+    failed_ids: set[str] = {
+        player.group(1)
+        for url in failed
+        if (player := re.search(r"/players/(\w+)/", url)) is not None
+    }
+    return [
+        code
+        for code in codes
+        if code not in fbref_ids or fbref_ids[code] in failed_ids
+    ]
+
+
+def save_bootstrap_snapshot(
+    season: Season, pending: list[int] | None = None
+) -> None:
+    """
+    Save the current FPL bootstrap as the snapshot for the next diff.
+
+    The pending elements are saved along so that the next diff returns
+    them again.
+
+    Parameters
+    ----------
+    season
+        The season under process.
+    pending
+        The FPL codes whose players were not fetched.
+
+    """
+    shutil.copyfile(
+        DATA_FOLDER_FPL / season.folder / "bootstrap.json",
+        DATA_FOLDER_FPL / season.folder / "bootstrap_snapshot.json",
+    )
+    save_json(
+        {"pending": pending or []},
+        DATA_FOLDER_FPL / season.folder / "bootstrap_pending.json",
+    )
+    if pending:
+        logger.warning(
+            "{} FPL elements left pending for the next run: {}",
+            len(pending),
+            pending,
+        )
+    logger.info(
+        "FPL bootstrap snapshot saved for season {}", season.fbref_name
+    )
+
+
+if __name__ == "__main__":
+    logger.info(
+        "Players to fetch: {}",
+        get_players_to_fetch(get_bootstrap_diff(Seasons.SEASON_2425.value)),
+    )
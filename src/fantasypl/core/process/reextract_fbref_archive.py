@@ -0,0 +1,277 @@
+"""Functions for regenerating FBRef tables from the page archive."""
+
+import re
+from collections.abc import Callable
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+import rich.progress
+from loguru import logger
+
+from fantasypl.config.constants import DATA_FOLDER_FBREF
+from fantasypl.config.schemas import Season, Seasons, Team
+from fantasypl.core.fetch.get_fbref_matches import (
+    get_manifest_fpath,
+    get_match_url,
+    load_match_manifest,
+    parse_match_page,
+    save_match_tables,
+    update_match_manifest,
+)
+from fantasypl.core.fetch.get_fbref_player_last_season import (
+    parse_player_page,
+    save_player_season,
+)
+from fantasypl.core.fetch.get_fbref_team_matchlogs import (
+    get_stat_tables,
+    parse_matchlog_page,
+)
+from fantasypl.core.process.derive_fbref_team_matchlogs import (
+    derive_team_matchlogs,
+)
+from fantasypl.utils import (
+    ArchivedPage,
+    get_list_teams,
+    iter_archived_pages,
+    read_archived_page,
+    save_json,
+    save_pandas,
+)
+
+
+ArchiveJob = tuple[Callable[[str], Any], Callable[[Any], None], ArchivedPage]
+"""
+A parse function run in a worker process, a save function run in the
+main process on its result, and the archived page they work on.
+"""
+
+
+def _save_tables(results: list[tuple[pd.DataFrame, Path]]) -> None:
+    """
+    Save parsed tables to their files.
+
+    Parameters
+    ----------
+    results
+        The tables with their file save paths.
+
+    """
+    df: pd.DataFrame
+    fpath: Path
+    for df, fpath in results:
+        save_pandas(df, fpath)
+
+
+def _save_match(
+    manifest: dict[str, dict[str, Any]],
+    match_link: str,
+    results: list[tuple[pd.DataFrame, Path]],
+) -> None:
+    """
+    Save the parsed tables of a match and record them in the manifest.
+
+    Parameters
+    ----------
+    manifest
+        The match fetch manifest of the season, updated in place and
+        saved once all the pages are re-extracted.
+    match_link
+        The match link from the season schedule.
+    results
+        The tables of the match with their file save paths.
+
+    """
+    save_match_tables(results)
+    update_match_manifest(manifest, match_link, results)
+
+
+def _save_player(
+    season: Season,
+    player_id: str,
+    parsed: tuple[dict[str, str], list[tuple[pd.DataFrame, Path]]],
+) -> None:
+    """
+    Save the parsed details and tables of a player page.
+
+    Parameters
+    ----------
+    season
+        The season under process.
+    player_id
+        The player FBRef ID.
+    parsed
+        The player details and tables.
+
+    """
+    if parsed[0]:
+        save_player_season(season, player_id, *parsed)
+
+
+def _parse_job(
+    parse: Callable[[str], Any],
+    entry: ArchivedPage,
+) -> Any:  # noqa: ANN401
+    """
+    Run a parse function on an archived page in a worker process.
+
+    Parameters
+    ----------
+    parse
+        The parse function taking the page contents.
+    entry
+        The archive entry of the page.
+
+    Returns
+    -------
+        The parsed result.
+
+    """
+    return parse(read_archived_page(entry))
+
+
+def _get_jobs(
+    season: Season,
+    stats: list[str],
+    pages: dict[str, ArchivedPage],
+    manifest: dict[str, dict[str, Any]],
+) -> list[ArchiveJob]:
+    """
+    Match the archived pages of a season with their parse and save jobs.
+
+    Parameters
+    ----------
+    season
+        The season under process.
+    stats
+        The folders to regenerate.
+    pages
+        The latest archive entries keyed by URL.
+    manifest
+        The match fetch manifest of the season, updated in place by the
+        match save jobs.
+
+    Returns
+    -------
+        The jobs with the archive entries they run on.
+
+    """
+    jobs: list[ArchiveJob] = []
+    if "matches" in stats:
+        df_links: pd.DataFrame = pd.read_csv(
+            DATA_FOLDER_FBREF / season.folder / "match_links.csv",
+        )
+        rows: list[tuple[str, str, str, str]] = list(
+            df_links[["home_team", "away_team", "date", "match_link"]]
+            .astype(str)
+            .itertuples(index=False, name=None)
+        )
+        jobs.extend(
+            (
+                partial(parse_match_page, season, row),
+                partial(_save_match, manifest, row[3]),
+                pages[get_match_url(row[3])],
+            )
+            for row in rows
+            if get_match_url(row[3]) in pages
+        )
+    if "team_matchlogs" in stats:
+        teams: dict[str, Team] = {
+            team.fbref_id: team for team in get_list_teams()
+        }
+        pattern: re.Pattern[str] = re.compile(
+            rf"/squads/(\w+)/{season.fbref_long_name}/matchlogs/c9/(\w+)/$"
+        )
+        stat_tables: list[str] = get_stat_tables(derived=True)
+        url: str
+        entry: ArchivedPage
+        for url, entry in pages.items():
+            match: re.Match[str] | None = pattern.search(url)
+            if (
+                match is not None
+                and match.group(1) in teams
+                and match.group(2) in stat_tables
+            ):
+                jobs.append((
+                    partial(
+                        parse_matchlog_page,
+                        season,
+                        teams[match.group(1)],
+                        match.group(2),
+                    ),
+                    _save_tables,
+                    entry,
+                ))
+    if "player_season" in stats:
+        for url, entry in pages.items():
+            player: re.Match[str] | None = re.search(r"/players/(\w+)/$", url)
+            if player is not None:
+                jobs.append((
+                    partial(parse_player_page, season, player.group(1)),
+                    partial(_save_player, season, player.group(1)),
+                    entry,
+                ))
+    return jobs
+
+
+def reextract_season(
+    season: Season,
+    stats: list[str] | None = None,
+    max_workers: int | None = None,
+) -> None:
+    """
+    Regenerate the FBRef tables of a season from the page archive.
+
+    Only the team matchlogs that cannot be derived are re-extracted, the
+    others are derived again from the match reports afterwards.
+
+    Parameters
+    ----------
+    season
+        The season under process.
+    stats
+        The folders to regenerate, out of `matches`, `team_matchlogs`
+        and `player_season`. All of them by default.
+    max_workers
+        Number of worker processes, the CPU count by default.
+
+    """
+    if stats is None:
+        stats = ["matches", "team_matchlogs", "player_season"]
+    pages: dict[str, ArchivedPage] = {
+        entry.url: entry
+        for entry in iter_archived_pages(r"^https://fbref\.com/")
+    }
+    manifest: dict[str, dict[str, Any]] = load_match_manifest(season)
+    jobs: list[ArchiveJob] = _get_jobs(season, stats, pages, manifest)
+    logger.info(
+        "Re-extracting {} archived pages for season {}",
+        len(jobs),
+        season.fbref_name,
+    )
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures: dict[Future[Any], Callable[[Any], None]] = {
+            executor.submit(_parse_job, parse, entry): save
+            for parse, save, entry in jobs
+        }
+        future: Future[Any]
+        for future in rich.progress.track(
+            as_completed(futures),
+            total=len(futures),
+            description="[cyan]Re-extracting FBRef pages: ",
+        ):
+            futures[future](future.result())
+    if "matches" in stats:
+        save_json({"matches": manifest}, get_manifest_fpath(season))
+    if "team_matchlogs" in stats:
+        derive_team_matchlogs(season)
+    logger.info("Re-extraction completed for season {}", season.fbref_name)
+
+
+if __name__ == "__main__":
+    reextract_season(Seasons.SEASON_2324.value, stats=["player_season"])
+    reextract_season(
+        Seasons.SEASON_2425.value, stats=["matches", "team_matchlogs"]
+    )
@@ -1,6 +1,5 @@
 """Functions for creating player matchlogs for entire season."""
 
-import os
 from functools import reduce
 from typing import TYPE_CHECKING, Literal
 
@@ -23,8 +22,10 @@ from fantasypl.utils import (
     get_fbref_teams,
     get_list_players,
     get_list_teams,
-    get_team_gameweek_json_to_df,
-    save_json,
+    get_team_gameweek_df,
+    load_match_table,
+    save_parquet,
+    validate_frame,
 )
 
 
@@ -54,7 +55,7 @@ def filter_minutes(group: pd.DataFrame) -> pd.DataFrame:
 def process_single_team(  # noqa: PLR0914, PLR0915
     team: Team,
     season: Season,
-) -> list[dict[str, PlayerGameWeek]]:
+) -> pd.DataFrame:
     """
     Return player gameweeks data for a single team.
 
@@ -67,33 +68,21 @@ def process_single_team(  # noqa: PLR0914, PLR0915
 
     Returns
     -------
-        A list containing all players' gameweek data for the team.
+        A pandas dataframe with all players' gameweek data for the team,
+        with the player and team FBRef IDs.
 
     """
-    list_files: list[str] = next(
-        iter(
-            os.walk(
-                DATA_FOLDER_FBREF
-                / season.folder
-                / "matches"
-                / team.short_name,
-            ),
-        ),
-    )[2]
     dfs_summary: list[pd.DataFrame] = []
     dfs_passing: list[pd.DataFrame] = []
     dfs_defense: list[pd.DataFrame] = []
     dfs_misc: list[pd.DataFrame] = []
     dfs_keeper: list[pd.DataFrame] = []
 
-    for fl in list_files:
-        df_stats: pd.DataFrame = pd.read_csv(
-            DATA_FOLDER_FBREF
-            / season.folder
-            / "matches"
-            / team.short_name
-            / fl,
-        )
+    fl: str
+    for fl in ["summary", "passing", "defense", "misc", "keeper"]:
+        df_stats: pd.DataFrame = load_match_table(season, team.short_name, fl)
+        if df_stats.empty:
+            continue
         df_stats["starts"] = np.where(
             df_stats["player"].str.contains("\xa0"),
             0,
@@ -102,7 +91,7 @@ def process_single_team(  # noqa: PLR0914, PLR0915
         df_stats["player"] = df_stats["player"].str.strip()
         _join_cols: list[str] = ["player", "date", "venue"]
         match fl:
-            case fl if "summary" in fl:
+            case "summary":
                 df_stats["short_position"] = (
                     df_stats["position"]
                     .str.split(",")
@@ -142,7 +131,7 @@ def process_single_team(  # noqa: PLR0914, PLR0915
                     ]
                 ]
                 dfs_summary.append(df_stats)
-            case fl if "passing" in fl:
+            case "passing":
                 df_stats = df_stats.rename(
                     columns={"assisted_shots": "key_passes"},
                 )
@@ -155,7 +144,7 @@ def process_single_team(  # noqa: PLR0914, PLR0915
                     ]
                 ]
                 dfs_passing.append(df_stats)
-            case fl if "defense" in fl:
+            case "defense":
                 df_stats = df_stats.rename(
                     columns={
                         "header_tackles_tackles_won": "tackles_won",
@@ -172,13 +161,13 @@ def process_single_team(  # noqa: PLR0914, PLR0915
                     ]
                 ]
                 dfs_defense.append(df_stats)
-            case fl if "misc" in fl:
+            case "misc":
                 df_stats = df_stats.rename(
                     columns={"header_performance_fouls": "fouls"},
                 )
                 df_stats = df_stats[[*_join_cols, "fouls"]]
                 dfs_misc.append(df_stats)
-            case fl if "keeper" in fl:
+            case "keeper":
                 df_stats = df_stats.rename(
                     columns={
                         "header_gk_shot_stopping_gk_saves": "gk_saves",
@@ -187,8 +176,6 @@ def process_single_team(  # noqa: PLR0914, PLR0915
                 )
                 df_stats = df_stats[[*_join_cols, "gk_saves", "gk_psxg"]]
                 dfs_keeper.append(df_stats)
-            case _:
-                logger.error("Untracked file: {}", fl)
 
     df_summary: pd.DataFrame = (
         pd.concat(dfs_summary, ignore_index=True)
@@ -223,10 +210,10 @@ def process_single_team(  # noqa: PLR0914, PLR0915
         ),
         [df_summary, df_passing, df_defense, df_misc, df_keeper],
     )
-    df_team_gw: pd.DataFrame = get_team_gameweek_json_to_df(season)
+    df_team_gw: pd.DataFrame = get_team_gameweek_df(season)
     df_team_gw["date"] = df_team_gw["date"].astype(str)
     df_dates: pd.DataFrame = df_team_gw.loc[
-        df_team_gw["team"] == Team.model_dump(team),
+        df_team_gw["team"] == team.fbref_id,
         ["date", "venue"],
     ]
     df_ids: pd.DataFrame = pd.DataFrame({
@@ -252,18 +239,10 @@ def process_single_team(  # noqa: PLR0914, PLR0915
         .apply(filter_minutes, include_groups=False)
         .reset_index(level="player")
     )
-    df_final["player"] = [
-        {p.fbref_name: p for p in get_list_players()}.get(p)
-        for p in df_final["player"]
-    ]
-    return [
-        PlayerGameWeek.model_validate({
-            "team": team,
-            "season": season.fbref_long_name,
-            **row,
-        }).model_dump()
-        for row in df_final.to_dict(orient="records")
-    ]
+    df_final["player"] = df_final["player"].map({
+        p.fbref_name: p.fbref_id for p in get_list_players()
+    })
+    return df_final.assign(team=team.fbref_id, season=season.fbref_long_name)
 
 
 def save_aggregate_player_matchlogs(
@@ -278,21 +257,20 @@ def save_aggregate_player_matchlogs(
         The season under process.
 
     """
-    dfs: list[dict[str, PlayerGameWeek]] = []
+    dfs: list[pd.DataFrame] = []
     _teams: list[str] = get_fbref_teams(season.value)
     for team_name in rich.progress.track(_teams):
         team: Team = next(
             el for el in get_list_teams() if el.fbref_name == team_name
         )
-        df_temp: list[dict[str, PlayerGameWeek]] = process_single_team(
-            team,
-            season.value,
-        )
-        dfs += df_temp
+        dfs.append(process_single_team(team, season.value))
     fpath: Path = (
-        DATA_FOLDER_FBREF / season.value.folder / "player_matchlogs.json"
+        DATA_FOLDER_FBREF / season.value.folder / "player_matchlogs.parquet"
+    )
+    save_parquet(
+        validate_frame(pd.concat(dfs, ignore_index=True), PlayerGameWeek),
+        fpath,
     )
-    save_json({"player_matchlogs": dfs}, fpath=fpath, default=str)
     logger.info(
         "Player matchlogs saved for all clubs from Season: {}",
         season.value.fbref_name,
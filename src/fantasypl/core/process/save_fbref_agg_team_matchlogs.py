@@ -12,7 +12,12 @@ from fantasypl.config.constants import (
     DATA_FOLDER_FBREF,
 )
 from fantasypl.config.schemas import Season, Seasons, Team, TeamGameweek
-from fantasypl.utils import get_fbref_teams, get_list_teams, save_json
+from fantasypl.utils import (
+    get_fbref_teams,
+    get_list_teams,
+    save_parquet,
+    validate_frame,
+)
 
 
 def process_single_stat(
@@ -52,7 +57,7 @@ def process_single_stat(
 def process_single_team(
     team_short_name: str,
     season: Season,
-) -> list[dict[str, TeamGameweek]]:
+) -> pd.DataFrame:
     """
     Return team gameweeks data for a single team.
 
@@ -65,7 +70,8 @@ def process_single_team(
 
     Returns
     -------
-        A list containing teams' gameweek data for the team.
+        A pandas dataframe with the team gameweek data, with the team
+        and opponent FBRef IDs.
 
     """
     folder_structure: Path = (
@@ -249,19 +255,11 @@ def process_single_team(
     team: Team = next(
         el for el in get_list_teams() if el.short_name == team_short_name
     )
-    df_team_gw["opponent"] = [
-        {t.fbref_name: t for t in get_list_teams()}.get(t)
-        for t in df_team_gw["opponent"]
-    ]
+    df_team_gw["opponent"] = df_team_gw["opponent"].map({
+        t.fbref_name: t.fbref_id for t in get_list_teams()
+    })
     df_team_gw = df_team_gw.sort_values(by="date", ascending=True)
-    return [
-        TeamGameweek.model_validate({
-            "team": team,
-            "season": season.fbref_long_name,
-            **row,
-        }).model_dump()
-        for row in df_team_gw.to_dict(orient="records")
-    ]
+    return df_team_gw.assign(team=team.fbref_id, season=season.fbref_long_name)
 
 
 def save_aggregate_team_matchlogs(
@@ -276,21 +274,20 @@ def save_aggregate_team_matchlogs(
         The season under process.
 
     """
-    dfs: list[dict[str, TeamGameweek]] = []
+    dfs: list[pd.DataFrame] = []
     _teams: list[str] = get_fbref_teams(season.value)
     for team_name in rich.progress.track(_teams):
         team: Team = next(
             el for el in get_list_teams() if el.fbref_name == team_name
         )
-        df_temp: list[dict[str, TeamGameweek]] = process_single_team(
-            team.short_name,
-            season.value,
-        )
-        dfs += df_temp
+        dfs.append(process_single_team(team.short_name, season.value))
     fpath: Path = (
-        DATA_FOLDER_FBREF / season.value.folder / "team_matchlogs.json"
+        DATA_FOLDER_FBREF / season.value.folder / "team_matchlogs.parquet"
+    )
+    save_parquet(
+        validate_frame(pd.concat(dfs, ignore_index=True), TeamGameweek),
+        fpath,
     )
-    save_json({"team_matchlogs": dfs}, fpath=fpath, default=str)
     logger.info(
         "Team matchlogs saved for all clubs from Season: {}",
         season.value.fbref_name,
@@ -1,16 +1,19 @@
 """Functions for creating teams and players dataframes from FPL API data."""
 
-import json
-from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING
 
-import pandas as pd
 from loguru import logger
 
 from fantasypl.config.constants import DATA_FOLDER_FPL
 from fantasypl.config.references import FBREF_FPL_PLAYER_REF_DICT
 from fantasypl.config.schemas import Season, Seasons
-from fantasypl.utils import save_pandas
+from fantasypl.utils import get_fpl_table, save_pandas
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import pandas as pd
 
 
 _cols_teams: list[str] = ["id", "code", "name", "short_name"]
@@ -43,17 +46,10 @@ def save_teams(season: Season) -> None:
         The season under process.
 
     """
-    with Path.open(
-        DATA_FOLDER_FPL / season.folder / "bootstrap.json",
-        "r",
-    ) as f:
-        list_teams_dicts: list[dict[str, Any]] | None = json.load(f).get(
-            "teams",
-        )
-    if not list_teams_dicts:
+    df_teams: pd.DataFrame = get_fpl_table(season, "teams")
+    if df_teams.empty:
         logger.error("The key `team` not present in FPL bootstrap")
         return
-    df_teams: pd.DataFrame = pd.DataFrame(list_teams_dicts)
     df_teams = df_teams[_cols_teams]
     fpath: Path = DATA_FOLDER_FPL / season.folder / "teams.csv"
     save_pandas(df=df_teams, fpath=fpath)
@@ -69,17 +65,10 @@ def save_players(season: Season) -> None:
         The season under process.
 
     """
-    with Path.open(
-        DATA_FOLDER_FPL / season.folder / "bootstrap.json",
-        "r",
-    ) as f:
-        list_players_dicts: list[dict[str, Any]] | None = json.load(f).get(
-            "elements",
-        )
-    if not list_players_dicts:
+    df_players: pd.DataFrame = get_fpl_table(season, "elements")
+    if df_players.empty:
         logger.error("The key `elements` not present in FPL bootstrap")
         return
-    df_players: pd.DataFrame = pd.DataFrame(list_players_dicts)
     df_players["full_name"] = (
         df_players["first_name"] + " " + df_players["second_name"]
     )
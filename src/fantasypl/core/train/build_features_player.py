@@ -9,7 +9,7 @@ from fantasypl.config.constants import DATA_FOLDER_FBREF
 from fantasypl.config.schemas import Season, Seasons
 from fantasypl.utils import (
     get_form_data,
-    get_player_gameweek_json_to_df,
+    get_player_gameweek_df,
     save_pandas,
 )
 
@@ -108,9 +108,7 @@ def get_players_training_data(season: Season) -> None:
         The season under process.
 
     """
-    player_df: pd.DataFrame = get_player_gameweek_json_to_df(season)
-    player_df["player"] = [player.fbref_id for player in player_df["player"]]
-    player_df["team"] = [team.fbref_id for team in player_df["team"]]
+    player_df: pd.DataFrame = get_player_gameweek_df(season)
 
     save_player_joined_df(
         data=player_df,
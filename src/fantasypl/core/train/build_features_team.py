@@ -1,6 +1,6 @@
 """Functions for creating features for team schemas."""
 
-from functools import reduce
+from functools import partial, reduce
 from typing import TYPE_CHECKING, Literal
 
 import pandas as pd
@@ -9,9 +9,11 @@ from loguru import logger
 from fantasypl.config.constants import DATA_FOLDER_FBREF
 from fantasypl.config.schemas import Season, Seasons
 from fantasypl.utils import (
+    connect_analytics_store,
     get_form_data,
     get_static_data,
-    get_team_gameweek_json_to_df,
+    get_team_gameweek_df,
+    get_window_features,
     save_pandas,
 )
 
@@ -19,6 +21,8 @@ from fantasypl.utils import (
 if TYPE_CHECKING:
     from pathlib import Path
 
+    from duckdb import DuckDBPyConnection
+
 
 cols_form_for_xgoals: list[str] = [
     "possession",
@@ -62,12 +66,14 @@ cols_form_for_xpens: list[str] = ["pens_won", "pens_scored"]
 cols_static_against_xpens: list[str] = ["pens_conceded"]
 
 
-def get_groups(
+def get_groups(  # noqa: PLR0913, PLR0917
     data: pd.DataFrame,
     cols_form: list[str],
     cols_static: list[str],
     team_or_opponent: Literal["team", "opponent"],
     for_or_opp: Literal["for", "opp"],
+    season: Season,
+    con: "DuckDBPyConnection | None" = None,
 ) -> tuple[pd.DataFrame, pd.DataFrame]:
     """
     Calculate lagged and aggregated features for team model.
@@ -84,6 +90,11 @@ def get_groups(
         Building features for team/opponent.
     for_or_opp
         Adding suffix for/opp.
+    season
+        The season under process.
+    con
+        The analytics store connection to compute the features in, or
+        None to compute them with pandas.
 
     Returns
     -------
@@ -91,11 +102,34 @@ def get_groups(
         and aggregated features.
 
     """
-    grouped_form_df: pd.DataFrame = get_form_data(
-        data=data,
-        cols=cols_form,
-        team_or_player=team_or_opponent,
-    )
+    grouped_form_df: pd.DataFrame
+    grouped_static_df: pd.DataFrame
+    if con is not None:
+        df_features: pd.DataFrame = get_window_features(
+            con,
+            "team_gameweek",
+            season,
+            cols_form,
+            cols_static,
+            team_or_opponent,
+        )
+        grouped_form_df = df_features.drop(
+            columns=[col for col in df_features.columns if "_mean" in col]
+        )
+        grouped_static_df = df_features.drop(
+            columns=[col for col in df_features.columns if "_lag_" in col]
+        )
+    else:
+        grouped_form_df = get_form_data(
+            data=data,
+            cols=cols_form,
+            team_or_player=team_or_opponent,
+        )
+        grouped_static_df = get_static_data(
+            data=data,
+            cols=cols_static,
+            team_or_player=team_or_opponent,
+        )
     grouped_form_df = grouped_form_df.rename(
         columns={
             **{
@@ -105,11 +139,6 @@ def get_groups(
             },
         },
     )
-    grouped_static_df: pd.DataFrame = get_static_data(
-        data=data,
-        cols=cols_static,
-        team_or_player=team_or_opponent,
-    )
     grouped_static_df = grouped_static_df.rename(
         columns={
             **{
@@ -190,7 +219,7 @@ def save_joined_df(  # noqa: PLR0913, PLR0917
     logger.info("Features saved for Team {}", stat)
 
 
-def get_features(season: Season) -> None:
+def get_features(season: Season, *, use_store: bool = False) -> None:
     """
     Calculate team models features.
 
@@ -198,41 +227,43 @@ def get_features(season: Season) -> None:
     ----------
     season
         The season under process
+    use_store
+        Boolean value for whether the lagged and aggregated features are
+        computed in the analytics store, which must include the season.
 
     """
-    team_df: pd.DataFrame = get_team_gameweek_json_to_df(season)
-    team_df["team"] = [team.fbref_id for team in team_df["team"]]
-    team_df["opponent"] = [
-        opponent.fbref_id for opponent in team_df["opponent"]
-    ]
-
-    save_joined_df(
-        team_df,
-        season,
-        *get_groups(team_df, cols_form_for_xgoals, [], "team", "for"),
-        *get_groups(
-            team_df,
-            [],
-            cols_static_against_xgoals,
-            "opponent",
-            "opp",
-        ),
-        stat="xgoals",
-    )
-    save_joined_df(
-        team_df,
-        season,
-        *get_groups(team_df, cols_form_for_xyc, [], "team", "for"),
-        *get_groups(team_df, [], cols_static_against_xyc, "opponent", "opp"),
-        stat="xyc",
+    team_df: pd.DataFrame = get_team_gameweek_df(season)
+    con: DuckDBPyConnection | None = (
+        connect_analytics_store(read_only=True) if use_store else None
     )
-    save_joined_df(
-        team_df,
-        season,
-        *get_groups(team_df, cols_form_for_xpens, [], "team", "for"),
-        *get_groups(team_df, [], cols_static_against_xpens, "opponent", "opp"),
-        stat="xpens",
+    groups: partial[tuple[pd.DataFrame, pd.DataFrame]] = partial(
+        get_groups, team_df, season=season, con=con
     )
+    try:
+        save_joined_df(
+            team_df,
+            season,
+            *groups(cols_form_for_xgoals, [], "team", "for"),
+            *groups([], cols_static_against_xgoals, "opponent", "opp"),
+            stat="xgoals",
+        )
+        save_joined_df(
+            team_df,
+            season,
+            *groups(cols_form_for_xyc, [], "team", "for"),
+            *groups([], cols_static_against_xyc, "opponent", "opp"),
+            stat="xyc",
+        )
+        save_joined_df(
+            team_df,
+            season,
+            *groups(cols_form_for_xpens, [], "team", "for"),
+            *groups([], cols_static_against_xpens, "opponent", "opp"),
+            stat="xpens",
+        )
+    finally:
+        if con is not None:
+            con.close()
 
 
 if __name__ == "__main__":
@@ -6,7 +6,7 @@ from loguru import logger
 from fantasypl.config.constants import DATA_FOLDER_FBREF
 from fantasypl.config.schemas import Season, Seasons
 from fantasypl.utils import (
-    get_team_gameweek_json_to_df,
+    get_team_gameweek_df,
     preprocess_data_and_save,
 )
 
@@ -40,8 +40,7 @@ def build_split_player(
         / f"player_{target_name}_features.csv",
     )
     if target_name == "xsaves":
-        team_df: pd.DataFrame = get_team_gameweek_json_to_df(season)
-        team_df["team"] = [team.fbref_id for team in team_df["team"]]
+        team_df: pd.DataFrame = get_team_gameweek_df(season)
         team_df["date"] = team_df["date"].astype(str)
         team_df = team_df[["team", "date", "npxg_vs"]]
         df_features = df_features.merge(
@@ -1,14 +1,37 @@
 """Exposes all the inner constants for a folder level import."""
 
+from .analytics_helper import (
+    build_analytics_store,
+    connect_analytics_store,
+    get_window_features,
+)
+from .archive_helper import (
+    ArchivedPage,
+    iter_archived_pages,
+    read_archived_page,
+)
+from .asset_helper import sync_assets
+from .cache_helper import (
+    invalidate_cached_response,
+    is_offline_mode,
+    set_offline_mode,
+)
+from .fetch_helper import (
+    FetchEngine,
+    FetchJob,
+    run_fetch_jobs,
+    run_pipeline,
+)
+from .fpl_helper import FPLClient, decode_fpl_table, get_fpl_table
 from .image_helper import prepare_pitch, prepare_transfers
 from .modeling_helper import (
     get_fbref_teams,
     get_form_data,
     get_list_players,
     get_list_teams,
-    get_player_gameweek_json_to_df,
+    get_player_gameweek_df,
     get_static_data,
-    get_team_gameweek_json_to_df,
+    get_team_gameweek_df,
     get_train_test_data,
     preprocess_data_and_save,
 )
@@ -25,29 +48,67 @@ from .prediction_helper import (
     send_discord_message,
 )
 from .save_helper import (
+    BackgroundWriter,
+    append_parquet,
+    get_match_table_fpath,
+    load_match_table,
     save_json,
+    save_npy_bundle,
     save_pandas,
+    save_parquet,
     save_pkl,
     save_requests_response,
+    write_atomically,
+)
+from .validation_helper import (
+    get_frame_errors,
+    get_row_errors,
+    validate_frame,
+)
+from .web_helper import (
+    extract_table,
+    extract_tables,
+    get_content,
+    get_single_table,
+    iter_elements_by_id,
 )
-from .web_helper import extract_table, get_content, get_single_table
 
 
 __all__ = [
+    "ArchivedPage",
+    "BackgroundWriter",
+    "FPLClient",
+    "FetchEngine",
+    "FetchJob",
     "add_count_constraints",
     "add_other_constraints",
+    "append_parquet",
+    "build_analytics_store",
     "build_fpl_lineup",
+    "connect_analytics_store",
+    "decode_fpl_table",
     "extract_table",
+    "extract_tables",
     "get_content",
     "get_fbref_teams",
     "get_form_data",
+    "get_fpl_table",
+    "get_frame_errors",
     "get_list_players",
     "get_list_teams",
-    "get_player_gameweek_json_to_df",
+    "get_match_table_fpath",
+    "get_player_gameweek_df",
+    "get_row_errors",
     "get_single_table",
     "get_static_data",
-    "get_team_gameweek_json_to_df",
+    "get_team_gameweek_df",
     "get_train_test_data",
+    "get_window_features",
+    "invalidate_cached_response",
+    "is_offline_mode",
+    "iter_archived_pages",
+    "iter_elements_by_id",
+    "load_match_table",
     "pad_lists",
     "prepare_additional_lp_variables",
     "prepare_common_lists_from_df",
@@ -57,9 +118,18 @@ __all__ = [
     "prepare_return_and_log_variables",
     "prepare_transfers",
     "preprocess_data_and_save",
+    "read_archived_page",
+    "run_fetch_jobs",
+    "run_pipeline",
     "save_json",
+    "save_npy_bundle",
     "save_pandas",
+    "save_parquet",
     "save_pkl",
     "save_requests_response",
     "send_discord_message",
+    "set_offline_mode",
+    "sync_assets",
+    "validate_frame",
+    "write_atomically",
 ]
@@ -0,0 +1,293 @@
+"""Helper functions for the optional DuckDB store of all season data."""
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Literal
+
+import pandas as pd
+from loguru import logger
+
+from fantasypl.config.constants import (
+    ANALYTICS_DB_PATH,
+    DATA_FOLDER_CACHE,
+    DATA_FOLDER_FBREF,
+    DATA_FOLDER_FPL,
+    MODEL_FOLDER,
+)
+from fantasypl.config.schemas import Season, Seasons
+from fantasypl.utils.fpl_helper import get_fpl_table
+
+
+try:
+    import duckdb
+except ImportError:  # pragma: no cover
+    duckdb = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from duckdb import DuckDBPyConnection
+
+
+def _quote(value: str) -> str:
+    """
+    Quote a string as a SQL literal.
+
+    Parameters
+    ----------
+    value
+        The string to quote.
+
+    Returns
+    -------
+        The SQL string literal.
+
+    """
+    return "'" + value.replace("'", "''") + "'"
+
+
+def connect_analytics_store(
+    *, read_only: bool = False
+) -> "DuckDBPyConnection":
+    """
+    Connect to the local analytics store.
+
+    DuckDB runs queries on all the cores and spills to the cache folder
+    when a query does not fit in memory.
+
+    Parameters
+    ----------
+    read_only
+        Boolean value for whether the store is opened read-only.
+
+    Returns
+    -------
+        The DuckDB connection.
+
+    Raises
+    ------
+    ImportError
+        If DuckDB is not installed.
+
+    """
+    if duckdb is None:
+        msg: str = (
+            "The analytics store needs DuckDB, "
+            "install it with the `analytics` extra."
+        )
+        raise ImportError(msg)
+    Path.mkdir(ANALYTICS_DB_PATH.parent, parents=True, exist_ok=True)
+    return duckdb.connect(
+        ANALYTICS_DB_PATH,
+        read_only=read_only,
+        config={"temp_directory": str(DATA_FOLDER_CACHE / "duckdb")},
+    )
+
+
+def _create_parquet_view(
+    con: "DuckDBPyConnection",
+    name: str,
+    fpaths: list[Path],
+) -> None:
+    """
+    Create a view over a set of Parquet files.
+
+    The position of each row in its file is kept as `file_row_number`,
+    so that queries can order rows like the pandas reads of the file.
+
+    Parameters
+    ----------
+    con
+        The DuckDB connection.
+    name
+        The view name.
+    fpaths
+        The Parquet files, the view is dropped if there are none.
+
+    """
+    if not fpaths:
+        con.execute(f"DROP VIEW IF EXISTS {name}")
+        return
+    files: str = ", ".join(_quote(fpath.as_posix()) for fpath in fpaths)
+    con.execute(
+        f"CREATE OR REPLACE VIEW {name} AS "  # noqa: S608
+        f"SELECT * FROM read_parquet([{files}], union_by_name = true, "
+        "file_row_number = true)"
+    )
+
+
+def build_analytics_store(seasons: list[Season]) -> None:
+    """
+    Populate the analytics store from the saved season data.
+
+    The `team_gameweek` and `player_gameweek` views read the matchlog
+    Parquet files in place and `predictions` reads the expected points
+    of every predicted gameweek, so they follow the files without being
+    rebuilt. The `fixtures` table is a typed copy of the FPL fixtures.
+
+    Parameters
+    ----------
+    seasons
+        The seasons to include.
+
+    """
+    con: DuckDBPyConnection = connect_analytics_store()
+    try:
+        _create_parquet_view(
+            con,
+            "team_gameweek",
+            [
+                fpath
+                for season in seasons
+                if (
+                    fpath := DATA_FOLDER_FBREF
+                    / season.folder
+                    / "team_matchlogs.parquet"
+                ).exists()
+            ],
+        )
+        _create_parquet_view(
+            con,
+            "player_gameweek",
+            [
+                fpath
+                for season in seasons
+                if (
+                    fpath := DATA_FOLDER_FBREF
+                    / season.folder
+                    / "player_matchlogs.parquet"
+                ).exists()
+            ],
+        )
+
+        dfs_fixtures: list[pd.DataFrame] = [
+            get_fpl_table(season, "fixtures").assign(
+                season=season.fbref_long_name
+            )
+            for season in seasons
+            if (DATA_FOLDER_FPL / season.folder / "fixtures.json").exists()
+        ]
+        if dfs_fixtures:
+            con.register(
+                "df_fixtures", pd.concat(dfs_fixtures, ignore_index=True)
+            )
+            con.execute(
+                "CREATE OR REPLACE TABLE fixtures AS SELECT * FROM df_fixtures"
+            )
+            con.unregister("df_fixtures")
+        else:
+            con.execute("DROP TABLE IF EXISTS fixtures")
+
+        fpath_preds: Path = MODEL_FOLDER / "predictions" / "player"
+        if any(fpath_preds.glob("gameweek_*/prediction_xpoints.csv")):
+            files: str = _quote(
+                (
+                    fpath_preds / "gameweek_*" / "prediction_xpoints.csv"
+                ).as_posix()
+            )
+            con.execute(
+                "CREATE OR REPLACE VIEW predictions AS SELECT * EXCLUDE "  # noqa: S608
+                "(filename), CAST(regexp_extract(filename, "
+                "'gameweek_(\\d+)', 1) AS INTEGER) AS gameweek "
+                f"FROM read_csv({files}, filename = true, "
+                "union_by_name = true)"
+            )
+        else:
+            con.execute("DROP VIEW IF EXISTS predictions")
+    finally:
+        con.close()
+    logger.info(
+        "Analytics store built for seasons: {}",
+        [season.fbref_name for season in seasons],
+    )
+
+
+def get_window_features(  # noqa: PLR0913, PLR0917
+    con: "DuckDBPyConnection",
+    view: str,
+    season: Season,
+    cols_form: list[str],
+    cols_static: list[str],
+    team_or_player: Literal["team", "player", "opponent"],
+) -> pd.DataFrame:
+    """
+    Get lagged and aggregated features of a season inside the store.
+
+    This is the store counterpart of `get_form_data` and
+    `get_static_data`, with the same semantics: the rows are ordered by
+    date as in the Parquet file, the lags are taken over the previous
+    five matches of each element and the means over the five previous
+    rows of the whole season, each shifted by one match of its element.
+
+    Parameters
+    ----------
+    con
+        The DuckDB connection.
+    view
+        The matchlog view to read, such as `team_gameweek`.
+    season
+        The season under process.
+    cols_form
+        Columns to get lagged features on.
+    cols_static
+        Columns to get aggregated features on.
+    team_or_player
+        The element to group by.
+
+    Returns
+    -------
+        A pandas dataframe with the `<col>_lag_<i>` and `<col>_mean`
+        features of every element and date.
+
+    Raises
+    ------
+    ValueError
+        If the season is not in the store.
+
+    """
+    element: str = f'"{team_or_player}"'
+    lags: list[str] = [
+        f'"{col}_lag_{i}"' for col in cols_form for i in range(1, 6)
+    ]
+    select_shifted: str = ", ".join([
+        element,
+        "date",
+        "file_row_number",
+        *(
+            f'LAG("{col}", {i}) OVER g AS "{col}_lag_{i}"'
+            for col in cols_form
+            for i in range(1, 6)
+        ),
+        *(f'LAG("{col}", 1) OVER g AS "{col}_shifted"' for col in cols_static),
+    ])
+    select_features: str = ", ".join([
+        element,
+        "date",
+        *lags,
+        *(
+            f'CASE WHEN COUNT("{col}_shifted") OVER w = 5 '
+            f'THEN AVG("{col}_shifted") OVER w END AS "{col}_mean"'
+            for col in cols_static
+        ),
+    ])
+    df_features: pd.DataFrame = con.execute(
+        f"WITH shifted AS (SELECT {select_shifted} FROM {view} "  # noqa: S608
+        f"WHERE season = {_quote(season.fbref_long_name)} "
+        f"WINDOW g AS (PARTITION BY {element} "
+        "ORDER BY date, file_row_number)) "
+        f"SELECT {select_features} FROM shifted "
+        "WINDOW w AS (ORDER BY date, file_row_number "
+        "ROWS BETWEEN 4 PRECEDING AND CURRENT ROW) "
+        "ORDER BY date, file_row_number"
+    ).df()
+    if df_features.empty:
+        msg: str = (
+            f"Season {season.fbref_name} is not in the {view} view, "
+            "build the analytics store first."
+        )
+        raise ValueError(msg)
+    return df_features
+
+
+if __name__ == "__main__":
+    build_analytics_store([
+        Seasons.SEASON_2324.value,
+        Seasons.SEASON_2425.value,
+    ])
@@ -0,0 +1,134 @@
+"""Helper functions for the compressed archive of fetched web pages."""
+
+import hashlib
+import re
+import threading
+import time
+from collections.abc import Iterator
+from pathlib import Path
+
+import zstandard
+from pydantic import BaseModel
+
+from fantasypl.config.constants import DATA_FOLDER_ARCHIVE
+
+
+_pack_path: Path = DATA_FOLDER_ARCHIVE / "pages.pack"
+_index_path: Path = DATA_FOLDER_ARCHIVE / "index.jsonl"
+_lock: threading.Lock = threading.Lock()
+_latest_digests: dict[str, str] = {}
+
+
+class ArchivedPage(BaseModel):
+    """
+    The ArchivedPage class.
+
+    Attributes
+    ----------
+        url: The fetched URL.
+        fetched_at: Epoch seconds when the page was fetched.
+        digest: SHA-256 of the page body.
+        offset: Position of the compressed body in the pack file.
+        length: Size of the compressed body in the pack file.
+
+    """
+
+    url: str
+    fetched_at: float
+    digest: str
+    offset: int
+    length: int
+
+
+def _read_index() -> list[ArchivedPage]:
+    """
+    Read all the entries of the archive index.
+
+    Returns
+    -------
+        The archived pages in the order they were fetched.
+
+    """
+    if not _index_path.exists():
+        return []
+    with Path.open(_index_path, encoding="utf-8") as f:
+        return [ArchivedPage.model_validate_json(line) for line in f if line]
+
+
+def archive_page(url: str, content: bytes) -> None:
+    """
+    Append a fetched page to the archive, unless it is unchanged.
+
+    Parameters
+    ----------
+    url
+        The fetched URL.
+    content
+        The page body.
+
+    """
+    digest: str = hashlib.sha256(content).hexdigest()
+    compressed: bytes = zstandard.ZstdCompressor(level=10).compress(content)
+    with _lock:
+        if not _latest_digests:
+            _latest_digests.update({
+                entry.url: entry.digest for entry in _read_index()
+            })
+        if _latest_digests.get(url) == digest:
+            return
+        Path.mkdir(DATA_FOLDER_ARCHIVE, parents=True, exist_ok=True)
+        with Path.open(_pack_path, "ab") as f:
+            offset: int = f.tell()
+            f.write(compressed)
+        entry: ArchivedPage = ArchivedPage(
+            url=url,
+            fetched_at=time.time(),
+            digest=digest,
+            offset=offset,
+            length=len(compressed),
+        )
+        with Path.open(_index_path, "a", encoding="utf-8") as f:
+            f.write(entry.model_dump_json() + "\n")
+        _latest_digests[url] = digest
+
+
+def iter_archived_pages(pattern: str = "") -> Iterator[ArchivedPage]:
+    """
+    Iterate over the latest archived page of URLs matching a regex.
+
+    Parameters
+    ----------
+    pattern
+        The URL regex to filter on.
+
+    Yields
+    ------
+        The latest archive entry of each matching URL.
+
+    """
+    latest: dict[str, ArchivedPage] = {
+        entry.url: entry for entry in _read_index()
+    }
+    yield from (
+        entry for url, entry in latest.items() if re.search(pattern, url)
+    )
+
+
+def read_archived_page(entry: ArchivedPage) -> str:
+    """
+    Read the body of an archived page.
+
+    Parameters
+    ----------
+    entry
+        The archive entry.
+
+    Returns
+    -------
+        The page contents.
+
+    """
+    with Path.open(_pack_path, "rb") as f:
+        f.seek(entry.offset)
+        compressed: bytes = f.read(entry.length)
+    return zstandard.ZstdDecompressor().decompress(compressed).decode("utf-8")
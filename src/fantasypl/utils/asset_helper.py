@@ -0,0 +1,231 @@
+"""Helper functions for syncing static image assets."""
+
+import hashlib
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from http import HTTPStatus
+from pathlib import Path
+
+import requests
+import rich.progress
+from loguru import logger
+from pydantic import BaseModel
+
+from fantasypl.config.constants import ASSET_MAX_WORKERS
+from fantasypl.utils.fpl_helper import FPLClient
+
+
+class AssetEntry(BaseModel):
+    """
+    The AssetEntry class.
+
+    Attributes
+    ----------
+        url: The asset URL.
+        etag: The ETag header of the last download.
+        last_modified: The Last-Modified header of the last download.
+        size: Size of the saved file in bytes.
+        digest: SHA-256 of the saved file.
+
+    """
+
+    url: str
+    etag: str | None = None
+    last_modified: str | None = None
+    size: int
+    digest: str
+
+
+class AssetManifest(BaseModel):
+    """
+    The AssetManifest class.
+
+    Attributes
+    ----------
+        assets: The asset entries keyed by path relative to the manifest.
+
+    """
+
+    assets: dict[str, AssetEntry] = {}
+
+
+class AssetSyncSummary(BaseModel):
+    """
+    The AssetSyncSummary class.
+
+    Attributes
+    ----------
+        added: Files saved for the first time.
+        updated: Files whose contents changed.
+        unchanged: Files left as they were.
+        failed: Files that could not be downloaded.
+
+    """
+
+    added: list[str] = []
+    updated: list[str] = []
+    unchanged: list[str] = []
+    failed: list[str] = []
+
+
+def _is_intact(fpath: Path, entry: AssetEntry | None) -> bool:
+    """
+    Check whether a file still matches its manifest entry.
+
+    The size is compared first so that the hash is only computed for
+    files that may be intact.
+
+    Parameters
+    ----------
+    fpath
+        The asset file path.
+    entry
+        The manifest entry of the file.
+
+    Returns
+    -------
+        True if the file exists with the recorded size and digest.
+
+    """
+    return (
+        entry is not None
+        and fpath.exists()
+        and fpath.stat().st_size == entry.size
+        and hashlib.sha256(fpath.read_bytes()).hexdigest() == entry.digest
+    )
+
+
+def _sync_asset(
+    client: FPLClient,
+    url: str,
+    fpath: Path,
+    entry: AssetEntry | None,
+) -> tuple[str, AssetEntry | None]:
+    """
+    Download an asset unless the server confirms it is unchanged.
+
+    Parameters
+    ----------
+    client
+        The FPL client.
+    url
+        The asset URL.
+    fpath
+        The asset file path.
+    entry
+        The manifest entry of the file.
+
+    Returns
+    -------
+        The sync status and the new manifest entry.
+
+    """
+    intact: bool = _is_intact(fpath, entry)
+    headers: dict[str, str] = {}
+    if intact and entry is not None and entry.url == url:
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+    try:
+        response: requests.models.Response = client.get(url, headers)
+    except requests.RequestException as err:
+        logger.warning("Asset download failed for {}: {}", url, err)
+        return "failed", entry
+    if response.status_code == HTTPStatus.NOT_MODIFIED:
+        return "unchanged", entry
+    if not response.ok:
+        logger.warning("Asset {} answered {}", url, response.status_code)
+        return "failed", entry
+    digest: str = hashlib.sha256(response.content).hexdigest()
+    new_entry: AssetEntry = AssetEntry(
+        url=url,
+        etag=response.headers.get("ETag"),
+        last_modified=response.headers.get("Last-Modified"),
+        size=len(response.content),
+        digest=digest,
+    )
+    if intact and entry is not None and entry.digest == digest:
+        return "unchanged", new_entry
+    existed: bool = fpath.exists()
+    Path.mkdir(fpath.parent, parents=True, exist_ok=True)
+    fpath_tmp: Path = fpath.with_name(f".{fpath.name}.tmp")
+    fpath_tmp.write_bytes(response.content)
+    fpath_tmp.replace(fpath)
+    return ("updated" if existed else "added"), new_entry
+
+
+def sync_assets(
+    client: FPLClient,
+    assets: list[tuple[str, Path]],
+    manifest_path: Path,
+    description: str = "Syncing assets: ",
+) -> AssetSyncSummary:
+    """
+    Download a set of assets concurrently, skipping unchanged files.
+
+    Files still matching their manifest entry are revalidated with
+    their ETag/Last-Modified validators, and a downloaded body equal to
+    the saved file is not written again. Files are replaced atomically
+    and the manifest is saved once all downloads are done.
+
+    Parameters
+    ----------
+    client
+        The FPL client whose connection pool is used.
+    assets
+        The URL and file path of each asset.
+    manifest_path
+        The path of the JSON manifest of the assets.
+    description
+        The progress bar description.
+
+    Returns
+    -------
+        The files added, updated, unchanged and failed.
+
+    """
+    manifest: AssetManifest = (
+        AssetManifest.model_validate_json(
+            manifest_path.read_text(encoding="utf-8")
+        )
+        if manifest_path.exists()
+        else AssetManifest()
+    )
+    summary: AssetSyncSummary = AssetSyncSummary()
+    lock: threading.Lock = threading.Lock()
+
+    def _sync(url: str, fpath: Path) -> None:
+        key: str = fpath.relative_to(manifest_path.parent).as_posix()
+        status: str
+        entry: AssetEntry | None
+        status, entry = _sync_asset(
+            client, url, fpath, manifest.assets.get(key)
+        )
+        with lock:
+            getattr(summary, status).append(key)
+            if entry is not None:
+                manifest.assets[key] = entry
+
+    with ThreadPoolExecutor(max_workers=ASSET_MAX_WORKERS) as executor:
+        futures: list[Future[None]] = [
+            executor.submit(_sync, url, fpath) for url, fpath in assets
+        ]
+        future: Future[None]
+        for future in rich.progress.track(
+            as_completed(futures),
+            total=len(futures),
+            description=description,
+        ):
+            future.result()
+
+    Path.mkdir(manifest_path.parent, parents=True, exist_ok=True)
+    manifest_path.write_text(manifest.model_dump_json(), encoding="utf-8")
+    logger.info(
+        "Assets synced: {} added, {} updated, {} unchanged, {} failed",
+        len(summary.added),
+        len(summary.updated),
+        len(summary.unchanged),
+        len(summary.failed),
+    )
+    return summary
@@ -0,0 +1,315 @@
+"""Helper functions for the on-disk HTTP response cache."""
+
+import hashlib
+import re
+import time
+from collections.abc import Iterator
+from functools import partial
+from pathlib import Path
+
+from loguru import logger
+from pydantic import BaseModel, ValidationError
+
+from fantasypl.config.constants import (
+    CACHE_TTL_DEFAULT,
+    CACHE_TTL_RULES,
+    DATA_FOLDER_CACHE,
+)
+from fantasypl.utils.save_helper import write_atomically
+
+
+_settings: dict[str, bool] = {"offline": False}
+
+
+class CachedResponse(BaseModel):
+    """
+    The CachedResponse class.
+
+    Attributes
+    ----------
+        url: The requested URL.
+        digest: SHA-256 of the response body, naming the stored object.
+        etag: The ETag header of the response.
+        last_modified: The Last-Modified header of the response.
+        validated_at: Epoch seconds when the server last confirmed it.
+
+    """
+
+    url: str
+    digest: str
+    etag: str | None = None
+    last_modified: str | None = None
+    validated_at: float
+
+    def is_fresh(self) -> bool:
+        """
+        Check whether the response can be served without revalidation.
+
+        Returns
+        -------
+            True if the response is younger than the URL TTL.
+
+        """
+        return time.time() - self.validated_at < get_cache_ttl(self.url)
+
+    def conditional_headers(self) -> dict[str, str]:
+        """
+        Build the headers for revalidating the response.
+
+        Returns
+        -------
+            The If-None-Match/If-Modified-Since headers.
+
+        """
+        headers: dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def set_offline_mode(*, offline: bool) -> None:
+    """
+    Serve web pages only from the cache, without any network requests.
+
+    Parameters
+    ----------
+    offline
+        True to enable the offline mode, False to disable it.
+
+    """
+    _settings["offline"] = offline
+
+
+def is_offline_mode() -> bool:
+    """
+    Check whether the offline mode is enabled.
+
+    Returns
+    -------
+        True if web pages are served only from the cache.
+
+    """
+    return _settings["offline"]
+
+
+def get_cache_ttl(url: str) -> int:
+    """
+    Get the cache TTL of a URL.
+
+    Parameters
+    ----------
+    url
+        The requested URL.
+
+    Returns
+    -------
+        The TTL in seconds from the first matching cache rule.
+
+    """
+    return next(
+        (
+            ttl
+            for pattern, ttl in CACHE_TTL_RULES.items()
+            if re.search(pattern, url)
+        ),
+        CACHE_TTL_DEFAULT,
+    )
+
+
+def _index_path(url: str) -> Path:
+    """
+    Get the index entry path of a URL.
+
+    Parameters
+    ----------
+    url
+        The requested URL.
+
+    Returns
+    -------
+        Path of the JSON index entry.
+
+    """
+    key: str = hashlib.sha256(url.encode("utf-8")).hexdigest()
+    return DATA_FOLDER_CACHE / "index" / f"{key}.json"
+
+
+def _object_path(digest: str) -> Path:
+    """
+    Get the stored object path of a response body.
+
+    Parameters
+    ----------
+    digest
+        SHA-256 of the response body.
+
+    Returns
+    -------
+        Path of the stored body.
+
+    """
+    return DATA_FOLDER_CACHE / "objects" / digest[:2] / digest
+
+
+def _read_index(fpath: Path) -> CachedResponse | None:
+    """
+    Read a cache index entry.
+
+    Parameters
+    ----------
+    fpath
+        The path of the index entry.
+
+    Returns
+    -------
+        The cache entry, or None if it cannot be parsed.
+
+    """
+    try:
+        return CachedResponse.model_validate_json(
+            fpath.read_text(encoding="utf-8")
+        )
+    except (OSError, ValidationError):
+        logger.warning("Ignoring unreadable cache entry {}", fpath)
+        return None
+
+
+def get_cached_response(url: str) -> CachedResponse | None:
+    """
+    Get the cache entry of a URL.
+
+    Parameters
+    ----------
+    url
+        The requested URL.
+
+    Returns
+    -------
+        The cache entry, or None if the URL was never cached or its
+        entry cannot be parsed.
+
+    """
+    fpath: Path = _index_path(url)
+    if not fpath.exists():
+        return None
+    entry: CachedResponse | None = _read_index(fpath)
+    if entry is None or not _object_path(entry.digest).exists():
+        return None
+    return entry
+
+
+def iter_cached_responses(pattern: str = "") -> Iterator[CachedResponse]:
+    """
+    Iterate over the cache entries of URLs matching a regex.
+
+    Parameters
+    ----------
+    pattern
+        The URL regex to filter on.
+
+    Yields
+    ------
+        The matching cache entries.
+
+    """
+    fpath: Path
+    for fpath in sorted((DATA_FOLDER_CACHE / "index").glob("*.json")):
+        entry: CachedResponse | None = _read_index(fpath)
+        if (
+            entry is not None
+            and re.search(pattern, entry.url)
+            and _object_path(entry.digest).exists()
+        ):
+            yield entry
+
+
+def invalidate_cached_response(url: str) -> None:
+    """
+    Drop the cache entry of a URL so that the next request refetches it.
+
+    The stored body is kept, as other entries may share it.
+
+    Parameters
+    ----------
+    url
+        The requested URL.
+
+    """
+    _index_path(url).unlink(missing_ok=True)
+
+
+def read_cached_content(entry: CachedResponse) -> bytes:
+    """
+    Read the body of a cached response.
+
+    Parameters
+    ----------
+    entry
+        The cache entry.
+
+    Returns
+    -------
+        The response body.
+
+    """
+    return _object_path(entry.digest).read_bytes()
+
+
+def cache_response(
+    url: str,
+    content: bytes,
+    etag: str | None,
+    last_modified: str | None,
+) -> None:
+    """
+    Store a response in the cache.
+
+    Parameters
+    ----------
+    url
+        The requested URL.
+    content
+        The response body.
+    etag
+        The ETag header of the response.
+    last_modified
+        The Last-Modified header of the response.
+
+    """
+    digest: str = hashlib.sha256(content).hexdigest()
+    fpath_object: Path = _object_path(digest)
+    if not fpath_object.exists():
+        Path.mkdir(fpath_object.parent, parents=True, exist_ok=True)
+        write_atomically(fpath_object, partial(Path.write_bytes, data=content))
+    revalidate_response(
+        CachedResponse(
+            url=url,
+            digest=digest,
+            etag=etag,
+            last_modified=last_modified,
+            validated_at=time.time(),
+        )
+    )
+
+
+def revalidate_response(entry: CachedResponse) -> None:
+    """
+    Mark a cache entry as confirmed by the server just now.
+
+    Parameters
+    ----------
+    entry
+        The cache entry.
+
+    """
+    entry.validated_at = time.time()
+    fpath: Path = _index_path(entry.url)
+    Path.mkdir(fpath.parent, parents=True, exist_ok=True)
+    write_atomically(
+        fpath,
+        partial(
+            Path.write_text, data=entry.model_dump_json(), encoding="utf-8"
+        ),
+    )
@@ -0,0 +1,275 @@
+"""Helper functions for fetching many web pages concurrently."""
+
+import asyncio
+import contextlib
+import itertools
+import multiprocessing
+import os
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from http import HTTPStatus
+from typing import Any
+
+import requests
+import rich.progress
+from loguru import logger
+
+from fantasypl.config.constants import (
+    FETCH_MAX_ATTEMPTS,
+    FETCH_MAX_CONCURRENCY,
+    FETCH_RETRY_DELAY,
+    HOST_MAX_CONCURRENCY,
+    PARSE_MAX_WORKERS,
+    PIPELINE_QUEUE_SIZE,
+)
+from fantasypl.utils.web_helper import get_content, get_url_host
+
+
+_retry_statuses: set[int] = {
+    HTTPStatus.TOO_MANY_REQUESTS,
+    HTTPStatus.INTERNAL_SERVER_ERROR,
+    HTTPStatus.BAD_GATEWAY,
+    HTTPStatus.SERVICE_UNAVAILABLE,
+    HTTPStatus.GATEWAY_TIMEOUT,
+}
+
+
+def _is_retryable(err: requests.RequestException) -> bool:
+    """
+    Check whether a failed request is worth another attempt.
+
+    Parameters
+    ----------
+    err
+        The request error.
+
+    Returns
+    -------
+        True for throttling, server errors, timeouts and lost connections.
+
+    """
+    if isinstance(err, requests.HTTPError):
+        return (
+            err.response is not None
+            and err.response.status_code in _retry_statuses
+        )
+    return isinstance(err, (requests.ConnectionError, requests.Timeout))
+
+
+class FetchEngine:
+    """
+    Fetches web pages concurrently on a single event loop.
+
+    The blocking requests run on worker threads, bounded by a global
+    limit and a per-host limit. The per-host rate limiters of
+    `get_content` still apply, so a slow host only holds its own slots
+    and never blocks requests to other hosts. A URL failing with a
+    retryable error goes back to the end of its host queue.
+
+    CPU-bound parsing runs on a process pool owned by the engine, which
+    is started on first use and shut down by `close`.
+
+    Attributes
+    ----------
+        failed: The URLs given up on.
+
+    """
+
+    def __init__(self, max_concurrency: int = FETCH_MAX_CONCURRENCY) -> None:
+        """
+        Initialize the engine limits.
+
+        Parameters
+        ----------
+        max_concurrency
+            Maximum number of requests in flight across all hosts.
+
+        """
+        self._semaphore: asyncio.Semaphore = asyncio.Semaphore(max_concurrency)
+        self._host_semaphores: dict[str, asyncio.Semaphore] = {
+            host: asyncio.Semaphore(limit)
+            for host, limit in HOST_MAX_CONCURRENCY.items()
+        }
+        self.failed: list[str] = []
+        self._pool: ProcessPoolExecutor | None = None
+
+    async def fetch(self, url: str) -> str | None:
+        """
+        Get the contents of a web page.
+
+        Parameters
+        ----------
+        url
+            The URL to scrape.
+
+        Returns
+        -------
+            The contents of the web page, or None if all attempts failed
+            or the page is not cached in offline mode.
+
+        """
+        host_semaphore: contextlib.AbstractAsyncContextManager[object] = (
+            self._host_semaphores.get(get_url_host(url))
+            or contextlib.nullcontext()
+        )
+        attempt: int
+        for attempt in range(1, FETCH_MAX_ATTEMPTS + 1):
+            try:
+                async with host_semaphore, self._semaphore:
+                    return await asyncio.to_thread(get_content, url)
+            except FileNotFoundError as err:
+                logger.error("Giving up on {}: {}", url, err)
+                break
+            except requests.RequestException as err:
+                if attempt == FETCH_MAX_ATTEMPTS or not _is_retryable(err):
+                    logger.error("Giving up on {}: {}", url, err)
+                    break
+                logger.warning("Requeueing {}: {}", url, err)
+                await asyncio.sleep(FETCH_RETRY_DELAY * attempt)
+        self.failed.append(url)
+        return None
+
+    async def parse[T](
+        self,
+        func: Callable[..., T],
+        *args: Any,  # noqa: ANN401
+    ) -> T:
+        """
+        Run a parsing function on the process pool.
+
+        Parameters
+        ----------
+        func
+            A picklable module-level function.
+        args
+            The picklable arguments of the function.
+
+        Returns
+        -------
+            The result of the function.
+
+        """
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=PARSE_MAX_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return await asyncio.get_running_loop().run_in_executor(
+            self._pool, partial(func, *args)
+        )
+
+    def close(self) -> None:
+        """Shut down the parsing process pool."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+
+async def run_pipeline[T](
+    engine: FetchEngine,
+    jobs: list[tuple[str, Callable[[str], T], Callable[[T], None]]],
+) -> None:
+    """
+    Fetch, parse and save pages in overlapping stages.
+
+    The fetchers push page contents onto a bounded queue, parser tasks
+    run the parsing on the engine process pool and push the results onto
+    a second bounded queue, and a single writer saves them on a worker
+    thread. Parsing and saving thus overlap with the rate-limit waits,
+    and the bounded queues hold the fetchers back if parsing falls
+    behind.
+
+    Parameters
+    ----------
+    engine
+        The shared fetch engine.
+    jobs
+        The URL, the picklable parsing function taking the page contents
+        and the saving function taking the parsed result of each page.
+
+    """
+    pages: asyncio.Queue[tuple[Callable[[str], T], Callable[[T], None], str]]
+    pages = asyncio.Queue(PIPELINE_QUEUE_SIZE)
+    results: asyncio.Queue[tuple[Callable[[T], None], T]]
+    results = asyncio.Queue(PIPELINE_QUEUE_SIZE)
+
+    async def _fetch(
+        url: str, parse: Callable[[str], T], save: Callable[[T], None]
+    ) -> None:
+        content: str | None = await engine.fetch(url)
+        if content is not None:
+            await pages.put((parse, save, content))
+
+    async def _parse() -> None:
+        while True:
+            parse, save, content = await pages.get()
+            try:
+                await results.put((save, await engine.parse(parse, content)))
+            except Exception:  # noqa: BLE001
+                logger.exception("Parsing failed in {}", parse)
+            finally:
+                pages.task_done()
+
+    async def _write() -> None:
+        while True:
+            save, result = await results.get()
+            try:
+                await asyncio.to_thread(save, result)
+            except Exception:  # noqa: BLE001
+                logger.exception("Saving failed in {}", save)
+            finally:
+                results.task_done()
+
+    workers: list[asyncio.Task[None]] = [
+        asyncio.create_task(_parse())
+        for _ in range(PARSE_MAX_WORKERS or os.cpu_count() or 1)
+    ]
+    workers.append(asyncio.create_task(_write()))
+    await asyncio.gather(*itertools.starmap(_fetch, jobs))
+    await pages.join()
+    await results.join()
+    worker: asyncio.Task[None]
+    for worker in workers:
+        worker.cancel()
+    await asyncio.gather(*workers, return_exceptions=True)
+
+
+FetchJob = Callable[[FetchEngine, rich.progress.Progress], Awaitable[None]]
+"""
+A fetch coroutine function taking the shared engine and progress bars.
+"""
+
+
+def run_fetch_jobs(*jobs: FetchJob) -> list[str]:
+    """
+    Run fetch jobs together on one event loop and one engine.
+
+    Parameters
+    ----------
+    jobs
+        The fetch jobs to run concurrently.
+
+    Returns
+    -------
+        The URLs given up on, so that callers can keep track of what was
+        not saved.
+
+    """
+
+    async def _run() -> list[str]:
+        engine: FetchEngine = FetchEngine()
+        try:
+            with rich.progress.Progress() as progress:
+                await asyncio.gather(*(job(engine, progress) for job in jobs))
+        finally:
+            engine.close()
+        if engine.failed:
+            logger.error(
+                "{} URLs failed and were not saved: {}",
+                len(engine.failed),
+                engine.failed,
+            )
+        return engine.failed
+
+    return asyncio.run(_run())
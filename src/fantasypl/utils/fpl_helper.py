@@ -0,0 +1,433 @@
+"""Helper class and functions for the FPL API and its payloads."""
+
+import functools
+import json
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from fantasypl.config.constants import (
+    DATA_FOLDER_FPL,
+    FETCH_MAX_ATTEMPTS,
+    FPL_BOOTSTRAP_URL,
+    FPL_EVENT_URL,
+    FPL_FIXTURES_URL,
+    FPL_RETRY_BACKOFF,
+    FPL_TEAM_URL,
+    FPL_TIMEOUT,
+    HTTP_POOL_SIZE,
+)
+from fantasypl.config.schemas import (
+    FPLBootstrap,
+    FPLFixture,
+    FPLLive,
+    FPLPicks,
+    FPLTransfer,
+    Season,
+)
+from fantasypl.utils.save_helper import save_json
+from fantasypl.utils.web_helper import get_content
+
+
+_session: requests.Session = requests.Session()
+_session.headers.update({"User-Agent": "Mozilla/5.0"})
+_adapter: HTTPAdapter = HTTPAdapter(
+    pool_connections=HTTP_POOL_SIZE,
+    pool_maxsize=HTTP_POOL_SIZE,
+    max_retries=Retry(
+        total=FETCH_MAX_ATTEMPTS - 1,
+        backoff_factor=FPL_RETRY_BACKOFF,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["GET"],
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    ),
+)
+_session.mount("https://", _adapter)
+_session.mount("http://", _adapter)
+
+_bootstraps: dict[str, FPLBootstrap] = {}
+
+
+class FPLClient:
+    """
+    Calls the FPL API on a shared, retrying connection pool.
+
+    All the clients share one session, so the keep-alive connections
+    are reused across calls and threads. The responses go through the
+    HTTP response cache, so offline mode and revalidation apply. Those
+    of finished gameweeks never change, so they are also saved per
+    gameweek and served without a request afterwards. The bootstrap is
+    kept per season once fetched.
+
+    Attributes
+    ----------
+        season: The season under process.
+
+    """
+
+    def __init__(self, season: Season) -> None:
+        """
+        Initialize the client for a season.
+
+        Parameters
+        ----------
+        season
+            The season under process.
+
+        """
+        self.season: Season = season
+
+    @staticmethod
+    def get(
+        url: str,
+        headers: dict[str, str] | None = None,
+    ) -> requests.models.Response:
+        """
+        Send a GET request, retrying on connection errors and 429/5xx.
+
+        Parameters
+        ----------
+        url
+            The URL to request.
+        headers
+            The optional extra request headers.
+
+        Returns
+        -------
+            The response of the last attempt.
+
+        """
+        return _session.get(url, headers=headers, timeout=FPL_TIMEOUT)
+
+    @staticmethod
+    def _get_json(
+        url: str,
+        fpath: Path | None = None,
+        select: Callable[[Any], Any] | None = None,
+    ) -> Any:  # noqa: ANN401
+        """
+        Get a JSON response, from the gameweek files if available.
+
+        Parameters
+        ----------
+        url
+            The API URL.
+        fpath
+            The gameweek file path, or None to skip the gameweek files.
+        select
+            The optional function selecting the part of the response to
+            return and save.
+
+        Returns
+        -------
+            The decoded JSON response.
+
+        """
+        if fpath is not None and fpath.exists():
+            with Path.open(fpath, "r") as f:
+                return json.load(f)
+        data: Any = json.loads(
+            get_content(url, timeout=FPL_TIMEOUT, session=_session)
+        )
+        if select is not None:
+            data = select(data)
+        if fpath is not None:
+            save_json(data, fpath)
+        return data
+
+    def _get_cache_path(self, gameweek: int, name: str) -> Path | None:
+        """
+        Get the cache file path of a gameweek response.
+
+        Parameters
+        ----------
+        gameweek
+            The gameweek of the response.
+        name
+            The response file name.
+
+        Returns
+        -------
+            The cache file path, or None if the gameweek is not finished.
+
+        """
+        if not self.is_finished(gameweek):
+            return None
+        return (
+            DATA_FOLDER_FPL
+            / self.season.folder
+            / "gameweeks"
+            / f"gameweek_{gameweek}"
+            / f"{name}.json"
+        )
+
+    def get_bootstrap(self) -> FPLBootstrap:
+        """
+        Get the bootstrap data and keep it for the season.
+
+        Returns
+        -------
+            The gameweeks, teams and players of the season.
+
+        """
+        bootstrap: FPLBootstrap = FPLBootstrap.model_validate(
+            self._get_json(FPL_BOOTSTRAP_URL)
+        )
+        _bootstraps[self.season.folder] = bootstrap
+        return bootstrap
+
+    def get_fixtures(self) -> list[FPLFixture]:
+        """
+        Get the fixtures of the season.
+
+        Returns
+        -------
+            The fixtures.
+
+        """
+        return [
+            FPLFixture.model_validate(fixture)
+            for fixture in self._get_json(FPL_FIXTURES_URL)
+        ]
+
+    def is_finished(self, gameweek: int) -> bool:
+        """
+        Check whether a gameweek is finished.
+
+        The bootstrap is fetched on first use for the season.
+
+        Parameters
+        ----------
+        gameweek
+            The gameweek to check.
+
+        Returns
+        -------
+            True if all the gameweek matches are settled and their
+            points are final.
+
+        """
+        bootstrap: FPLBootstrap = (
+            _bootstraps.get(self.season.folder) or self.get_bootstrap()
+        )
+        return any(
+            event.finished and event.data_checked
+            for event in bootstrap.events
+            if event.id == gameweek
+        )
+
+    def get_live(self, gameweek: int) -> FPLLive:
+        """
+        Get the live stats and points of every player for a gameweek.
+
+        Parameters
+        ----------
+        gameweek
+            The gameweek of the stats.
+
+        Returns
+        -------
+            The player stats of the gameweek.
+
+        """
+        return FPLLive.model_validate(
+            self._get_json(
+                f"{FPL_EVENT_URL}/{gameweek}/live/",
+                self._get_cache_path(gameweek, "live"),
+            )
+        )
+
+    def get_picks(self, team_id: int, gameweek: int) -> FPLPicks:
+        """
+        Get the squad picks of a team for a gameweek.
+
+        Parameters
+        ----------
+        team_id
+            FPL team ID.
+        gameweek
+            The gameweek of the picks.
+
+        Returns
+        -------
+            The squad picks.
+
+        """
+        return FPLPicks.model_validate(
+            self._get_json(
+                f"{FPL_TEAM_URL}/{team_id}/event/{gameweek}/picks/",
+                self._get_cache_path(gameweek, f"picks_{team_id}"),
+            )
+        )
+
+    def get_transfers(self, team_id: int, gameweek: int) -> list[FPLTransfer]:
+        """
+        Get the transfers of a team up to a gameweek.
+
+        Parameters
+        ----------
+        team_id
+            FPL team ID.
+        gameweek
+            The last gameweek of the transfers.
+
+        Returns
+        -------
+            The transfers applying to the gameweek or earlier ones.
+
+        """
+        return [
+            FPLTransfer.model_validate(transfer)
+            for transfer in self._get_json(
+                f"{FPL_TEAM_URL}/{team_id}/transfers/",
+                self._get_cache_path(gameweek, f"transfers_{team_id}"),
+                lambda transfers: [
+                    transfer
+                    for transfer in transfers
+                    if transfer["event"] <= gameweek
+                ],
+            )
+        ]
+
+
+_fpl_table_sources: dict[str, tuple[str, str | None]] = {
+    "teams": ("bootstrap.json", "teams"),
+    "elements": ("bootstrap.json", "elements"),
+    "fixtures": ("fixtures.json", None),
+}
+_fpl_table_dtypes: dict[str, dict[str, str]] = {
+    "teams": {
+        "id": "Int64",
+        "code": "Int64",
+        "name": "string",
+        "short_name": "string",
+    },
+    "elements": {
+        "id": "Int64",
+        "code": "Int64",
+        "first_name": "string",
+        "second_name": "string",
+        "web_name": "string",
+        "photo": "string",
+        "team": "Int64",
+        "team_code": "Int64",
+        "element_type": "Int64",
+        "now_cost": "Int64",
+        "chance_of_playing_next_round": "Int64",
+        "chance_of_playing_this_round": "Int64",
+        "news": "string",
+        "news_added": "string",
+        "selected_by_percent": "Float64",
+        "cost_change_start": "Int64",
+    },
+    "fixtures": {
+        "id": "Int64",
+        "code": "Int64",
+        "event": "Int64",
+        "team_h": "Int64",
+        "team_a": "Int64",
+        "finished": "boolean",
+    },
+}
+
+
+@functools.lru_cache(maxsize=4)
+def _load_payload(fpath: Path, mtime_ns: int) -> Any:  # noqa: ANN401, ARG001
+    """
+    Parse an FPL API JSON file once per file version.
+
+    Parameters
+    ----------
+    fpath
+        The JSON file path.
+    mtime_ns
+        The file modification time, so that a rewritten file is parsed
+        again.
+
+    Returns
+    -------
+        The decoded JSON payload.
+
+    """
+    with Path.open(fpath, "r") as f:
+        return json.load(f)
+
+
+@functools.lru_cache(maxsize=8)
+def _decode_fpl_table(fpath: Path, mtime_ns: int, name: str) -> pd.DataFrame:
+    """
+    Decode the declared fields of an FPL API table into typed columns.
+
+    Parameters
+    ----------
+    fpath
+        The JSON file path.
+    mtime_ns
+        The file modification time.
+    name
+        The table name, one of `teams`, `elements` and `fixtures`.
+
+    Returns
+    -------
+        A pandas dataframe with one typed column per declared field.
+
+    """
+    key: str | None = _fpl_table_sources[name][1]
+    payload: Any = _load_payload(fpath, mtime_ns)
+    records: list[dict[str, Any]] = (
+        payload.get(key, []) if key is not None else payload
+    )
+    dtypes: dict[str, str] = _fpl_table_dtypes[name]
+    return pd.DataFrame({
+        col: [record.get(col) for record in records] for col in dtypes
+    }).astype(dtypes)
+
+
+def decode_fpl_table(fpath: Path, name: str) -> pd.DataFrame:
+    """
+    Get an FPL API table from a JSON file as typed columns.
+
+    The file is parsed once per version and the decoded columns are
+    shared by all the callers of a run. Only the declared fields are
+    kept.
+
+    Parameters
+    ----------
+    fpath
+        The JSON file path.
+    name
+        The table name, one of `teams`, `elements` and `fixtures`.
+
+    Returns
+    -------
+        A copy of the decoded pandas dataframe.
+
+    """
+    return _decode_fpl_table(fpath, fpath.stat().st_mtime_ns, name).copy()
+
+
+def get_fpl_table(season: Season, name: str) -> pd.DataFrame:
+    """
+    Get an FPL API table of a season as typed columns.
+
+    Parameters
+    ----------
+    season
+        The season under process.
+    name
+        The table name, one of `teams`, `elements` and `fixtures`.
+
+    Returns
+    -------
+        A pandas dataframe with one typed column per declared field.
+
+    """
+    return decode_fpl_table(
+        DATA_FOLDER_FPL / season.folder / _fpl_table_sources[name][0], name
+    )
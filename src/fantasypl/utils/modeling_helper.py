@@ -1,9 +1,9 @@
 """Helper functions for building ML models and predictions."""
 
+import hashlib
 import json
-import pickle  # noqa: S403
 from pathlib import Path
-from typing import Literal
+from typing import Any, Literal
 
 import numpy as np
 import numpy.typing as npt
@@ -20,15 +20,14 @@ from fantasypl.config.constants import (
     DATA_FOLDER_REF,
     MODEL_FOLDER,
     SEED,
+    TRAIN_TEST_BUNDLE_VERSION,
 )
 from fantasypl.config.schemas import (
     Player,
-    PlayerGameWeek,
     Season,
     Team,
-    TeamGameweek,
 )
-from fantasypl.utils.save_helper import save_pkl
+from fantasypl.utils.save_helper import save_npy_bundle, save_pkl
 
 
 def get_list_teams() -> list[Team]:
@@ -59,9 +58,9 @@ def get_list_players() -> list[Player]:
         ]
 
 
-def get_team_gameweek_json_to_df(season: Season) -> pd.DataFrame:
+def get_team_gameweek_df(season: Season) -> pd.DataFrame:
     """
-    Get a dataframe from the team gameweek JSON.
+    Get the team matchlogs of a season.
 
     Parameters
     ----------
@@ -70,23 +69,17 @@ def get_team_gameweek_json_to_df(season: Season) -> pd.DataFrame:
 
     Returns
     -------
-        A pandas dataframe from the team matchlogs JSON for the season.
+        A pandas dataframe with the team and opponent FBRef IDs.
 
     """
-    with Path.open(
-        DATA_FOLDER_FBREF / season.folder / "team_matchlogs.json",
-        "r",
-    ) as f:
-        list_team_matchlogs: list[TeamGameweek] = [
-            TeamGameweek.model_validate(el)
-            for el in json.load(f).get("team_matchlogs")
-        ]
-    return pd.DataFrame([el.model_dump() for el in list_team_matchlogs])
+    return pd.read_parquet(
+        DATA_FOLDER_FBREF / season.folder / "team_matchlogs.parquet"
+    )
 
 
-def get_player_gameweek_json_to_df(season: Season) -> pd.DataFrame:
+def get_player_gameweek_df(season: Season) -> pd.DataFrame:
     """
-    Get a dataframe from the player gameweek JSON.
+    Get the player matchlogs of a season.
 
     Parameters
     ----------
@@ -95,18 +88,12 @@ def get_player_gameweek_json_to_df(season: Season) -> pd.DataFrame:
 
     Returns
     -------
-        A pandas dataframe from the player matchlogs JSON for the season.
+        A pandas dataframe with the player and team FBRef IDs.
 
     """
-    with Path.open(
-        DATA_FOLDER_FBREF / season.folder / "player_matchlogs.json",
-        "r",
-    ) as f:
-        list_player_matchlogs: list[PlayerGameWeek] = [
-            PlayerGameWeek.model_validate(el)
-            for el in json.load(f).get("player_matchlogs")
-        ]
-    return pd.DataFrame([el.model_dump() for el in list_player_matchlogs])
+    return pd.read_parquet(
+        DATA_FOLDER_FBREF / season.folder / "player_matchlogs.parquet"
+    )
 
 
 def get_fbref_teams(season: Season) -> list[str]:
@@ -150,9 +137,9 @@ def get_form_data(
         A pandas dataframe containing the lagged features.
 
     """
-    data = data.sort_values(by="date", ascending=True)
+    data = data.sort_values(by="date", ascending=True, kind="stable")
     for col in cols:
-        shifted: pd.Series = data.groupby(team_or_player)[col].shift(  # type: ignore[type-arg]
+        shifted: pd.Series = data.groupby(team_or_player)[col].shift(
             range(1, 6), suffix="_lag"
         )
         data = pd.concat([data, shifted], axis=1)
@@ -173,6 +160,9 @@ def get_static_data(
     """
     Get data with aggregated features.
 
+    Rows of the same date keep their order, so the rolling means over
+    the whole sorted frame are reproducible.
+
     Parameters
     ----------
     data
@@ -187,7 +177,7 @@ def get_static_data(
         A pandas dataframe containing the aggregated features.
 
     """
-    data = data.sort_values(by="date", ascending=True)
+    data = data.sort_values(by="date", ascending=True, kind="stable")
     for col in cols:
         data[f"{col}_mean"] = (
             data.groupby(team_or_player)[col].shift(1).rolling(window=5).mean()
@@ -254,6 +244,7 @@ def preprocess_data_and_save(  # noqa: PLR0913, PLR0917
     preprocessor: ColumnTransformer = ColumnTransformer(
         transformers=[("cat", categorical_transformer, categorical_features)],
         remainder="passthrough",
+        sparse_threshold=0,
     )
     df_train: pd.DataFrame
     df_test: pd.DataFrame
@@ -278,31 +269,32 @@ def preprocess_data_and_save(  # noqa: PLR0913, PLR0917
     x_train_np: npt.NDArray[np.float32] = preprocessor.fit_transform(x_train)
     x_test_np: npt.NDArray[np.float32] = preprocessor.transform(x_test)
 
-    dict_array: dict[str, npt.NDArray[np.float32]] = {
-        "x_train": x_train_np,
-        "y_train": y_train,
-        "x_test": x_test_np,
-        "y_test": y_test,
-    }
-
     folder: str = (
         season.folder if position is None else f"{season.folder}/{position}"
     )
-    key: str
-    value: npt.NDArray[np.float32]
-    for key, value in dict_array.items():
-        fpath: Path = (
-            MODEL_FOLDER
-            / folder
-            / f"model_{team_or_player}_{target_name}/{key}.pkl"
-        )
-        save_pkl(obj=value, fpath=fpath)
-    fpath_preproc: Path = (
-        MODEL_FOLDER
-        / folder
-        / f"model_{team_or_player}_{target_name}/preprocessor.pkl"
+    fpath_model: Path = (
+        MODEL_FOLDER / folder / f"model_{team_or_player}_{target_name}"
+    )
+    save_npy_bundle(
+        arrays={
+            "x_train": x_train_np,
+            "y_train": y_train,
+            "x_test": x_test_np,
+            "y_test": y_test,
+        },
+        folder=fpath_model,
+        name="train_test",
+        metadata={
+            "version": TRAIN_TEST_BUNDLE_VERSION,
+            "target": target_col,
+            "feature_names": preprocessor.get_feature_names_out().tolist(),
+            "rows": {"train": len(y_train), "test": len(y_test)},
+            "source_hash": hashlib.sha256(
+                pd.util.hash_pandas_object(df, index=False).to_numpy()
+            ).hexdigest(),
+        },
     )
-    save_pkl(obj=preprocessor, fpath=fpath_preproc)
+    save_pkl(obj=preprocessor, fpath=fpath_model / "preprocessor.pkl")
 
 
 def get_train_test_data(
@@ -315,7 +307,11 @@ def get_train_test_data(
     npt.NDArray[np.float32],
 ]:
     """
-    Load the train-test split data.
+    Load the train-test split data memory-mapped.
+
+    The arrays are mapped read-only from their `.npy` files, so that
+    parallel training runs share the same pages instead of each one
+    deserialising its own copy.
 
     Parameters
     ----------
@@ -328,15 +324,30 @@ def get_train_test_data(
     -------
         The train-test splits.
 
+    Raises
+    ------
+    ValueError
+        If the bundle was saved with another version or an array does
+        not match its metadata.
+
     """
-    list_array: list[str] = ["x_train", "y_train", "x_test", "y_test"]
+    fpath: Path = MODEL_FOLDER / season.folder / folder
+    with Path.open(fpath / "train_test.json", "r") as f:
+        metadata: dict[str, Any] = json.load(f)
+    if metadata.get("version") != TRAIN_TEST_BUNDLE_VERSION:
+        msg: str = (
+            f"Train-test bundle in {fpath} has version "
+            f"{metadata.get('version')}, expected "
+            f"{TRAIN_TEST_BUNDLE_VERSION}. Run the split again."
+        )
+        raise ValueError(msg)
     dict_array: dict[str, npt.NDArray[np.float32]] = {}
-    for arr in list_array:
-        with Path.open(
-            MODEL_FOLDER / season.folder / folder / f"{arr}.pkl",
-            "rb",
-        ) as f:
-            dict_array[arr] = pickle.load(f)  # noqa: S301
+    arr: str
+    for arr in ["x_train", "y_train", "x_test", "y_test"]:
+        dict_array[arr] = np.load(fpath / f"{arr}.npy", mmap_mode="r")
+        if list(dict_array[arr].shape) != metadata["arrays"][arr]["shape"]:
+            msg = f"Train-test array {arr} in {fpath} does not match its shape"
+            raise ValueError(msg)
     return (
         dict_array["x_train"],
         dict_array["y_train"],
@@ -2,15 +2,90 @@
 
 import json
 import pickle  # noqa: S403
+import queue
+import threading
+from collections.abc import Callable
+from functools import partial
 from pathlib import Path
-from typing import Any
+from types import TracebackType
+from typing import Any, Self
 
+import numpy as np
+import numpy.typing as npt
 import pandas as pd
 import requests
+from loguru import logger
+
+from fantasypl.config.constants import (
+    DATA_FOLDER_FBREF,
+    WRITER_BATCH_SIZE,
+    WRITER_QUEUE_SIZE,
+)
+from fantasypl.config.schemas import Season
+
+
+def write_atomically(fpath: Path, write: Callable[[Path], object]) -> None:
+    """
+    Write a file through a temporary file and an atomic rename.
+
+    Parameters
+    ----------
+    fpath
+        The path to save in.
+    write
+        The function writing the contents to the path it is given; its
+        return value is ignored.
+
+    """
+    fpath_tmp: Path = fpath.with_name(f".{fpath.name}.tmp")
+    try:
+        write(fpath_tmp)
+    except BaseException:
+        fpath_tmp.unlink(missing_ok=True)
+        raise
+    fpath_tmp.replace(fpath)
+
+
+def _dump_json(
+    json_dict: dict[str, Any] | list[Any],
+    default: Any | None,  # noqa: ANN401
+    fpath: Path,
+) -> None:
+    """
+    Dump the dictionary in a JSON.
+
+    Parameters
+    ----------
+    json_dict
+        The dictionary or list to save.
+    default
+        The default parameter for json.dump().
+    fpath
+        The path to save in.
+
+    """
+    with Path.open(fpath, "w") as f:
+        json.dump(json_dict, f, default=default)
+
+
+def _dump_npy(arr: npt.NDArray[Any], fpath: Path) -> None:
+    """
+    Dump the array in a `.npy` file.
+
+    Parameters
+    ----------
+    arr
+        The array to save.
+    fpath
+        The path to save in, used as is.
+
+    """
+    with Path.open(fpath, "wb") as f:
+        np.save(f, arr)
 
 
 def save_json(
-    json_dict: dict[str, Any],
+    json_dict: dict[str, Any] | list[Any],
     fpath: Path,
     default: Any | None = None,  # noqa: ANN401
 ) -> None:
@@ -20,7 +95,7 @@ def save_json(
     Parameters
     ----------
     json_dict
-        The dictionary to save.
+        The dictionary or list to save.
     fpath
         The path to save in.
     default
@@ -28,8 +103,7 @@ def save_json(
 
     """
     Path.mkdir(fpath.parent, parents=True, exist_ok=True)
-    with Path.open(fpath, "w") as f:
-        json.dump(json_dict, f, default=default)
+    write_atomically(fpath, partial(_dump_json, json_dict, default))
 
 
 def save_pandas(df: pd.DataFrame, fpath: Path) -> None:
@@ -45,7 +119,168 @@ def save_pandas(df: pd.DataFrame, fpath: Path) -> None:
 
     """
     Path.mkdir(fpath.parent, parents=True, exist_ok=True)
-    df.to_csv(fpath, index=False)
+    write_atomically(fpath, partial(df.to_csv, index=False))
+
+
+def save_parquet(df: pd.DataFrame, fpath: Path) -> None:
+    """
+    Save the dataframe in a Parquet file.
+
+    Parameters
+    ----------
+    df
+        The pandas dataFrame to save.
+    fpath
+        The path to save in.
+
+    """
+    Path.mkdir(fpath.parent, parents=True, exist_ok=True)
+    write_atomically(fpath, partial(df.to_parquet, index=False))
+
+
+def append_parquet(df: pd.DataFrame, fpath: Path, keys: list[str]) -> None:
+    """
+    Append the dataframe to a Parquet file, replacing rows with its keys.
+
+    Existing rows sharing a key combination with the new rows are
+    dropped first, so appending the same data twice is a no-op. The
+    file is rewritten through a temporary file and an atomic rename.
+
+    Parameters
+    ----------
+    df
+        The pandas dataFrame to append.
+    fpath
+        The path of the Parquet file.
+    keys
+        The columns identifying a batch of rows.
+
+    """
+    if fpath.exists():
+        df_stored: pd.DataFrame = pd.read_parquet(fpath)
+        stored_keys: pd.MultiIndex = pd.MultiIndex.from_frame(
+            df_stored[keys].astype(str)
+        )
+        new_keys: pd.MultiIndex = pd.MultiIndex.from_frame(
+            df[keys].astype(str)
+        )
+        df = pd.concat(
+            [df_stored.loc[~stored_keys.isin(new_keys)], df],
+            ignore_index=True,
+        )
+    Path.mkdir(fpath.parent, parents=True, exist_ok=True)
+    write_atomically(fpath, partial(df.to_parquet, index=False))
+
+
+def get_match_table_fpath(
+    season: Season,
+    team_short_name: str,
+    table: str,
+) -> Path:
+    """
+    Get the path of a match table of a team for a season.
+
+    The tables of all the matches of a team are stored together, one
+    Parquet file per table type.
+
+    Parameters
+    ----------
+    season
+        The season under process.
+    team_short_name
+        The team short name.
+    table
+        The table type, one of `summary`, `passing`, `defense`, `misc`
+        and `keeper`.
+
+    Returns
+    -------
+        Path of the Parquet file.
+
+    """
+    return (
+        DATA_FOLDER_FBREF
+        / season.folder
+        / "matches"
+        / team_short_name
+        / f"{table}.parquet"
+    )
+
+
+def load_match_table(
+    season: Season,
+    team_short_name: str,
+    table: str,
+) -> pd.DataFrame:
+    """
+    Load a match table of a team for the whole season in a single read.
+
+    Parameters
+    ----------
+    season
+        The season under process.
+    team_short_name
+        The team short name.
+    table
+        The table type, one of `summary`, `passing`, `defense`, `misc`
+        and `keeper`.
+
+    Returns
+    -------
+        A pandas dataframe with the rows of every match, empty if the
+        team has no saved matches.
+
+    """
+    fpath: Path = get_match_table_fpath(season, team_short_name, table)
+    if not fpath.exists():
+        return pd.DataFrame()
+    return pd.read_parquet(fpath)
+
+
+def save_npy_bundle(
+    arrays: dict[str, npt.NDArray[Any]],
+    folder: Path,
+    name: str,
+    metadata: dict[str, Any],
+) -> None:
+    """
+    Save arrays as `.npy` files with a JSON metadata sidecar.
+
+    Each array is saved as `<key>.npy`, so that it can be loaded
+    memory-mapped, and the dtype and shape of each one are added to the
+    metadata. The sidecar is written last, so a bundle with a sidecar is
+    always complete.
+
+    Parameters
+    ----------
+    arrays
+        The arrays keyed by file name.
+    folder
+        The folder to save in.
+    name
+        The name of the metadata sidecar, without extension.
+    metadata
+        The metadata to save along with the arrays.
+
+    """
+    Path.mkdir(folder, parents=True, exist_ok=True)
+    key: str
+    arr: npt.NDArray[Any]
+    for key, arr in arrays.items():
+        write_atomically(
+            folder / f"{key}.npy",
+            partial(_dump_npy, np.ascontiguousarray(arr)),
+        )
+    sidecar: dict[str, Any] = {
+        **metadata,
+        "arrays": {
+            key: {"dtype": str(arr.dtype), "shape": list(arr.shape)}
+            for key, arr in arrays.items()
+        },
+    }
+    write_atomically(
+        folder / f"{name}.json", partial(_dump_json, sidecar, None)
+    )
 
 
 def save_pkl(obj: Any, fpath: Path, protocol: int | None = None) -> None:  # noqa: ANN401
@@ -82,3 +317,185 @@ def save_requests_response(response: requests.Response, fpath: Path) -> None:
     Path.mkdir(fpath.parent, parents=True, exist_ok=True)
     with Path.open(fpath, "wb") as f:
         f.write(response.content)
+
+
+class BackgroundWriter:
+    """
+    Writes files on a background thread, off the fetch and parse path.
+
+    Files are queued with the `save_*` methods and written in order by a
+    single thread. The queue is bounded, so producers wait when the disk
+    falls behind instead of piling up results in memory. Each batch of
+    queued files creates its missing folders once, and every file is
+    written through a temporary file and an atomic rename. `flush` is a
+    barrier returning once all the queued files are on disk.
+
+    Queued objects must not be modified until they are written.
+
+    Attributes
+    ----------
+        failed: The paths whose writing failed.
+
+    """
+
+    def __init__(
+        self,
+        max_pending: int = WRITER_QUEUE_SIZE,
+        batch_size: int = WRITER_BATCH_SIZE,
+    ) -> None:
+        """
+        Initialize the writer.
+
+        Parameters
+        ----------
+        max_pending
+            Maximum number of files waiting to be written.
+        batch_size
+            Maximum number of queued files handled at once.
+
+        """
+        self.failed: list[Path] = []
+        self._batch_size: int = batch_size
+        self._queue: queue.Queue[tuple[Path, Callable[[Path], None]] | None]
+        self._queue = queue.Queue(max_pending)
+        self._folders: set[Path] = set()
+        self._thread: threading.Thread = threading.Thread(
+            target=self._run, daemon=True
+        )
+
+    def __enter__(self) -> Self:
+        """
+        Start the writer thread.
+
+        Returns
+        -------
+            The writer.
+
+        """
+        self._thread.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """
+        Write the remaining files and stop the writer thread.
+
+        Parameters
+        ----------
+        exc_type
+            The type of the exception raised in the block, if any.
+        exc_value
+            The exception raised in the block, if any.
+        traceback
+            The traceback of the exception, if any.
+
+        Raises
+        ------
+        OSError
+            If any queued file could not be written.
+
+        """
+        self._queue.put(None)
+        self._thread.join()
+        if exc_type is None and self.failed:
+            msg: str = f"{len(self.failed)} files were not written"
+            raise OSError(msg)
+
+    def _run(self) -> None:
+        """Write the queued files in batches until stopped."""
+        while True:
+            batch: list[tuple[Path, Callable[[Path], None]] | None] = [
+                self._queue.get()
+            ]
+            while len(batch) < self._batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            jobs: list[tuple[Path, Callable[[Path], None]]] = [
+                job for job in batch if job is not None
+            ]
+            folder: Path
+            for folder in {fpath.parent for fpath, _ in jobs} - self._folders:
+                Path.mkdir(folder, parents=True, exist_ok=True)
+                self._folders.add(folder)
+            fpath: Path
+            write: Callable[[Path], None]
+            for fpath, write in jobs:
+                try:
+                    write_atomically(fpath, write)
+                except Exception:  # noqa: BLE001
+                    logger.exception("Writing failed for {}", fpath)
+                    self.failed.append(fpath)
+            for _ in batch:
+                self._queue.task_done()
+            if None in batch:
+                return
+
+    def submit(self, fpath: Path, write: Callable[[Path], None]) -> None:
+        """
+        Queue a file, waiting if the queue is full.
+
+        Parameters
+        ----------
+        fpath
+            The path to save in.
+        write
+            The function writing the contents to the path it is given.
+
+        """
+        self._queue.put((fpath, write))
+
+    def save_json(
+        self,
+        json_dict: dict[str, Any] | list[Any],
+        fpath: Path,
+        default: Any | None = None,  # noqa: ANN401
+    ) -> None:
+        """
+        Queue the dictionary to save in a JSON.
+
+        Parameters
+        ----------
+        json_dict
+            The dictionary or list to save.
+        fpath
+            The path to save in.
+        default
+            The default parameter for json.dump().
+
+        """
+        self.submit(fpath, partial(_dump_json, json_dict, default))
+
+    def save_pandas(self, df: pd.DataFrame, fpath: Path) -> None:
+        """
+        Queue the dataframe to save in a CSV.
+
+        Parameters
+        ----------
+        df
+            The pandas dataFrame to save.
+        fpath
+            The path to save in.
+
+        """
+        self.submit(fpath, partial(df.to_csv, index=False))
+
+    def flush(self) -> None:
+        """
+        Wait until all the queued files are written.
+
+        Raises
+        ------
+        OSError
+            If any queued file could not be written.
+
+        """
+        self._queue.join()
+        if self.failed:
+            msg: str = f"{len(self.failed)} files were not written"
+            raise OSError(msg)
@@ -0,0 +1,222 @@
+"""Helper functions for validating dataframes against pydantic schemas."""
+
+import datetime
+import typing
+from collections.abc import Hashable
+from typing import Any
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+from pydantic import BaseModel, ValidationError
+
+from fantasypl.config.schemas import Player, Team
+from fantasypl.utils.modeling_helper import get_list_players, get_list_teams
+
+
+_max_reported: int = 10
+
+
+def _get_references(annotation: Any) -> dict[str, BaseModel] | None:  # noqa: ANN401
+    """
+    Get the reference elements of a field, keyed by FBRef ID.
+
+    Parameters
+    ----------
+    annotation
+        The field annotation.
+
+    Returns
+    -------
+        The players or teams of the references, None for other fields.
+
+    """
+    if annotation is Player:
+        return {el.fbref_id: el for el in get_list_players()}
+    if annotation is Team:
+        return {el.fbref_id: el for el in get_list_teams()}
+    return None
+
+
+def _get_invalid_mask(  # noqa: PLR0911
+    series: pd.Series,
+    annotation: Any,  # noqa: ANN401
+) -> pd.Series:
+    """
+    Check a column against the annotation of its field.
+
+    Parameters
+    ----------
+    series
+        The column to check.
+    annotation
+        The field annotation.
+
+    Returns
+    -------
+        A boolean series, True for the invalid rows.
+
+    """
+    references: dict[str, BaseModel] | None = _get_references(annotation)
+    if references is not None:
+        return ~series.isin(references.keys())
+    if typing.get_origin(annotation) is typing.Literal:
+        choices: tuple[Any, ...] = typing.get_args(annotation)
+        invalid: pd.Series = ~series.isin([
+            c for c in choices if c is not None
+        ])
+        return invalid & series.notna() if None in choices else invalid
+    if annotation is bool:
+        return ~series.isin([True, False])
+    if annotation is int:
+        numbers: pd.Series = pd.to_numeric(series, errors="coerce")
+        return numbers.isna() | (numbers % 1 != 0)
+    if annotation is float:
+        return pd.to_numeric(series, errors="coerce").isna() & series.notna()
+    if annotation is datetime.date:
+        return pd.to_datetime(series, errors="coerce").isna()
+    if annotation is str:
+        return ~series.map(lambda x: isinstance(x, str)).astype(bool)
+    return pd.Series(data=False, index=series.index)
+
+
+def get_frame_errors(
+    df: pd.DataFrame,
+    model: type[BaseModel],
+) -> dict[str, list[Hashable]]:
+    """
+    Check every field of a schema column by column on a whole frame.
+
+    The Literal choices, the int, float, bool and date types and the
+    presence of referenced players and teams, given by FBRef ID, are
+    checked with one vectorised pass per column. Missing values are
+    accepted by float fields, as pydantic takes NaN as a float, and by
+    Literal fields allowing None.
+
+    Parameters
+    ----------
+    df
+        The dataframe to check, with one column per field.
+    model
+        The pydantic schema of the rows.
+
+    Returns
+    -------
+        The indices of the invalid rows keyed by field, only for the
+        fields with errors.
+
+    """
+    errors: dict[str, list[Hashable]] = {}
+    name: str
+    for name, field in model.model_fields.items():
+        if name not in df.columns:
+            errors[name] = df.index.tolist()
+            continue
+        invalid: pd.Series = _get_invalid_mask(df[name], field.annotation)
+        if invalid.any():
+            errors[name] = df.index[invalid].tolist()
+    return errors
+
+
+def get_row_errors(
+    df: pd.DataFrame,
+    model: type[BaseModel],
+) -> dict[Hashable, str]:
+    """
+    Validate a frame row by row with pydantic.
+
+    This is much slower than `get_frame_errors` but gives the full
+    pydantic error of each row. Referenced players and teams are looked
+    up by FBRef ID.
+
+    Parameters
+    ----------
+    df
+        The dataframe to check, with one column per field.
+    model
+        The pydantic schema of the rows.
+
+    Returns
+    -------
+        The pydantic error message keyed by index of the invalid rows.
+
+    """
+    references: dict[str, dict[str, BaseModel]] = {
+        name: refs
+        for name, field in model.model_fields.items()
+        if (refs := _get_references(field.annotation)) is not None
+    }
+    errors: dict[Hashable, str] = {}
+    idx: Hashable
+    row: pd.Series
+    for idx, row in df.iterrows():
+        record: dict[Hashable, Any] = {
+            k: references[k].get(v, v) if k in references else v
+            for k, v in row.items()
+        }
+        try:
+            model.model_validate(record)
+        except ValidationError as err:
+            errors[idx] = str(err)
+    return errors
+
+
+def validate_frame(
+    df: pd.DataFrame,
+    model: type[BaseModel],
+    *,
+    debug: bool = False,
+) -> pd.DataFrame:
+    """
+    Validate a frame against a schema and cast it to the field types.
+
+    Parameters
+    ----------
+    df
+        The dataframe to validate, with one column per field.
+    model
+        The pydantic schema of the rows.
+    debug
+        If True, also validate every row with pydantic and log the
+        errors of each invalid row.
+
+    Returns
+    -------
+        The schema columns, with int, float, bool and date fields cast.
+
+    Raises
+    ------
+    ValueError
+        If any row does not match the schema.
+
+    """
+    if debug:
+        idx: Hashable
+        error: str
+        for idx, error in get_row_errors(df, model).items():
+            logger.error(
+                "Row {} is not a valid {}: {}", idx, model.__name__, error
+            )
+    errors: dict[str, list[Hashable]] = get_frame_errors(df, model)
+    if errors:
+        details: str = "; ".join(
+            f"{name} at {indices[:_max_reported]} ({len(indices)} rows)"
+            for name, indices in errors.items()
+        )
+        msg: str = f"Invalid {model.__name__} rows: {details}"
+        raise ValueError(msg)
+
+    df_valid: pd.DataFrame = df[list(model.model_fields)].copy()
+    casts: dict[Any, np.dtype[Any]] = {
+        int: np.dtype("int64"),
+        float: np.dtype("float64"),
+        bool: np.dtype("bool"),
+    }
+    for name, field in model.model_fields.items():
+        if field.annotation in casts:
+            df_valid[name] = pd.to_numeric(df_valid[name]).astype(
+                casts[field.annotation]
+            )
+        elif field.annotation is datetime.date:
+            df_valid[name] = pd.to_datetime(df_valid[name])
+    return df_valid
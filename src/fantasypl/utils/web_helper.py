@@ -1,164 +1,721 @@
 """Helper functions for scraping the web."""
 
 import asyncio
+import email.utils
 import operator
+import re
+import threading
 import time
-from functools import reduce
-from typing import Awaitable
+from collections.abc import Callable, Iterator
+from functools import partial, reduce
+from http import HTTPStatus
+from typing import cast
+from urllib.parse import urlparse
 
 import pandas as pd
 import requests
-from lxml import html
+from loguru import logger
+from lxml import etree, html
+from requests.adapters import HTTPAdapter
 
+from fantasypl.config.constants import (
+    ARCHIVE_URL_PATTERN,
+    HOST_RATE_LIMITS,
+    HTML_STREAM_CHUNK_SIZE,
+    HTTP_POOL_SIZE,
+    RATE_BACKOFF_FACTOR,
+    RATE_MAX_INTERVAL,
+    RATE_SPEEDUP_AFTER,
+    RATE_SPEEDUP_STEP,
+)
+from fantasypl.utils.archive_helper import archive_page
+from fantasypl.utils.cache_helper import (
+    CachedResponse,
+    cache_response,
+    get_cached_response,
+    is_offline_mode,
+    read_cached_content,
+    revalidate_response,
+)
+
+
+class _TokenBucket:
+    """
+    A thread-safe token bucket throttling requests to one host.
+
+    The refill interval adapts to the host: it is multiplied on every
+    429/503 answer and shortened again after a run of successes, never
+    going below the configured interval.
+
+    Attributes
+    ----------
+        min_interval: The configured seconds needed to refill a token.
+        interval: Current seconds needed to refill a single token.
+        capacity: Maximum number of tokens the bucket can hold.
+
+    """
+
+    def __init__(self, interval: float, capacity: int = 1) -> None:
+        """
+        Initialize a full bucket.
+
+        Parameters
+        ----------
+        interval
+            Seconds needed to refill a single token.
+        capacity
+            Maximum number of tokens the bucket can hold.
+
+        """
+        self.min_interval: float = interval
+        self.interval: float = interval
+        self.capacity: int = capacity
+        self._tokens: float = float(capacity)
+        self._updated: float = time.monotonic()
+        self._not_before: float = 0.0
+        self._successes: int = 0
+        self._lock: threading.Lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take one token, blocking until it is available."""
+        with self._lock:
+            now: float = time.monotonic()
+            self._tokens = min(
+                self.capacity,
+                self._tokens + (now - self._updated) / self.interval,
+            )
+            self._updated = now
+            wait: float = max(
+                0.0,
+                (1 - self._tokens) * self.interval,
+                self._not_before - now,
+            )
+            self._tokens -= 1
+        if wait > 0:
+            time.sleep(wait)
+
+    def on_success(self) -> None:
+        """Record a successful request, speeding up after a long run."""
+        with self._lock:
+            self._successes += 1
+            if self._successes < RATE_SPEEDUP_AFTER:
+                return
+            self._successes = 0
+            self.interval = max(
+                self.min_interval, self.interval - RATE_SPEEDUP_STEP
+            )
+
+    def on_throttle(self, retry_after: float | None) -> None:
+        """
+        Record a throttled request and back off.
+
+        Parameters
+        ----------
+        retry_after
+            Seconds the host asked us to wait, if it said so.
+
+        """
+        with self._lock:
+            self._successes = 0
+            self.interval = min(
+                RATE_MAX_INTERVAL, self.interval * RATE_BACKOFF_FACTOR
+            )
+            self._not_before = max(
+                self._not_before,
+                time.monotonic()
+                + (retry_after if retry_after is not None else self.interval),
+            )
+        logger.warning(
+            "Throttled, request interval is now {:.1f}s", self.interval
+        )
+
+
+_session: requests.Session = requests.Session()
+_session.headers.update({"User-Agent": "Mozilla/5.0"})
+_adapter: HTTPAdapter = HTTPAdapter(
+    pool_connections=HTTP_POOL_SIZE,
+    pool_maxsize=HTTP_POOL_SIZE,
+)
+_session.mount("https://", _adapter)
+_session.mount("http://", _adapter)
+
+_xpath_table: etree.XPath = etree.XPath(
+    "descendant-or-self::table[@id = $table_id][1]"
+)
+_xpath_header_rows: etree.XPath = etree.XPath("descendant::thead/tr")
+_xpath_header_cells: etree.XPath = etree.XPath("descendant::th")
+_xpath_body_rows: etree.XPath = etree.XPath("descendant::tbody/tr[.//td]")
+_xpath_row_cells: etree.XPath = etree.XPath(
+    "descendant::*[self::td or self::th]"
+)
+_xpath_first_link: etree.XPath = etree.XPath("(descendant::a)[1]")
+
+_buckets: dict[str, _TokenBucket] = {
+    host: _TokenBucket(interval) for host, interval in HOST_RATE_LIMITS.items()
+}
+
+
+def get_url_host(url: str) -> str:
+    """
+    Get the host name of a URL without the `www.` prefix.
+
+    Parameters
+    ----------
+    url
+        The URL to parse.
+
+    Returns
+    -------
+        The host name.
+
+    """
+    return (urlparse(url).hostname or "").removeprefix("www.")
+
+
+def _throttle(url: str) -> None:
+    """
+    Wait for the rate limiter of the URL host, if it has one.
+
+    Parameters
+    ----------
+    url
+        The URL about to be requested.
+
+    """
+    bucket: _TokenBucket | None = _buckets.get(get_url_host(url))
+    if bucket is not None:
+        bucket.acquire()
+
+
+def _get_retry_after(response: requests.models.Response) -> float | None:
+    """
+    Get the Retry-After header of a response in seconds.
+
+    Parameters
+    ----------
+    response
+        The response of the request.
+
+    Returns
+    -------
+        Seconds to wait, or None if the header is missing or invalid.
 
-def get_content(url: str, delay: int = 8, timeout: int = 15) -> str:
+    """
+    value: str | None = response.headers.get("Retry-After")
+    if value is None:
+        return None
+    if value.strip().isdigit():
+        return float(value)
+    try:
+        return max(
+            0.0,
+            email.utils.parsedate_to_datetime(value).timestamp() - time.time(),
+        )
+    except (TypeError, ValueError):
+        return None
+
+
+def _record_response(url: str, response: requests.models.Response) -> None:
+    """
+    Feed the response status to the rate limiter of the URL host.
+
+    Parameters
+    ----------
+    url
+        The requested URL.
+    response
+        The response of the request.
+
+    """
+    bucket: _TokenBucket | None = _buckets.get(get_url_host(url))
+    if bucket is None:
+        return
+    if response.status_code in {
+        HTTPStatus.TOO_MANY_REQUESTS,
+        HTTPStatus.SERVICE_UNAVAILABLE,
+    }:
+        bucket.on_throttle(_get_retry_after(response))
+    elif response.ok:
+        bucket.on_success()
+
+
+def get_content(
+    url: str,
+    timeout: int = 15,
+    session: requests.Session | None = None,
+) -> str:
     """
     Get the contents of a web page.
 
+    Responses are cached on disk. A cached page younger than its TTL is
+    served without a request, an older one is revalidated with its
+    ETag/Last-Modified headers. In offline mode only the cache is used.
+    Downloaded pages matching the archive pattern are also archived.
+    Requests to rate-limited hosts wait for their turn before being
+    sent, so no time is lost after the last request of a run, and their
+    status codes tune the rate limiter. Error statuses are raised as
+    `requests.HTTPError`.
+
     Parameters
     ----------
     url
         The URL to scrape.
-    delay
-        The delay between requests in seconds.
     timeout
         The timeout in seconds.
+    session
+        The session sending the request, the shared scraping session by
+        default.
 
     Returns
     -------
         The contents of the web page.
 
+    Raises
+    ------
+    FileNotFoundError
+        If the page is not cached in offline mode.
+
     """
-    with requests.Session() as session:
-        response: requests.models.Response = session.get(
-            url=url,
-            headers={"User-Agent": "Mozilla/5.0"},
-            timeout=timeout,
+    cached: CachedResponse | None = get_cached_response(url)
+    if cached is not None and (is_offline_mode() or cached.is_fresh()):
+        return read_cached_content(cached).decode("utf-8")
+    if is_offline_mode():
+        msg: str = f"{url} is not cached and offline mode is enabled"
+        raise FileNotFoundError(msg)
+    _throttle(url)
+    response: requests.models.Response = (session or _session).get(
+        url=url,
+        headers=cached.conditional_headers() if cached is not None else None,
+        timeout=timeout,
+    )
+    _record_response(url, response)
+    if cached is not None and response.status_code == HTTPStatus.NOT_MODIFIED:
+        revalidate_response(cached)
+        return read_cached_content(cached).decode("utf-8")
+    response.raise_for_status()
+    if response.status_code == HTTPStatus.OK:
+        cache_response(
+            url,
+            response.content,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
         )
-        time.sleep(delay)
+        if re.search(ARCHIVE_URL_PATTERN, url):
+            archive_page(url, response.content)
     return response.content.decode("utf-8")
 
 
-def extract_table(
+def iter_elements_by_id(
     content: str,
-    table_id: str,
+    element_ids: list[str],
     *,
-    href: bool = False,
-    dropna_cols: list[str] | None = None,
-) -> pd.DataFrame:
+    chunk_size: int = HTML_STREAM_CHUNK_SIZE,
+    skip_classes: tuple[str, ...] = (),
+) -> Iterator[html.HtmlElement]:
     """
-    Extract the table from the web page content given the table ID.
+    Stream the web page and yield the requested elements as they end.
+
+    Only `div` and `table` elements are tracked, so the IDs must belong
+    to those. Every tracked element outside the requested ones is
+    cleared once parsed, along with its already parsed siblings, and a
+    requested element is cleared once the caller resumes. Parsing stops
+    as soon as all the IDs have been seen, otherwise the parser is closed
+    at the end of the page so that unclosed elements still end.
 
     Parameters
     ----------
     content
         The contents of the web page.
-    table_id
-        The table ID to fetch.
-    href
-        Boolean value for whether href links are required.
-    dropna_cols
-        Columns to mark NA rows.
+    element_ids
+        The IDs of the elements to yield.
+    chunk_size
+        Number of characters fed to the parser at a time.
+    skip_classes
+        Classes of elements passed over even when their ID is requested.
+
+    Yields
+    ------
+        The requested elements in page order, each one only valid until
+        the next one is requested.
+
+    """
+    parser: etree.HTMLPullParser = etree.HTMLPullParser(
+        events=("start", "end"), tag=("div", "table")
+    )
+    parser.set_element_class_lookup(html.HtmlElementClassLookup())
+    remaining: set[str] = set(element_ids)
+    depth: int = 0
+
+    def _read_events() -> Iterator[html.HtmlElement]:
+        nonlocal depth
+        event: str
+        element: html.HtmlElement
+        for event, element in parser.read_events():
+            element_id: str | None = element.get("id")
+            requested: bool = (
+                element_id in remaining
+                and element.get("class") not in skip_classes
+            )
+            if event == "start":
+                depth += requested
+                continue
+            if requested:
+                remaining.discard(element_id)
+                depth -= 1
+                yield element
+                element.clear(keep_tail=True)
+                if not remaining:
+                    return
+            elif not depth:
+                element.clear(keep_tail=True)
+                while element.getprevious() is not None:
+                    del element.getparent()[0]
+
+    start: int
+    for start in range(0, len(content), chunk_size):
+        parser.feed(content[start : start + chunk_size])
+        yield from _read_events()
+        if not remaining:
+            return
+    parser.close()
+    yield from _read_events()
+
+
+def _get_headers(table: html.HtmlElement) -> tuple[list[str], list[str]]:
+    """
+    Flatten the multi-row header of a table into column names.
+
+    Parameters
+    ----------
+    table
+        The table element.
 
     Returns
     -------
-        A pandas dataframe containing the table data.
+        The `data-stat` values of each header row joined by underscores,
+        and the `data-stat` value of the last header row.
 
     """
-    if dropna_cols is None:
-        dropna_cols = []
-    tree: html.HtmlElement = html.fromstring(content)
-    try:
-        table: html.HtmlElement = tree.cssselect(f"table#{table_id}")[0]
-    except IndexError:
-        return pd.DataFrame()
     headers_multi_index: list[list[str]] = [
         reduce(
             operator.add,
             [
-                [cell.get("data-stat")] * int(cell.get("colspan", 1))
-                for cell in row.cssselect("th")
+                [cell.get("data-stat", "")] * int(cell.get("colspan", 1))
+                for cell in cast(
+                    "list[html.HtmlElement]", _xpath_header_cells(row)
+                )
             ],
         )
-        for row in table.cssselect("thead>tr")
+        for row in cast("list[html.HtmlElement]", _xpath_header_rows(table))
     ]
     headers: list[str] = [
         "_".join(filter(None, items))
         for items in zip(*headers_multi_index, strict=False)
     ]
+    leaves: list[str] = [
+        next(filter(None, reversed(items)), "")
+        for items in zip(*headers_multi_index, strict=False)
+    ]
+    return headers, leaves
 
-    df_table: pd.DataFrame
-    if href:
-        table_data: list[list[tuple[str, str]]] = [
-            [
-                (cell.text_content(), cell.cssselect("a")[0].get("href"))
-                if cell.cssselect("a")
-                else (cell.text_content(), "")
-                for cell in row.cssselect("td, th")
-            ]
-            for row in table.cssselect("tbody>tr")
-            if len(row.cssselect("td"))
-        ]
-        df_table = pd.DataFrame(table_data, columns=headers)
-    else:
-        table_data_simple: list[list[str]] = [
-            [cell.text_content() for cell in row.cssselect("td, th")]
-            for row in table.cssselect("tbody>tr")
-            if len(row.cssselect("td"))
-        ]
-        df_table = pd.DataFrame(table_data_simple, columns=headers)
+
+def _coerce_column(values: pd.Series, dtype: str) -> pd.Series:
+    """
+    Convert a column of cell texts to its declared type.
+
+    Thousands separators are stripped and empty cells become NA. Integer
+    columns holding fractions fall back to floats.
+
+    Parameters
+    ----------
+    values
+        The cell texts.
+    dtype
+        The declared type, one of `int`, `float`, `date` or `category`.
+
+    Returns
+    -------
+        The typed column.
+
+    """
+    cleaned: pd.Series = values.str.strip().replace("", None)
+    if dtype == "category":
+        return cleaned.astype("category")
+    if dtype == "date":
+        return pd.to_datetime(cleaned, format="%Y-%m-%d", errors="coerce")
+    numeric: pd.Series = pd.to_numeric(
+        cleaned.str.replace(",", "", regex=False), errors="coerce"
+    )
+    if dtype == "int" and numeric.dropna().mod(1).eq(0).all():
+        return numeric.astype("Int64")
+    return numeric.astype("Float64")
+
+
+def _get_cell_value(
+    cell: html.HtmlElement,
+    *,
+    href: bool,
+) -> str | tuple[str, str | None]:
+    """
+    Get the value of a table cell.
+
+    Parameters
+    ----------
+    cell
+        The table cell element.
+    href
+        Boolean value for whether href links are required.
+
+    Returns
+    -------
+        The cell text, with the first link of the cell if href is True.
+
+    """
+    text: str = cast("str", cell.text_content())
+    if not href:
+        return text
+    links: list[html.HtmlElement] = cast(
+        "list[html.HtmlElement]", _xpath_first_link(cell)
+    )
+    return text, links[0].get("href") if links else ""
+
+
+def _extract_table_from_tree(  # noqa: PLR0913
+    tree: html.HtmlElement,
+    table_id: str,
+    *,
+    href: bool,
+    dropna_cols: list[str],
+    dtypes: dict[str, str],
+    columns: list[str] | None,
+) -> pd.DataFrame:
+    """
+    Extract the table from a parsed web page given the table ID.
+
+    The cells are read with precompiled XPath expressions and collected
+    straight into column lists, then typed by their `data-stat` value.
+    Cells of columns outside the whitelist are never read.
+
+    Parameters
+    ----------
+    tree
+        The parsed web page.
+    table_id
+        The table ID to fetch.
+    href
+        Boolean value for whether href links are required.
+    dropna_cols
+        Columns to mark NA rows.
+    dtypes
+        Column types keyed by the `data-stat` value of the last header
+        row. Typed columns are read without their href links.
+    columns
+        Column names to keep besides the dropna columns, or None to keep
+        all columns.
+
+    Returns
+    -------
+        A pandas dataframe containing the table data.
+
+    Raises
+    ------
+    ValueError
+        If a row has more cells than the table has columns.
+
+    """
+    tables: list[html.HtmlElement] = cast(
+        "list[html.HtmlElement]", _xpath_table(tree, table_id=table_id)
+    )
+    if not tables:
+        return pd.DataFrame()
+    table: html.HtmlElement = tables[0]
+    headers: list[str]
+    leaves: list[str]
+    headers, leaves = _get_headers(table)
+    n_headers: int = len(headers)
+    keep: list[int] = [
+        j
+        for j, header in enumerate(headers)
+        if columns is None or header in columns or header in dropna_cols
+    ]
+
+    links: list[bool] = [href and leaves[j] not in dtypes for j in keep]
+    values: list[list[str | tuple[str, str | None] | None]] = [
+        [] for _ in keep
+    ]
+    n_rows: int = 0
+    row: html.HtmlElement
+    for row in cast("list[html.HtmlElement]", _xpath_body_rows(table)):
+        cells: list[html.HtmlElement] = cast(
+            "list[html.HtmlElement]", _xpath_row_cells(row)
+        )
+        if len(cells) > n_headers:
+            msg: str = (
+                f"{n_headers} columns passed, "
+                f"passed data had {len(cells)} columns"
+            )
+            raise ValueError(msg)
+        k: int
+        j: int
+        for k, j in enumerate(keep):
+            values[k].append(
+                _get_cell_value(cells[j], href=links[k])
+                if j < len(cells)
+                else None
+            )
+        n_rows += 1
+
+    df_table: pd.DataFrame = (
+        pd.DataFrame(dict(enumerate(values)))
+        if n_rows
+        else pd.DataFrame([], columns=range(len(keep)))
+    )
+    df_table.columns = pd.Index([headers[j] for j in keep])
     if dropna_cols:
         df_table = df_table.dropna(subset=dropna_cols, how="any")
-        df_table = df_table.loc[~df_table[dropna_cols].eq("").any(axis=1)]
+        df_table = df_table.loc[~df_table[dropna_cols].isin([""]).any(axis=1)]
+    for k, j in enumerate(keep):
+        if leaves[j] in dtypes:
+            df_table.isetitem(
+                k,
+                _coerce_column(df_table.iloc[:, k], dtypes[leaves[j]]).array,
+            )
     return df_table
 
 
-async def extract_table_async(
-    content: str,
+def extract_tables(  # noqa: PLR0913
+    content: str | html.HtmlElement,
+    table_ids: list[str],
+    *,
+    href: bool = False,
+    dropna_cols: list[str] | None = None,
+    dtypes: dict[str, str] | None = None,
+    columns: list[str] | None = None,
+    stream: bool = False,
+) -> list[pd.DataFrame]:
+    """
+    Extract several tables from the web page content in a single parse.
+
+    Parameters
+    ----------
+    content
+        The contents of the web page, or its already parsed tree.
+    table_ids
+        The table IDs to fetch.
+    href
+        Boolean value for whether href links are required.
+    dropna_cols
+        Columns to mark NA rows.
+    dtypes
+        Column types keyed by `data-stat`, other columns stay strings.
+        Typed columns are read without their href links.
+    columns
+        Column names to keep besides the dropna columns, or None to keep
+        all columns.
+    stream
+        Boolean value for whether the page content is parsed
+        incrementally, stopping after the last requested table.
+
+    Returns
+    -------
+        A list of pandas dataframes in the order of the table IDs.
+
+    """
+    extract: Callable[[html.HtmlElement, str], pd.DataFrame] = partial(
+        _extract_table_from_tree,
+        href=href,
+        dropna_cols=dropna_cols or [],
+        dtypes=dtypes or {},
+        columns=columns,
+    )
+    if stream and isinstance(content, str):
+        dfs: dict[str, pd.DataFrame] = {
+            str(element.get("id")): extract(element, str(element.get("id")))
+            for element in iter_elements_by_id(content, table_ids)
+        }
+        return [dfs.get(table_id, pd.DataFrame()) for table_id in table_ids]
+    tree: html.HtmlElement = (
+        html.fromstring(content) if isinstance(content, str) else content
+    )
+    return [extract(tree, table_id) for table_id in table_ids]
+
+
+def extract_table(  # noqa: PLR0913
+    content: str | html.HtmlElement,
     table_id: str,
     *,
     href: bool = False,
     dropna_cols: list[str] | None = None,
+    dtypes: dict[str, str] | None = None,
+    columns: list[str] | None = None,
+    stream: bool = False,
 ) -> pd.DataFrame:
     """
-    Extract the table asynchronously.
+    Extract the table from the web page content given the table ID.
+
+    Parameters
+    ----------
+    content
+        The contents of the web page, or its already parsed tree.
+    table_id
+        The table ID to fetch.
+    href
+        Boolean value for whether href links are required.
+    dropna_cols
+        Columns to mark NA rows.
+    dtypes
+        Column types keyed by `data-stat`, other columns stay strings.
+        Typed columns are read without their href links.
+    columns
+        Column names to keep besides the dropna columns, or None to keep
+        all columns.
+    stream
+        Boolean value for whether the page content is parsed
+        incrementally, stopping after the table.
 
     Returns
     -------
         A pandas dataframe containing the table data.
 
     """
-    return await asyncio.to_thread(
-        extract_table,
+    return extract_tables(
         content,
-        table_id,
+        [table_id],
         href=href,
         dropna_cols=dropna_cols,
-    )
+        dtypes=dtypes,
+        columns=columns,
+        stream=stream,
+    )[0]
 
 
-async def get_single_table(
-    content: str,
+async def get_single_table(  # noqa: PLR0913
+    content: str | html.HtmlElement,
     tables: list[str],
     *,
     href: bool = False,
     dropna_cols: list[str] | None = None,
+    dtypes: dict[str, str] | None = None,
+    columns: list[str] | None = None,
+    stream: bool = False,
 ) -> list[pd.DataFrame]:
     """
-    Merge the results into a list of pandas dataframes.
+    Extract the tables of a web page on a worker thread.
+
+    The page is parsed once and all tables come from the same tree.
 
     Returns
     -------
         A list of pandas dataframes containing table data.
 
     """
-    coroutines: list[Awaitable[pd.DataFrame]] = [
-        extract_table_async(
-            content=content,
-            table_id=table_id,
-            href=href,
-            dropna_cols=dropna_cols,
-        )
-        for table_id in tables
-    ]
-    return list(await asyncio.gather(*coroutines))
+    return await asyncio.to_thread(
+        extract_tables,
+        content,
+        tables,
+        href=href,
+        dropna_cols=dropna_cols,
+        dtypes=dtypes,
+        columns=columns,
+        stream=stream,
+    )
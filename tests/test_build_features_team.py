@@ -0,0 +1,155 @@
+"""Tests for building the team features."""
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from fantasypl.config.schemas import Season, Seasons
+from fantasypl.core.train import build_features_team
+from fantasypl.utils import analytics_helper, modeling_helper
+
+
+_stats: list[str] = ["xgoals", "xyc", "xpens"]
+
+
+@pytest.fixture
+def season(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Season:
+    """
+    Point the data folders to a temporary folder with one season played.
+
+    Every team plays once a week and the matches of a week are spread
+    over three days, so that several rows share a date.
+
+    Parameters
+    ----------
+    tmp_path
+        The temporary folder.
+    monkeypatch
+        The pytest monkeypatch fixture.
+
+    Returns
+    -------
+        The season of the matches.
+
+    """
+    season: Season = Seasons.SEASON_2324.value
+    for module in (analytics_helper, modeling_helper, build_features_team):
+        monkeypatch.setattr(module, "DATA_FOLDER_FBREF", tmp_path)
+    monkeypatch.setattr(
+        analytics_helper, "ANALYTICS_DB_PATH", tmp_path / "store.duckdb"
+    )
+    monkeypatch.setattr(analytics_helper, "DATA_FOLDER_CACHE", tmp_path)
+    monkeypatch.setattr(analytics_helper, "DATA_FOLDER_FPL", tmp_path)
+    monkeypatch.setattr(analytics_helper, "MODEL_FOLDER", tmp_path)
+
+    rng: np.random.Generator = np.random.default_rng(0)
+    cols: list[str] = sorted({
+        *build_features_team.cols_form_for_xgoals,
+        *build_features_team.cols_static_against_xgoals,
+        *build_features_team.cols_form_for_xyc,
+        *build_features_team.cols_static_against_xyc,
+        *build_features_team.cols_form_for_xpens,
+        *build_features_team.cols_static_against_xpens,
+    })
+    teams: list[str] = [f"t{i:02d}" for i in range(20)]
+    rows: list[dict[str, object]] = []
+    week: int
+    for week in range(38):
+        order: list[str] = list(rng.permutation(teams))
+        k: int
+        for k in range(10):
+            date: pd.Timestamp = pd.Timestamp("2023-08-12") + pd.Timedelta(
+                days=7 * week + k % 3
+            )
+            home: str = order[2 * k]
+            away: str = order[2 * k + 1]
+            team: str
+            opponent: str
+            venue: str
+            for team, opponent, venue in [
+                (home, away, "Home"),
+                (away, home, "Away"),
+            ]:
+                rows.append({
+                    "team": team,
+                    "opponent": opponent,
+                    "date": date,
+                    "venue": venue,
+                    "season": season.fbref_long_name,
+                    **{col: float(rng.integers(0, 10)) for col in cols},
+                })
+    df: pd.DataFrame = pd.DataFrame(rows).sample(frac=1, random_state=1)
+    df.loc[df.sample(30, random_state=2).index, "possession"] = np.nan
+    Path.mkdir(tmp_path / season.folder, parents=True)
+    df.to_parquet(
+        tmp_path / season.folder / "team_matchlogs.parquet", index=False
+    )
+    return season
+
+
+def _read_features(season: Season) -> dict[str, pd.DataFrame]:
+    """
+    Read the saved team features of each stat.
+
+    Parameters
+    ----------
+    season
+        The season of the features.
+
+    Returns
+    -------
+        The features sorted by team and date, keyed by stat.
+
+    """
+    return {
+        stat: pd
+        .read_csv(
+            build_features_team.DATA_FOLDER_FBREF
+            / season.folder
+            / "training"
+            / f"teams_{stat}_features.csv"
+        )
+        .sort_values(["team", "date"])
+        .reset_index(drop=True)
+        for stat in _stats
+    }
+
+
+def test_static_data_keeps_same_date_order() -> None:
+    """Check that rows of the same date keep their order when sorted."""
+    data: pd.DataFrame = pd.DataFrame({
+        "team": [f"t{i:02d}" for i in range(40)],
+        "date": pd.to_datetime(["2023-08-19", "2023-08-12"] * 20),
+        "goals": np.arange(40, dtype=float),
+    })
+
+    df: pd.DataFrame = modeling_helper.get_static_data(data, ["goals"], "team")
+
+    assert df.index.tolist() == [*range(1, 40, 2), *range(0, 40, 2)]
+
+
+def test_store_features_match_pandas(season: Season) -> None:
+    """
+    Check that the analytics store builds the pandas team features.
+
+    Parameters
+    ----------
+    season
+        The season of the matches.
+
+    """
+    pytest.importorskip("duckdb")
+    analytics_helper.build_analytics_store([season])
+    build_features_team.get_features(season)
+    expected: dict[str, pd.DataFrame] = _read_features(season)
+
+    build_features_team.get_features(season, use_store=True)
+
+    stat: str
+    df: pd.DataFrame
+    for stat, df in _read_features(season).items():
+        pd.testing.assert_frame_equal(
+            df[expected[stat].columns], expected[stat], check_dtype=False
+        )
@@ -0,0 +1,177 @@
+"""Tests for getting FBRef match details."""
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+import pytest
+import requests
+
+from fantasypl.config.schemas import Season, Seasons
+from fantasypl.core.fetch import get_fbref_matches
+from fantasypl.utils import (
+    FetchEngine,
+    archive_helper,
+    cache_helper,
+    modeling_helper,
+    save_helper,
+    web_helper,
+)
+
+
+_match_link: str = "/en/matches/0a1b2c3d/Arsenal-Chelsea"
+_team_ids: dict[str, str] = {"18bb7c10": "ARS", "cff3d9bb": "CHE"}
+
+
+@pytest.fixture
+def season(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Season:
+    """
+    Point the data folders to a temporary folder with one season match.
+
+    Parameters
+    ----------
+    tmp_path
+        The temporary folder.
+    monkeypatch
+        The pytest monkeypatch fixture.
+
+    Returns
+    -------
+        The season of the match.
+
+    """
+    season: Season = Seasons.SEASON_2425.value
+    monkeypatch.setattr(get_fbref_matches, "DATA_FOLDER_FBREF", tmp_path)
+    monkeypatch.setattr(save_helper, "DATA_FOLDER_FBREF", tmp_path)
+    monkeypatch.setattr(cache_helper, "DATA_FOLDER_CACHE", tmp_path / "cache")
+    monkeypatch.setattr(modeling_helper, "DATA_FOLDER_REF", tmp_path)
+    monkeypatch.setattr(
+        archive_helper, "DATA_FOLDER_ARCHIVE", tmp_path / "archive"
+    )
+    monkeypatch.setattr(
+        archive_helper, "_pack_path", tmp_path / "archive" / "pages.pack"
+    )
+    monkeypatch.setattr(
+        archive_helper, "_index_path", tmp_path / "archive" / "index.jsonl"
+    )
+    monkeypatch.setattr(web_helper, "_throttle", lambda _: None)
+
+    async def _parse_inline(  # noqa: RUF029
+        _: FetchEngine,
+        func: Any,  # noqa: ANN401
+        *args: Any,  # noqa: ANN401
+    ) -> Any:  # noqa: ANN401
+        return func(*args)
+
+    monkeypatch.setattr(FetchEngine, "parse", _parse_inline)
+
+    teams: list[dict[str, Any]] = [
+        {
+            "fbref_id": fbref_id,
+            "fpl_code": i,
+            "fpl_name": short_name,
+            "fbref_name": short_name,
+            "short_name": short_name,
+        }
+        for i, (fbref_id, short_name) in enumerate(_team_ids.items())
+    ]
+    (tmp_path / "teams.json").write_text(json.dumps({"teams": teams}))
+    Path.mkdir(tmp_path / season.folder, parents=True)
+    pd.DataFrame({
+        "home_team": ["18bb7c10"],
+        "away_team": ["cff3d9bb"],
+        "date": ["2024-08-17"],
+        "match_link": [_match_link],
+    }).to_csv(tmp_path / season.folder / "match_links.csv", index=False)
+    return season
+
+
+def _mock_session_get(
+    monkeypatch: pytest.MonkeyPatch, content: bytes
+) -> list[str]:
+    """
+    Answer every request with a page and record the requested URLs.
+
+    Parameters
+    ----------
+    monkeypatch
+        The pytest monkeypatch fixture.
+    content
+        The body of the answered page.
+
+    Returns
+    -------
+        The requested URLs, filled as the requests are sent.
+
+    """
+    urls: list[str] = []
+
+    def _get(url: str, **_: Any) -> requests.Response:  # noqa: ANN401
+        urls.append(url)
+        response: requests.Response = requests.Response()
+        response.status_code = 200
+        response._content = content  # noqa: SLF001
+        return response
+
+    monkeypatch.setattr(web_helper._session, "get", _get)  # noqa: SLF001
+    return urls
+
+
+def test_incomplete_match_is_fetched_again(
+    season: Season, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Check that an incomplete match skips its still fresh cached page.
+
+    Parameters
+    ----------
+    season
+        The season of the match.
+    monkeypatch
+        The pytest monkeypatch fixture.
+
+    """
+    url: str = get_fbref_matches.get_match_url(_match_link)
+    cache_helper.cache_response(url, b"<html></html>", None, None)
+    get_fbref_matches.get_manifest_fpath(season).write_text(
+        json.dumps({
+            "matches": {
+                _match_link: {"fetched_at": "2024-08-18", "tables": {}}
+            }
+        })
+    )
+    urls: list[str] = _mock_session_get(monkeypatch, b"<html></html>")
+
+    get_fbref_matches.get_matches(season)
+
+    assert urls == [url]
+    entry: dict[str, Any] = get_fbref_matches.load_match_manifest(season)[
+        _match_link
+    ]
+    assert entry["fetched_at"] != "2024-08-18"
+    assert not get_fbref_matches.is_match_complete(entry)
+
+
+def test_missing_match_uses_cached_page(
+    season: Season, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Check that a match absent from the manifest is parsed from the cache.
+
+    Parameters
+    ----------
+    season
+        The season of the match.
+    monkeypatch
+        The pytest monkeypatch fixture.
+
+    """
+    url: str = get_fbref_matches.get_match_url(_match_link)
+    cache_helper.cache_response(url, b"<html></html>", None, None)
+    urls: list[str] = _mock_session_get(monkeypatch, b"<html></html>")
+
+    get_fbref_matches.get_matches(season)
+
+    assert not urls
+    assert _match_link in get_fbref_matches.load_match_manifest(season)